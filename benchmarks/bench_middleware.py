@@ -0,0 +1,78 @@
+"""
+bench_middleware:
+
+Compares the stock middleware stack with the path-aware lean stack for token-authenticated API requests
+(`GET user/details/`), with and without a leftover session cookie, on a throwaway test database.
+
+Usage: python benchmarks/bench_middleware.py [number_of_requests]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'join_api.settings')
+
+import django
+
+django.setup()
+
+from django.conf import settings
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import setup_test_environment
+from rest_framework.authtoken.models import Token
+from join_backend.models import CustomUser
+
+STOCK_MIDDLEWARE = [
+    'django.middleware.security.SecurityMiddleware',
+    'join_backend.middleware.ReplicaRoutingMiddleware',
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.middleware.csrf.CsrfViewMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'django.contrib.messages.middleware.MessageMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+
+def bench(label, middleware, count, token, session_cookie):
+    with override_settings(MIDDLEWARE=middleware):
+        client = Client(HTTP_AUTHORIZATION=f'Token {token}')
+        if session_cookie:
+            client.cookies[settings.SESSION_COOKIE_NAME] = session_cookie
+        client.get('/user/details/')
+        best = None
+        for _ in range(3):
+            executed = []
+            with connection.execute_wrapper(lambda execute, *args: executed.append(1) or execute(*args)):
+                started = time.perf_counter()
+                for _ in range(count):
+                    client.get('/user/details/')
+                elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+            queries = len(executed) / count
+    print(f'{label:<36} {best / count * 1e6:10.1f} us/request {queries:6.1f} queries/request')
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+    user = CustomUser.objects.create_user(email='bench@example.com', name='Bench User', password='bench')
+    token = Token.objects.create(user=user).key
+    login = Client()
+    login.force_login(user)
+    session_cookie = login.cookies[settings.SESSION_COOKIE_NAME].value
+    print(f'{count} token-authenticated requests, best of 3 runs')
+
+    for cookie_label, cookie in (('', None), (' + session cookie', session_cookie)):
+        stock = bench('stock stack' + cookie_label, STOCK_MIDDLEWARE, count, token, cookie)
+        lean = bench('lean stack' + cookie_label, settings.MIDDLEWARE, count, token, cookie)
+        print(f'{"saving":<36} {(stock - lean) / count * 1e6:10.1f} us/request ({(1 - lean / stock) * 100:.0f} %)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+bench_renderers:
+
+Compares DRF's stock JSONRenderer/JSONParser with the project's orjson (and optional msgpack) codecs
+on a 1,000-task board shaped like TaskSerializer output.
+
+Usage: python benchmarks/bench_renderers.py [number_of_tasks]
+"""
+import datetime
+import io
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'join_api.settings')
+
+import django
+
+django.setup()
+
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from join_backend.parsers import MessagePackParser, ORJSONParser
+from join_backend.renderers import MessagePackRenderer, ORJSONRenderer, msgpack
+
+
+def build_board(count):
+    statuses = ['todo', 'inProgress', 'awaitFeedback', 'done']
+    priorities = ['Low', 'Medium', 'Urgent']
+    creator = {'id': 1, 'name': 'Test User', 'email': 'testuser@example.com'}
+    return [
+        {
+            'id': i,
+            'title': f'Task {i}',
+            'description': 'Lorem ipsum dolor sit amet, consectetur adipiscing elit.',
+            'priority': priorities[i % 3],
+            'due_date': (datetime.date(2024, 1, 1) + datetime.timedelta(days=i % 365)).isoformat(),
+            'category': i % 5 + 1,
+            'assigned_to': [1, 2, 3][: i % 3 + 1],
+            'creator': creator,
+            'subtasks': [{'id': i * 10 + j, 'text': f'Subtask {j}', 'completed': j % 2 == 0} for j in range(3)],
+            'status': statuses[i % 4],
+        }
+        for i in range(count)
+    ]
+
+
+def bench(label, func, number):
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f'{label:<28} {seconds * 1000:8.3f} ms')
+    return seconds
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    board = build_board(count)
+    number = 50
+    print(f'{count} tasks, best of 5 x {number} runs')
+
+    drf_json = JSONRenderer().render(board)
+    fast_json = ORJSONRenderer().render(board)
+    assert drf_json == fast_json
+
+    drf = bench('render DRF JSONRenderer', lambda: JSONRenderer().render(board), number)
+    fast = bench('render ORJSONRenderer', lambda: ORJSONRenderer().render(board), number)
+    print(f'{"render speedup":<28} {drf / fast:8.1f} x')
+
+    drf = bench('parse DRF JSONParser', lambda: JSONParser().parse(io.BytesIO(drf_json)), number)
+    fast = bench('parse ORJSONParser', lambda: ORJSONParser().parse(io.BytesIO(fast_json)), number)
+    print(f'{"parse speedup":<28} {drf / fast:8.1f} x')
+
+    if msgpack is not None:
+        packed = MessagePackRenderer().render(board)
+        bench('render MessagePackRenderer', lambda: MessagePackRenderer().render(board), number)
+        bench('parse MessagePackParser', lambda: MessagePackParser().parse(io.BytesIO(packed)), number)
+        print(f'{"payload json / msgpack":<28} {len(fast_json):8d} / {len(packed)} bytes')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+"""
+bench_startup:
+
+Compares the development and production settings profiles (DJANGO_PROFILE) of a fresh worker process:
+the time to boot Django and import the URLconf with all views, and the resident memory after serving
+`GET tasks/` requests and after a long run of ORM queries outside the request cycle (as the management commands do),
+where the development profile's query log keeps growing.
+
+Usage: python benchmarks/bench_startup.py [number_of_requests] [number_of_queries]
+"""
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def rss_mb():
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+
+
+def worker(requests, queries):
+    started = time.perf_counter()
+    sys.path.insert(0, ROOT)
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'join_api.settings')
+    import django
+
+    django.setup()
+    from django.urls import get_resolver
+
+    get_resolver().url_patterns
+    boot = time.perf_counter() - started
+    booted_rss = rss_mb()
+
+    from django.db import connection
+    from django.test import Client
+    from django.test.utils import setup_test_environment
+    from rest_framework.authtoken.models import Token
+    from join_backend.models import CustomUser, Task
+
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+    user = CustomUser.objects.create_user(email='bench@example.com', name='Bench User', password='bench')
+    Task.objects.bulk_create(Task(title=f'Task {i}', priority='Low', creator=user) for i in range(50))
+    client = Client(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=user).key}')
+
+    for _ in range(requests):
+        client.get('/tasks/')
+    served_rss = rss_mb()
+    for i in range(queries):
+        Task.objects.filter(pk=i % 50 + 1).exists()
+    batch_rss = rss_mb()
+
+    print(json.dumps({
+        'boot': boot, 'booted_rss': booted_rss, 'served_rss': served_rss, 'batch_rss': batch_rss,
+        'query_log': len(connection.queries_log),
+    }))
+
+
+def run(profile, requests, queries):
+    env = {**os.environ, 'DJANGO_PROFILE': profile}
+    output = subprocess.run(
+        [sys.executable, __file__, '--worker', str(requests), str(queries)],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    queries = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    print(f'fresh worker per profile, best of 3 boots; {requests} requests, then {queries} queries outside requests')
+    print(f'{"profile":<12} {"boot ms":>9} {"boot MB":>9} {"served MB":>10} {"batch MB":>9} {"logged queries":>15}')
+    for profile in ('development', 'production'):
+        runs = [run(profile, requests, queries) for _ in range(3)]
+        result = min(runs, key=lambda result: result['boot'])
+        print(
+            f'{profile:<12} {result["boot"] * 1000:9.1f} {result["booted_rss"]:9.1f} {result["served_rss"]:10.1f}'
+            f' {result["batch_rss"]:9.1f} {result["query_log"]:15d}'
+        )
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--worker']:
+        worker(int(sys.argv[2]), int(sys.argv[3]))
+    else:
+        main()
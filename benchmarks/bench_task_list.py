@@ -0,0 +1,68 @@
+"""
+bench_task_list:
+
+Compares TaskSerializer(many=True) with the serialize_task_list fast path used by `GET tasks/`
+on a throwaway test database.
+
+Usage: python benchmarks/bench_task_list.py [number_of_tasks]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'join_api.settings')
+
+import django
+
+django.setup()
+
+from django.db import connection
+from django.test.utils import setup_test_environment
+from join_backend.models import Category, Contact, CustomUser, Subtask, Task
+from join_backend.serializers import TaskSerializer, serialize_task_list
+
+
+def populate(count):
+    user = CustomUser.objects.create_user(email='bench@example.com', name='Bench User', password='bench')
+    category = Category.objects.create(name='Bench', color='#FF7A00')
+    contacts = Contact.objects.bulk_create(
+        Contact(user=user, name=f'Contact {i}', email=f'c{i}@example.com', phone='123') for i in range(10)
+    )
+    tasks = Task.objects.bulk_create(
+        Task(title=f'Task {i}', description='Lorem ipsum', priority='Medium', creator=user, category=category)
+        for i in range(count)
+    )
+    Subtask.objects.bulk_create(Subtask(task=tasks[i // 2], text=f'Subtask {i}') for i in range(count * 2))
+    Task.assigned_to.through.objects.bulk_create(
+        Task.assigned_to.through(task_id=task.id, contact_id=contacts[i % 10].id) for i, task in enumerate(tasks)
+    )
+    return user
+
+
+def bench(label, func):
+    best = None
+    for _ in range(3):
+        started = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f'{label:<28} {best * 1000:10.1f} ms')
+    return best
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    setup_test_environment()
+    connection.creation.create_test_db(verbosity=0)
+    user = populate(count)
+    tasks = Task.objects.filter(creator=user).order_by('id')
+    print(f'{count} tasks, best of 3 runs')
+
+    slow = bench('TaskSerializer(many=True)', lambda: TaskSerializer(tasks.prefetch_related('assigned_to', 'subtasks').select_related('creator'), many=True).data)
+    fast = bench('serialize_task_list', lambda: serialize_task_list(tasks))
+    print(f'{"speedup":<28} {slow / fast:10.1f} x')
+
+
+if __name__ == '__main__':
+    main()
@@ -12,8 +12,12 @@ https://docs.djangoproject.com/en/4.0/ref/settings/
 
 from pathlib import Path
 
+import importlib.util
 import os
 
+from corsheaders.defaults import default_headers
+from django.core.exceptions import ImproperlyConfigured
+
 SECRET_KEY = os.getenv('SECRET_KEY') 
 
 
@@ -31,8 +35,18 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 
 
 
+# Settings profile, selected with DJANGO_PROFILE. 'production' turns off DEBUG (and with it the query log every
+# database connection keeps), the debug toolbar, the browsable API and debug-level request logging.
+PROFILE = os.getenv('DJANGO_PROFILE', 'development')
+if PROFILE not in ('development', 'production'):
+    raise ImproperlyConfigured(f"DJANGO_PROFILE must be 'development' or 'production', not {PROFILE!r}")
+PRODUCTION = PROFILE == 'production'
+
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = True
+DEBUG = not PRODUCTION
+
+# The debug toolbar is optional and only mounted in the development profile.
+DEBUG_TOOLBAR = DEBUG and importlib.util.find_spec('debug_toolbar') is not None
 
 
 ALLOWED_HOSTS = os.getenv('ALLOWED_HOSTS', '').split(',')
@@ -58,17 +72,22 @@ INSTALLED_APPS = [
     'corsheaders',
 ]
 
+# Session, CSRF, auth and message processing only runs for SESSION_PATHS and session-cookie requests;
+# token-authenticated API requests skip it (see join_backend.middleware.uses_session).
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',  
+    'join_backend.middleware.ReplicaRoutingMiddleware',
+    'join_backend.middleware.LeanSessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.common.CommonMiddleware',
-    'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
-    'django.contrib.messages.middleware.MessageMiddleware',
+    'join_backend.middleware.LeanCsrfViewMiddleware',
+    'join_backend.middleware.LeanAuthenticationMiddleware',
+    'join_backend.middleware.LeanMessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+SESSION_PATHS = ['/admin/', '/set-csrf/']  # Browser views that always get the full session stack
+
 ROOT_URLCONF = 'join_api.urls'
 
 TEMPLATES = [
@@ -100,6 +119,39 @@ DATABASES = {
     }
 }
 
+# Read replicas: a comma-separated list of replica database files, e.g. DATABASE_REPLICA_NAMES=replica1.sqlite3,replica2.sqlite3.
+# Safe-method API reads are spread over them by join_backend.routers; writes always go to 'default'.
+DATABASE_REPLICAS = []
+for index, name in enumerate(filter(None, os.getenv('DATABASE_REPLICA_NAMES', '').split(','))):
+    DATABASES[f'replica_{index}'] = {**DATABASES['default'], 'NAME': name.strip()}
+    DATABASE_REPLICAS.append(f'replica_{index}')
+
+DATABASE_ROUTERS = ['join_backend.routers.PrimaryReplicaRouter']
+
+REPLICA_PIN_SECONDS = 5  # Read from the primary for this long after a write
+REPLICA_MAX_LAG_SECONDS = 2  # Skip replicas lagging further behind than this
+REPLICA_LAG_CHECK_INTERVAL = 1  # Seconds a replica lag check is cached per process
+REPLICA_HEARTBEAT_INTERVAL = 1  # Minimum seconds between heartbeat writes per process
+REPLICA_EXCLUDED_PATHS = ['/admin/']
+
+# The cache holds the Authorization-keyed read-your-writes pin of ReplicaRoutingMiddleware, which every worker process
+# serving a client has to see. Django's default in-memory cache is private to each process, so deployments running
+# several workers with read replicas set REDIS_URL (e.g. redis://127.0.0.1:6379/1; requires the redis package).
+REDIS_URL = os.getenv('REDIS_URL')
+if REDIS_URL:
+    CACHES = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': REDIS_URL}}
+
+TASK_ARCHIVE_AFTER_DAYS = int(os.getenv('TASK_ARCHIVE_AFTER_DAYS', 30))  # Done tasks older than this leave the board
+
+# Delivery of the send_deadline_digests command; any class with a send(digests) method can replace it.
+DIGEST_BACKEND = os.getenv('DIGEST_BACKEND', 'join_backend.digests.EmailDigestBackend')
+DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'noreply@join.local')
+
+# Idempotency-Key handling of the create endpoints (see join_backend.idempotency).
+IDEMPOTENCY_KEY_TTL = 24 * 60 * 60  # Seconds a response is replayed for retries with the same key
+IDEMPOTENCY_LOCK_TIMEOUT = 30  # Seconds an in-flight request holds its key
+IDEMPOTENCY_WAIT_SECONDS = 10  # Seconds a concurrent duplicate waits for the in-flight response
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.0/ref/settings/#auth-password-validators
@@ -158,9 +210,23 @@ REST_FRAMEWORK = {
     ],
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
-    ]
+    ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'join_backend.renderers.ORJSONRenderer',
+        *([] if PRODUCTION else ['rest_framework.renderers.BrowsableAPIRenderer']),
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'join_backend.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
 }
 
+# MessagePack is an optional wire format, offered only when the msgpack package is installed.
+if importlib.util.find_spec('msgpack') is not None:
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'].append('join_backend.renderers.MessagePackRenderer')
+    REST_FRAMEWORK['DEFAULT_PARSER_CLASSES'].append('join_backend.parsers.MessagePackParser')
+
 CORS_ALLOW_ALL_ORIGINS = True
 
 
@@ -175,6 +241,10 @@ AUTH_USER_MODEL = 'join_backend.CustomUser'
 
 CORS_ALLOW_CREDENTIALS = True
 
+# Request and response headers of versioned updates (If-Match/ETag) and idempotent creates.
+CORS_ALLOW_HEADERS = (*default_headers, 'idempotency-key', 'if-match')
+CORS_EXPOSE_HEADERS = ['ETag', 'Idempotent-Replayed']
+
 CSRF_COOKIE_HTTPONLY = False
 
 AUTHENTICATION_BACKENDS = [
@@ -194,11 +264,11 @@ LOGGING = {
     'loggers': {
         'django.security.csrf': {
             'handlers': ['console'],
-            'level': 'DEBUG',
+            'level': 'WARNING' if PRODUCTION else 'DEBUG',
         },
         'django.request': {
             'handlers': ['console'],
-            'level': 'DEBUG',
+            'level': 'WARNING' if PRODUCTION else 'DEBUG',
         },
     },
 }
\ No newline at end of file
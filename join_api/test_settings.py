@@ -0,0 +1,10 @@
+"""
+Settings for the test suite: `python manage.py test --settings=join_api.test_settings`.
+
+Adds a second database standing in for a read replica (see tests/test_routers.py); the test runner gives it its own
+in-memory test database.
+"""
+from .settings import *  # noqa: F401,F403
+from .settings import DATABASES
+
+DATABASES['replica_test'] = {**DATABASES['default']}
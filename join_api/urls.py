@@ -1,17 +1,11 @@
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
+from django.contrib.staticfiles.urls import staticfiles_urlpatterns
 from django.urls import path
-from join_api import settings
 from join_backend.views import set_csrf_token
 from join_backend.views import LoginView
-from join_backend.views import UserRegistrationView, UserDetailsView, ContactListCreateView, ContactDetailView, CategoryListCreateAPIView, CategoryDetailAPIView, SubtaskListCreateAPIView, SubtaskDetailAPIView, TaskListCreateAPIView, TaskDetailAPIView
-from django.conf.urls.static import static
-from django.contrib import admin
-from django.urls import include, path
-from django.conf.urls.static import static
-from django.contrib.staticfiles.urls import staticfiles_urlpatterns
-from django.conf import settings
-from django.conf.urls.static import static
-from debug_toolbar.toolbar import debug_toolbar_urls
+from join_backend.views import UserRegistrationView, UserDetailsView, ContactListCreateView, ContactGroupsAPIView, ContactDetailView, CategoryListCreateAPIView, CategoryDetailAPIView, SubtaskListCreateAPIView, SubtaskDetailAPIView, TaskListCreateAPIView, TaskDetailAPIView, TaskBulkAPIView, TaskMoveAPIView, TaskArchiveAPIView, TaskCalendarAPIView, TaskBoardAPIView, BootstrapAPIView, BatchAPIView
 
 
 """
@@ -53,6 +47,30 @@ from debug_toolbar.toolbar import debug_toolbar_urls
 """
 'tasks/<int:pk>/' - Retrieves or modifies a specific task.
 """
+"""
+'tasks/bulk/' - Applies one status, priority, category, assignee or delete operation to many tasks.
+"""
+"""
+'tasks/<int:pk>/move/' - Moves a task between two neighbouring cards, optionally into another column.
+"""
+"""
+'tasks/archive/' - Lists archived tasks, paginated.
+"""
+"""
+'tasks/calendar/' - Returns per-day counts and ids of the tasks due in a month.
+"""
+"""
+'tasks/board/' - Returns the first cards of every status column with totals and continuation cursors.
+"""
+"""
+'contacts/groups/' - Returns the letter groups of the user's contacts with their sizes.
+"""
+"""
+'bootstrap/' - Returns the user, tasks, contacts and categories in one response.
+"""
+"""
+'batch/' - Executes an ordered list of API calls in one request.
+"""
 
 urlpatterns = [
     
@@ -69,6 +87,17 @@ urlpatterns = [
     path('subtasks/<int:pk>/', SubtaskDetailAPIView.as_view(), name='subtask-detail'),
     path('tasks/', TaskListCreateAPIView.as_view(), name='task-list'),
     path('tasks/<int:pk>/', TaskDetailAPIView.as_view(), name='task-detail'),
+    path('tasks/bulk/', TaskBulkAPIView.as_view(), name='task-bulk'),
+    path('tasks/<int:pk>/move/', TaskMoveAPIView.as_view(), name='task-move'),
+    path('tasks/archive/', TaskArchiveAPIView.as_view(), name='task-archive'),
+    path('tasks/calendar/', TaskCalendarAPIView.as_view(), name='task-calendar'),
+    path('tasks/board/', TaskBoardAPIView.as_view(), name='task-board'),
+    path('contacts/groups/', ContactGroupsAPIView.as_view(), name='contact-groups'),
+    path('bootstrap/', BootstrapAPIView.as_view(), name='bootstrap'),
+    path('batch/', BatchAPIView.as_view(), name='batch'),
 ]+ staticfiles_urlpatterns()
-urlpatterns +=  debug_toolbar_urls()
+if settings.DEBUG_TOOLBAR:
+    from debug_toolbar.toolbar import debug_toolbar_urls
+
+    urlpatterns += debug_toolbar_urls()
 urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -97,6 +97,7 @@ search, and order tasks by priority, due date, and other key attributes.
     list_display = ('title', 'priority', 'due_date', 'category', 'creator', 'status')
     list_filter = ('priority', 'due_date', 'category', 'creator', 'status')
     search_fields = ('title', 'description', 'creator__name', 'status')
+    inlines = [SubtaskInline]
 
 admin.site.register(Task, TaskAdmin)
 
@@ -109,9 +110,10 @@ SubtaskAdmin:
 Configures the display and filtering options for Subtasks in the admin interface, 
 allowing for efficient management of subtask completion status and details.
 """
-    list_display = ['text', 'completed', 'id']  # Adjust fields to display as needed
+    list_display = ['text', 'completed', 'task', 'id']  # Adjust fields to display as needed
     list_filter = ['completed']  # Filter options
     search_fields = ['text']  # Search functionality based on text field
+    raw_id_fields = ('task',)  # Use a lookup widget for task field
 
 admin.site.register(Subtask, SubtaskAdmin)
 
@@ -0,0 +1,46 @@
+"""
+archive:
+
+Archiving of completed tasks. Done tasks whose `completed_at` is older than `TASK_ARCHIVE_AFTER_DAYS` are flagged
+`archived`, which drops them from the board (`tasks/`, `bootstrap/`) and from the board's partial index while keeping
+them available through the paginated `tasks/archive/` endpoint. Moving an archived task out of 'done' restores it.
+"""
+import time
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def archive_cutoff(days=None):
+    if days is None:
+        days = settings.TASK_ARCHIVE_AFTER_DAYS
+    return timezone.now() - timedelta(days=days)
+
+
+def archive_done_tasks(days=None, batch_size=500, pause=0, max_batches=None, dry_run=False):
+    """
+    Archives done tasks completed more than `days` days ago in primary-key batches of `batch_size`,
+    sleeping `pause` seconds between full batches and stopping after `max_batches` batches if given.
+    Returns the number of tasks archived (or found, for a dry run).
+    """
+    from .models import Task
+
+    candidates = Task.objects.active().filter(status='done', completed_at__lt=archive_cutoff(days))
+    if dry_run:
+        return candidates.count()
+
+    archived = 0
+    batches = 0
+    last_id = 0
+    while max_batches is None or batches < max_batches:
+        ids = list(candidates.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            break
+        # The status is re-checked in the UPDATE in case a task was reopened since it was selected.
+        archived += Task.objects.filter(pk__in=ids, status='done', archived=False).update(archived=True)
+        last_id = ids[-1]
+        batches += 1
+        if pause and len(ids) == batch_size:
+            time.sleep(pause)
+    return archived
@@ -0,0 +1,41 @@
+"""
+counters:
+
+Maintenance of the denormalized `Task.subtasks_total` / `Task.subtasks_done` counters, which let board cards show
+subtask progress without loading subtasks. Every code path that creates, toggles or deletes subtasks adjusts them with
+F-expressions in a single UPDATE, so concurrent writers never overwrite each other's changes.
+`recompute_subtask_counters` rebuilds them from the subtask table and backs the repair_subtask_counters command.
+"""
+from django.db.models import Count, F, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def adjust_subtask_counters(task_id, total=0, done=0):
+    """
+    Atomically adds `total` and `done` (which may be negative) to the counters of one task.
+    """
+    from .models import Task
+
+    if task_id is None or (total == 0 and done == 0):
+        return
+    Task.objects.filter(pk=task_id).update(
+        subtasks_total=F('subtasks_total') + total,
+        subtasks_done=F('subtasks_done') + done,
+    )
+
+
+def recompute_subtask_counters(queryset):
+    """
+    Recomputes the counters of every task in `queryset` from the subtask table with one UPDATE.
+    Returns the number of tasks updated.
+    """
+    from .models import Subtask
+
+    counts = (
+        Subtask.objects.filter(task=OuterRef('pk')).order_by().values('task')
+        .annotate(total=Count('id'), done=Count('id', filter=Q(completed=True)))
+    )
+    return queryset.update(
+        subtasks_total=Coalesce(Subquery(counts.values('total')), Value(0)),
+        subtasks_done=Coalesce(Subquery(counts.values('done')), Value(0)),
+    )
@@ -0,0 +1,116 @@
+"""
+digests:
+
+Daily deadline digests. `build_digests` streams the assignments of every open task that is overdue or due today or
+tomorrow in one query over the due-date range, ordered by contact, and yields one digest per contact as soon as the
+contact's rows are complete, so a run holds a single digest in memory however many tasks there are.
+
+Digests are handed in batches to the backend named by `DIGEST_BACKEND`. `EmailDigestBackend` sends one email per
+contact through Django's email backend (locmem in tests); other channels only need a class with a `send(digests)` method.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.utils.module_loading import import_string
+
+BUCKETS = ('overdue', 'due_today', 'due_tomorrow')
+
+
+def build_digests(today, overdue_days=30, chunk_size=2000):
+    """
+    Yields `{'contact': {...}, 'overdue': [...], 'due_today': [...], 'due_tomorrow': [...]}` per contact with open
+    tasks due between `overdue_days` days before `today` and tomorrow, each bucket ordered by due date.
+    """
+    from .models import Task
+
+    Assignment = Task.assigned_to.through
+    tomorrow = today + timedelta(days=1)
+    rows = (
+        Assignment.objects
+        .filter(
+            task__due_date__gte=today - timedelta(days=overdue_days),
+            task__due_date__lte=tomorrow,
+            task__archived=False,
+        )
+        .exclude(task__status='done')
+        .order_by('contact_id', 'task__due_date', 'task_id')
+        .values_list('contact_id', 'contact__name', 'contact__email',
+                     'task_id', 'task__title', 'task__due_date', 'task__priority')
+        .iterator(chunk_size=chunk_size)
+    )
+
+    digest = None
+    for contact_id, name, email, task_id, title, due_date, priority in rows:
+        if digest is None or digest['contact']['id'] != contact_id:
+            if digest is not None:
+                yield digest
+            digest = {'contact': {'id': contact_id, 'name': name, 'email': email}, **{bucket: [] for bucket in BUCKETS}}
+        if due_date < today:
+            bucket = 'overdue'
+        elif due_date == today:
+            bucket = 'due_today'
+        else:
+            bucket = 'due_tomorrow'
+        digest[bucket].append({'id': task_id, 'title': title, 'due_date': due_date, 'priority': priority})
+    if digest is not None:
+        yield digest
+
+
+def get_digest_backend():
+    return import_string(settings.DIGEST_BACKEND)()
+
+
+def send_digests(today, backend=None, overdue_days=30, batch_size=100):
+    """
+    Builds the digests for `today` and hands them to `backend` (default `DIGEST_BACKEND`) `batch_size` at a time.
+    Returns the number of digests sent.
+    """
+    backend = backend or get_digest_backend()
+    sent = 0
+    batch = []
+    for digest in build_digests(today, overdue_days=overdue_days):
+        batch.append(digest)
+        if len(batch) >= batch_size:
+            sent += backend.send(batch)
+            batch = []
+    if batch:
+        sent += backend.send(batch)
+    return sent
+
+
+
+
+class EmailDigestBackend:
+    """
+EmailDigestBackend:
+
+Delivers each digest as a plain-text email to the contact, sending a whole batch over one email connection.
+"""
+    TITLES = {
+        'overdue': 'Overdue',
+        'due_today': 'Due today',
+        'due_tomorrow': 'Due tomorrow',
+    }
+
+    def send(self, digests):
+        messages = [
+            EmailMessage(self.subject(digest), self.body(digest), settings.DEFAULT_FROM_EMAIL, [digest['contact']['email']])
+            for digest in digests
+        ]
+        return get_connection().send_messages(messages) or 0
+
+    def subject(self, digest):
+        counts = [f"{len(digest[bucket])} {self.TITLES[bucket].lower()}" for bucket in BUCKETS if digest[bucket]]
+        return 'Join deadlines: ' + ', '.join(counts)
+
+    def body(self, digest):
+        lines = [f"Hello {digest['contact']['name']},", '']
+        for bucket in BUCKETS:
+            if digest[bucket]:
+                lines.append(f'{self.TITLES[bucket]}:')
+                lines.extend(
+                    f"- {task['title']} ({task['priority']}, due {task['due_date'].isoformat()})" for task in digest[bucket]
+                )
+                lines.append('')
+        return '\n'.join(lines)
@@ -0,0 +1,112 @@
+"""
+fields:
+
+Compact column types that present string values in Python and the API.
+
+`EnumField` stores one of a fixed set of strings as a small-integer code, and `ColorField` stores a `#RRGGBB` hex color
+as an integer. Values are translated in `get_prep_value` / `from_db_value`, so model code, queryset filters, forms
+and serializers keep using 'todo' or '#FF7A00' while rows and indexes hold 2- or 4-byte integers.
+
+Status strings round-trip unchanged. Colors do not keep their spelling: they are normalized to upper-case `#RRGGBB`,
+so '#ff7a00' is read back as '#FF7A00'.
+"""
+import re
+
+from django import forms
+from django.core import validators
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.utils.functional import Promise, cached_property
+
+HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
+
+
+
+
+class EnumField(models.PositiveSmallIntegerField):
+    """
+EnumField:
+
+A small-integer column for a string choice. `codes` maps every allowed string to its stored code; codes must never be
+reused, so a value can be retired but its code not reassigned. Ordering by the field orders by code, which lets the
+codes define a meaningful sort order (e.g. Low < Medium < Urgent).
+"""
+    def __init__(self, *args, codes=None, **kwargs):
+        self.codes = dict(codes or {})
+        self.values_by_code = {code: value for value, code in self.codes.items()}
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        kwargs['codes'] = self.codes
+        return name, path, args, kwargs
+
+    @cached_property
+    def validators(self):
+        # The integer range validators do not apply to the string values seen outside the database.
+        return list(self._validators)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return self.values_by_code.get(value, value)
+
+    def to_python(self, value):
+        if value is None or value in self.codes:
+            return value
+        if isinstance(value, int) and value in self.values_by_code:
+            return self.values_by_code[value]
+        raise ValidationError(
+            self.error_messages['invalid_choice'], code='invalid_choice', params={'value': value},
+        )
+
+    def get_prep_value(self, value):
+        if isinstance(value, Promise):
+            value = value._proxy____cast()
+        if value is None or isinstance(value, int):
+            return value
+        try:
+            return self.codes[value]
+        except KeyError:
+            raise ValueError(f"Field '{self.name}' expected one of {list(self.codes)} but got {value!r}.") from None
+
+
+
+
+class ColorField(models.PositiveIntegerField):
+    """
+ColorField:
+
+An integer column for a `#RRGGBB` hex color. Colors are read back as upper-case `#RRGGBB` strings.
+"""
+    default_validators = [validators.RegexValidator(HEX_COLOR_RE, 'Enter a color as #RRGGBB.')]
+
+    @cached_property
+    def validators(self):
+        return [*self.default_validators, *self._validators]
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        return f'#{value:06X}'
+
+    def to_python(self, value):
+        if value is None:
+            return value
+        if isinstance(value, int):
+            return f'#{value:06X}'
+        if not HEX_COLOR_RE.match(str(value)):
+            raise ValidationError('Enter a color as #RRGGBB.', code='invalid', params={'value': value})
+        return str(value).upper()
+
+    def get_prep_value(self, value):
+        if isinstance(value, Promise):
+            value = value._proxy____cast()
+        if value is None or isinstance(value, int):
+            return value
+        if not HEX_COLOR_RE.match(value):
+            raise ValueError(f"Field '{self.name}' expected a #RRGGBB color but got {value!r}.")
+        return int(value[1:], 16)
+
+    def formfield(self, **kwargs):
+        return models.Field.formfield(self, **{'form_class': forms.CharField, 'max_length': 7, **kwargs})
@@ -0,0 +1,140 @@
+"""
+idempotency:
+
+`Idempotency-Key` support for create endpoints, so clients on flaky networks can retry a POST without creating duplicates.
+
+The first request with a key runs normally; its status and body are stored in the `IdempotencyKey` table together with
+a hash of the request, keyed by user, method, path and key, so every worker process sees them. Retries with the same key
+and request are answered from the stored response (marked with `Idempotent-Replayed: true`) without writing;
+reusing a key for a different request is a 422. Stored responses are replayed for `IDEMPOTENCY_KEY_TTL` seconds.
+
+A request claims its key by inserting the row before it runs; the unique `(user, key)` constraint lets only one
+request claim it. Duplicates arriving while the first request is still running wait up to `IDEMPOTENCY_WAIT_SECONDS`
+for its response instead of writing, after which they get a 409. Server errors are not stored, so they can be retried,
+and a claim older than `IDEMPOTENCY_LOCK_TIMEOUT` (e.g. left by a crashed worker) may be taken over.
+The claim and the response are written in the caller's transaction, so a response rolled back with an enclosing
+transaction (e.g. an atomic batch) is never replayed. The claim is only released by that transaction's commit or
+rollback, so a duplicate cannot run the request again while the first one's writes are still uncommitted.
+"""
+import hashlib
+import json
+import time
+from datetime import timedelta
+from functools import wraps
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.response import Response
+
+from .models import IdempotencyKey
+
+HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+POLL_INTERVAL = 0.05
+
+
+def key_digest(request, key):
+    return hashlib.sha256(f'{request.method}:{request.path}:{key}'.encode()).hexdigest()
+
+
+def request_fingerprint(request):
+    body = json.dumps(request.data, sort_keys=True, default=str)
+    return hashlib.sha256(body.encode()).hexdigest()
+
+
+def is_stale(record):
+    """
+    Returns whether `record` no longer counts: a response older than `IDEMPOTENCY_KEY_TTL`,
+    or a claim older than `IDEMPOTENCY_LOCK_TIMEOUT` whose request never finished.
+    """
+    timeout = settings.IDEMPOTENCY_LOCK_TIMEOUT if record.status is None else settings.IDEMPOTENCY_KEY_TTL
+    return record.created_at < timezone.now() - timedelta(seconds=timeout)
+
+
+def replay(record, fingerprint):
+    if record.fingerprint != fingerprint:
+        return Response(
+            {'message': f'The {HEADER} was already used for a different request'},
+            status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        )
+    return Response(record.data, status=record.status, headers={'Idempotent-Replayed': 'true'})
+
+
+def wait_for_response(records, fingerprint):
+    deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+    while time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        record = records.filter(status__isnull=False).first()
+        if record is not None:
+            return replay(record, fingerprint)
+    return Response(
+        {'message': f'A request with this {HEADER} is still being processed'}, status=status.HTTP_409_CONFLICT
+    )
+
+
+def claim(user, key, fingerprint):
+    """
+    Inserts the in-flight row for `key`, or returns None when another request holds it.
+    """
+    try:
+        # A savepoint, so a lost race does not break an enclosing transaction.
+        with transaction.atomic():
+            return IdempotencyKey.objects.create(user=user, key=key, fingerprint=fingerprint)
+    except IntegrityError:
+        return None
+
+
+def purge_expired_keys():
+    """
+    Deletes the keys older than `IDEMPOTENCY_KEY_TTL`, whose responses are no longer replayed. Returns the number deleted.
+    """
+    cutoff = timezone.now() - timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+    deleted, _ = IdempotencyKey.objects.filter(created_at__lt=cutoff).delete()
+    return deleted
+
+
+def idempotent(method):
+    """
+    Decorates an APIView handler (e.g. `post`) with `Idempotency-Key` support; requests without the header are unaffected.
+    """
+    @wraps(method)
+    def wrapper(view, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if key is None:
+            return method(view, request, *args, **kwargs)
+        if not key or len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {'message': f'The {HEADER} must be 1 to {MAX_KEY_LENGTH} characters long'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        key = key_digest(request, key)
+        fingerprint = request_fingerprint(request)
+        records = IdempotencyKey.objects.filter(user=request.user, key=key)
+        record = records.first()
+        if record is not None:
+            if not is_stale(record):
+                if record.status is None:
+                    return wait_for_response(records, fingerprint)
+                return replay(record, fingerprint)
+            records.filter(pk=record.pk).delete()
+
+        record = claim(request.user, key, fingerprint)
+        if record is None:
+            return wait_for_response(records, fingerprint)
+        # Filtering by primary key leaves a claim alone that a duplicate took over after this one went stale.
+        own_record = IdempotencyKey.objects.filter(pk=record.pk)
+        try:
+            with transaction.atomic():
+                response = method(view, request, *args, **kwargs)
+        except Exception:
+            own_record.delete()
+            raise
+        if response.status_code < 500:
+            own_record.update(status=response.status_code, data=response.data)
+        else:
+            own_record.delete()
+        return response
+    return wrapper
@@ -0,0 +1,78 @@
+"""
+includes:
+
+Compound-document side-loading for list endpoints (`?include=users,contacts,categories`).
+
+Related objects of the requested types are moved into a top-level `included` map keyed by id and referenced by id
+from the listed objects, so a user shared by a thousand tasks is sent once instead of a thousand times.
+Types that are not requested keep their usual nested representation.
+"""
+from rest_framework.exceptions import ValidationError
+
+from .models import Category, Contact
+from .serializers import ContactSerializer
+
+
+def parse_include(request, allowed):
+    """
+    Returns the set of requested include types, or None when the `include` parameter is absent.
+    Raises a ValidationError (400) for types the endpoint does not support.
+    """
+    raw = request.query_params.get('include')
+    if raw is None:
+        return None
+    include = {part.strip() for part in raw.split(',') if part.strip()}
+    unknown = include - set(allowed)
+    if unknown:
+        raise ValidationError({'include': [
+            f"Unknown include {', '.join(sorted(unknown))}. Allowed: {', '.join(allowed)}."
+        ]})
+    return include
+
+
+def _extract_user(obj, key, users):
+    user = obj[key]
+    if users is not None and user is not None:
+        users[user['id']] = user
+        obj[key] = user['id']
+
+
+def compound_task_list(tasks, include, user):
+    """
+    Turns the output of `serialize_task_list` into `{'data': tasks, 'included': {...}}`.
+    Creators are already joined into the task rows, so including users costs no extra query;
+    contacts and categories cost one query each. Only `user`'s own contacts are included.
+    """
+    included = {name: {} for name in include}
+    users = included.get('users')
+    for task in tasks:
+        _extract_user(task, 'creator', users)
+
+    if 'contacts' in include:
+        contact_ids = {contact_id for task in tasks for contact_id in task['assigned_to']}
+        contacts = ContactSerializer(
+            Contact.objects.filter(id__in=contact_ids, user=user).select_related('user').order_by('id'), many=True
+        ).data
+        for contact in contacts:
+            _extract_user(contact, 'user', users)
+            included['contacts'][contact['id']] = contact
+
+    if 'categories' in include:
+        category_ids = {task['category'] for task in tasks if task['category'] is not None}
+        included['categories'] = {
+            category['id']: category
+            for category in Category.objects.filter(id__in=category_ids).order_by('id').values('id', 'name', 'color')
+        }
+
+    return {'data': tasks, 'included': included}
+
+
+def compound_contact_list(contacts, include):
+    """
+    Turns serialized contacts into `{'data': contacts, 'included': {...}}`, moving their owners into `included['users']`.
+    """
+    included = {name: {} for name in include}
+    users = included.get('users')
+    for contact in contacts:
+        _extract_user(contact, 'user', users)
+    return {'data': contacts, 'included': included}
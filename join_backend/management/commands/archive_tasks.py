@@ -0,0 +1,40 @@
+from django.core.management.base import BaseCommand
+
+from join_backend.archive import archive_done_tasks
+
+
+
+
+class Command(BaseCommand):
+    """
+archive_tasks:
+
+Moves done tasks completed more than `--days` days ago (default `TASK_ARCHIVE_AFTER_DAYS`) into the archive,
+in primary-key batches. `--pause` and `--max-batches` limit the load of a single run; meant to run periodically (e.g. cron).
+"""
+    help = 'Archive tasks that have been done for longer than the archive age.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=float, default=None,
+                            help='Archive tasks completed more than this many days ago.')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Number of tasks archived per UPDATE.')
+        parser.add_argument('--pause', type=float, default=0,
+                            help='Seconds to sleep between batches.')
+        parser.add_argument('--max-batches', type=int, default=None,
+                            help='Stop after this many batches.')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only count the tasks that would be archived.')
+
+    def handle(self, *args, **options):
+        count = archive_done_tasks(
+            days=options['days'],
+            batch_size=options['batch_size'],
+            pause=options['pause'],
+            max_batches=options['max_batches'],
+            dry_run=options['dry_run'],
+        )
+        if options['dry_run']:
+            self.stdout.write(f'Found {count} tasks to archive.')
+        else:
+            self.stdout.write(f'Archived {count} tasks.')
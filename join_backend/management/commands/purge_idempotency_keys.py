@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from join_backend.idempotency import purge_expired_keys
+
+
+
+
+class Command(BaseCommand):
+    """
+purge_idempotency_keys:
+
+Deletes stored `Idempotency-Key` responses older than `IDEMPOTENCY_KEY_TTL`; meant to run periodically (e.g. cron).
+"""
+    help = 'Delete expired Idempotency-Key records.'
+
+    def handle(self, *args, **options):
+        count = purge_expired_keys()
+        self.stdout.write(f'Deleted {count} expired idempotency keys.')
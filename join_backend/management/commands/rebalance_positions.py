@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from join_backend.ordering import REBALANCE_KEY_LENGTH, columns_to_rebalance, rebalance_column
+
+
+
+
+class Command(BaseCommand):
+    """
+rebalance_positions:
+
+Rewrites the position keys of kanban columns whose keys have grown longer than `--max-length`
+because of repeated drops at the same spot. Meant to run periodically from a scheduler (e.g. cron).
+"""
+    help = 'Rebalance task position keys in columns whose keys have grown too long.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--max-length', type=int, default=REBALANCE_KEY_LENGTH,
+                            help='Rebalance columns whose longest key is longer than this.')
+
+    def handle(self, *args, **options):
+        columns = columns_to_rebalance(options['max_length'])
+        rewritten = 0
+        for creator_id, status in columns:
+            rewritten += rebalance_column(creator_id, status)
+        self.stdout.write(f'Rebalanced {len(columns)} columns ({rewritten} tasks).')
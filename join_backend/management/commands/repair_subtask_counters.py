@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand
+
+from join_backend.counters import recompute_subtask_counters
+from join_backend.models import Task
+
+
+
+
+class Command(BaseCommand):
+    """
+repair_subtask_counters:
+
+Recomputes `Task.subtasks_total` and `Task.subtasks_done` from the subtask table in primary-key batches,
+e.g. after subtasks were edited through the admin or the counters drifted for any other reason.
+"""
+    help = 'Recompute the denormalized subtask counters of all tasks.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000,
+                            help='Number of tasks recomputed per UPDATE.')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        last_id = 0
+        updated = 0
+        while True:
+            ids = list(
+                Task.objects.filter(pk__gt=last_id).order_by('pk')
+                .values_list('pk', flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            updated += recompute_subtask_counters(Task.objects.filter(pk__gte=ids[0], pk__lte=ids[-1]))
+            last_id = ids[-1]
+        self.stdout.write(f'Recomputed subtask counters for {updated} tasks.')
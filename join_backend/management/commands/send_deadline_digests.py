@@ -0,0 +1,37 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from join_backend.digests import build_digests, send_digests
+
+
+
+
+class Command(BaseCommand):
+    """
+send_deadline_digests:
+
+Sends every contact a digest of their open tasks that are overdue, due today or due tomorrow,
+through the delivery backend configured in `DIGEST_BACKEND`. Meant to run once a day from a scheduler (e.g. cron).
+"""
+    help = 'Send daily overdue / due-soon task digests to assigned contacts.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--date', type=date.fromisoformat, default=None,
+                            help='Day to compute the digests for (YYYY-MM-DD), defaults to today.')
+        parser.add_argument('--overdue-days', type=int, default=30,
+                            help='Ignore tasks that have been overdue for longer than this many days.')
+        parser.add_argument('--batch-size', type=int, default=100,
+                            help='Number of digests handed to the backend at once.')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only count the digests that would be sent.')
+
+    def handle(self, *args, **options):
+        today = options['date'] or timezone.localdate()
+        if options['dry_run']:
+            count = sum(1 for _ in build_digests(today, overdue_days=options['overdue_days']))
+            self.stdout.write(f'Found {count} digests for {today.isoformat()}.')
+            return
+        count = send_digests(today, overdue_days=options['overdue_days'], batch_size=options['batch_size'])
+        self.stdout.write(f'Sent {count} digests for {today.isoformat()}.')
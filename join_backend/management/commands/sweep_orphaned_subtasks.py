@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from join_backend.orphans import sweep_orphaned_subtasks
+
+
+
+
+class Command(BaseCommand):
+    """
+sweep_orphaned_subtasks:
+
+Deletes subtasks that belong to no task and are older than `--older-than` hours, in primary-key batches.
+`--pause` and `--max-batches` limit the load a single run puts on the database; meant to run periodically (e.g. cron).
+"""
+    help = 'Delete subtasks that do not belong to any task.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--older-than', type=float, default=24,
+                            help='Only delete orphans created more than this many hours ago.')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Number of subtasks deleted per DELETE.')
+        parser.add_argument('--pause', type=float, default=0,
+                            help='Seconds to sleep between batches.')
+        parser.add_argument('--max-batches', type=int, default=None,
+                            help='Stop after this many batches.')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Only count the orphaned subtasks.')
+
+    def handle(self, *args, **options):
+        count = sweep_orphaned_subtasks(
+            grace=timedelta(hours=options['older_than']),
+            batch_size=options['batch_size'],
+            pause=options['pause'],
+            max_batches=options['max_batches'],
+            dry_run=options['dry_run'],
+        )
+        if options['dry_run']:
+            self.stdout.write(f'Found {count} orphaned subtasks.')
+        else:
+            self.stdout.write(f'Deleted {count} orphaned subtasks.')
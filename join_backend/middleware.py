@@ -0,0 +1,153 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.auth.models import AnonymousUser
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.core.cache import cache
+from django.middleware.csrf import CsrfViewMiddleware
+
+from .routers import choose_replica, get_replicas, touch_heartbeat, use_read_alias
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+PIN_COOKIE = 'primary_pin'
+
+
+
+
+class ReplicaRoutingMiddleware:
+    """
+ReplicaRoutingMiddleware:
+
+Sends the database reads of safe-method API requests to a read replica (see `join_backend.routers`).
+After a write, the client is pinned to the primary for `REPLICA_PIN_SECONDS`, both with a cookie and with a cache entry
+keyed by its Authorization header, so users always read their own changes even while replicas catch up.
+The cache entry only pins clients across worker processes when the cache is shared (see `REDIS_URL` in the settings).
+Does nothing unless `DATABASE_REPLICAS` is configured.
+"""
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not get_replicas():
+            return self.get_response(request)
+
+        alias = None
+        if request.method in SAFE_METHODS and not self.is_excluded(request) and not self.is_pinned(request):
+            alias = choose_replica()
+
+        with use_read_alias(alias):
+            response = self.get_response(request)
+
+        if request.method not in SAFE_METHODS:
+            self.pin(request, response)
+            touch_heartbeat()
+        return response
+
+    def is_excluded(self, request):
+        return any(request.path.startswith(prefix) for prefix in settings.REPLICA_EXCLUDED_PATHS)
+
+    def pin_key(self, request):
+        authorization = request.headers.get('Authorization')
+        if not authorization:
+            return None
+        return 'primary-pin:' + hashlib.sha256(authorization.encode()).hexdigest()
+
+    def is_pinned(self, request):
+        if PIN_COOKIE in request.COOKIES:
+            return True
+        key = self.pin_key(request)
+        return key is not None and cache.get(key) is not None
+
+    def pin(self, request, response):
+        seconds = settings.REPLICA_PIN_SECONDS
+        response.set_cookie(PIN_COOKIE, '1', max_age=seconds, httponly=True, samesite='Lax')
+        key = self.pin_key(request)
+        if key is not None:
+            cache.set(key, 1, seconds)
+
+
+def uses_session(request):
+    """
+    Returns whether `request` needs the session, CSRF, auth and message middleware.
+    That is the case on `SESSION_PATHS` (the admin and other browser views) and for requests that carry a session cookie
+    but no Authorization header. Token-authenticated API requests and requests without a session cookie cannot be
+    session-authenticated, so skipping CSRF processing for them is safe. The decision is made once per request.
+    """
+    decision = getattr(request, '_uses_session', None)
+    if decision is None:
+        decision = request._uses_session = (
+            any(request.path.startswith(prefix) for prefix in settings.SESSION_PATHS)
+            or ('Authorization' not in request.headers and settings.SESSION_COOKIE_NAME in request.COOKIES)
+        )
+    return decision
+
+
+
+
+class SessionOnlyMixin:
+    """
+SessionOnlyMixin:
+
+Makes a Django middleware pass requests that do not use sessions (see `uses_session`) straight through.
+The lean middleware subclasses stay in `MIDDLEWARE`, so the admin's middleware checks still pass.
+"""
+    sync_capable = True
+    async_capable = False
+
+    def __call__(self, request):
+        if not uses_session(request):
+            self.skip(request)
+            return self.get_response(request)
+        return super().__call__(request)
+
+    def skip(self, request):
+        pass
+
+
+
+
+class LeanSessionMiddleware(SessionOnlyMixin, SessionMiddleware):
+    """
+LeanSessionMiddleware:
+
+SessionMiddleware that neither loads nor saves a session for token-authenticated API requests.
+"""
+
+
+
+
+class LeanCsrfViewMiddleware(SessionOnlyMixin, CsrfViewMiddleware):
+    """
+LeanCsrfViewMiddleware:
+
+CsrfViewMiddleware that skips CSRF processing for requests that cannot be session-authenticated.
+"""
+    def process_view(self, request, callback, callback_args, callback_kwargs):
+        if not uses_session(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+
+
+class LeanAuthenticationMiddleware(SessionOnlyMixin, AuthenticationMiddleware):
+    """
+LeanAuthenticationMiddleware:
+
+AuthenticationMiddleware that leaves token-authenticated API requests anonymous until DRF authenticates them,
+instead of looking up a session user first.
+"""
+    def skip(self, request):
+        request.user = AnonymousUser()
+
+
+
+
+class LeanMessageMiddleware(SessionOnlyMixin, MessageMiddleware):
+    """
+LeanMessageMiddleware:
+
+MessageMiddleware that sets up no message storage for token-authenticated API requests.
+"""
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.2 on 2026-10-19 02:20
+
+from django.db import migrations, models
+
+from join_backend.ordering import evenly_spaced_keys
+
+
+def assign_initial_positions(apps, schema_editor):
+    Task = apps.get_model('join_backend', 'Task')
+    db_alias = schema_editor.connection.alias
+    columns = {}
+    for task in Task.objects.using(db_alias).order_by('id').only('id', 'creator_id', 'status'):
+        columns.setdefault((task.creator_id, task.status), []).append(task)
+    for tasks in columns.values():
+        for task, key in zip(tasks, evenly_spaced_keys(len(tasks))):
+            task.position = key
+        Task.objects.using(db_alias).bulk_update(tasks, ['position'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('join_backend', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='position',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(fields=['creator', 'status', 'position'], name='task_column_position_idx'),
+        ),
+        migrations.RunPython(assign_initial_positions, migrations.RunPython.noop),
+    ]
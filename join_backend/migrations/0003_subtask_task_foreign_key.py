@@ -0,0 +1,68 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def copy_links_to_foreign_key(apps, schema_editor):
+    """
+    Moves every Task.subtasks M2M link onto Subtask.task. A subtask linked to several tasks keeps its first link
+    and is copied for every further task, so no task loses a subtask.
+    """
+    Task = apps.get_model('join_backend', 'Task')
+    Subtask = apps.get_model('join_backend', 'Subtask')
+    Link = Task.subtasks.through
+    db_alias = schema_editor.connection.alias
+
+    linked = {}
+    copies = []
+    for task_id, subtask_id, text, completed in (
+        Link.objects.using(db_alias).order_by('id').values_list('task_id', 'subtask_id', 'subtask__text', 'subtask__completed').iterator()
+    ):
+        if subtask_id not in linked:
+            linked[subtask_id] = task_id
+        else:
+            copies.append(Subtask(task_id=task_id, text=text, completed=completed))
+
+    by_task = {}
+    for subtask_id, task_id in linked.items():
+        by_task.setdefault(task_id, []).append(subtask_id)
+    for task_id, subtask_ids in by_task.items():
+        for start in range(0, len(subtask_ids), 500):
+            Subtask.objects.using(db_alias).filter(id__in=subtask_ids[start:start + 500]).update(task_id=task_id)
+    Subtask.objects.using(db_alias).bulk_create(copies, batch_size=500)
+
+
+def copy_links_to_many_to_many(apps, schema_editor):
+    Task = apps.get_model('join_backend', 'Task')
+    Subtask = apps.get_model('join_backend', 'Subtask')
+    Link = Task.subtasks.through
+    db_alias = schema_editor.connection.alias
+    Link.objects.using(db_alias).bulk_create(
+        (Link(task_id=task_id, subtask_id=subtask_id)
+         for subtask_id, task_id in Subtask.objects.using(db_alias).filter(task__isnull=False).values_list('id', 'task_id').iterator()),
+        batch_size=500
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('join_backend', '0002_task_position'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subtask',
+            name='task',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='join_backend.task'),
+        ),
+        migrations.RunPython(copy_links_to_foreign_key, copy_links_to_many_to_many),
+        migrations.RemoveField(
+            model_name='task',
+            name='subtasks',
+        ),
+        migrations.AlterField(
+            model_name='subtask',
+            name='task',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='subtasks', to='join_backend.task'),
+        ),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.1.2 on 2026-10-19 02:24
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def count_existing_subtasks(apps, schema_editor):
+    Task = apps.get_model('join_backend', 'Task')
+    Subtask = apps.get_model('join_backend', 'Subtask')
+    db_alias = schema_editor.connection.alias
+    counts = (
+        Subtask.objects.filter(task=OuterRef('pk')).order_by().values('task')
+        .annotate(total=Count('id'), done=Count('id', filter=Q(completed=True)))
+    )
+    Task.objects.using(db_alias).update(
+        subtasks_total=Coalesce(Subquery(counts.values('total')), Value(0)),
+        subtasks_done=Coalesce(Subquery(counts.values('done')), Value(0)),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('join_backend', '0003_subtask_task_foreign_key'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='subtasks_done',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='subtasks_total',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(count_existing_subtasks, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-19 02:34
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('join_backend', '0005_replication_heartbeat'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='subtask',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name='subtask',
+            index=models.Index(condition=models.Q(('task__isnull', True)), fields=['created_at'], name='subtask_orphan_idx'),
+        ),
+    ]
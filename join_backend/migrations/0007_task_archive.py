@@ -0,0 +1,47 @@
+# Generated by Django 5.1.2 on 2026-10-19 02:36
+
+from django.db import migrations, models
+from django.db.models.functions import Now
+
+
+def stamp_done_tasks(apps, schema_editor):
+    # Existing done tasks have no completion time; count them as completed now so they are archived after the full age.
+    Task = apps.get_model('join_backend', 'Task')
+    Task.objects.using(schema_editor.connection.alias).filter(status='done').update(completed_at=Now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('join_backend', '0006_subtask_created_at'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='task',
+            name='task_column_position_idx',
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='archived',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(stamp_done_tasks, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('archived', False)), fields=['creator', 'status', 'position'], name='task_column_position_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('archived', True)), fields=['creator', '-completed_at'], name='task_archive_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('archived', False), ('status', 'done')), fields=['completed_at'], name='task_archivable_idx'),
+        ),
+    ]
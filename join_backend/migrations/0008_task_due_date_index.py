@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-19 02:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('join_backend', '0007_task_archive'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('archived', False)), fields=['creator', 'due_date'], name='task_due_date_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.2 on 2026-10-19 02:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('join_backend', '0008_task_due_date_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('archived', False), models.Q(('status', 'done'), _negated=True)), fields=['due_date'], name='task_open_due_date_idx'),
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Priority moves from a string to an integer column whose codes rise with urgency, so it can be sorted by meaning.
+# AlterField would copy the strings as-is, so each value is written to a new column, converted, and the new column
+# renamed over the old one.
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+import join_backend.fields
+
+PRIORITY_CHOICES = [('Low', 'Low'), ('Medium', 'Medium'), ('Urgent', 'Urgent')]
+PRIORITY_CODES = {'Low': 1, 'Medium': 2, 'Urgent': 3}
+# Values outside the choices cannot be stored as codes and become Medium.
+DEFAULT_PRIORITY = 2
+
+
+def encode_priorities(apps, schema_editor):
+    Task = apps.get_model('join_backend', 'Task')
+    Task.objects.using(schema_editor.connection.alias).update(priority_code=Case(
+        *[When(priority=priority, then=Value(code)) for priority, code in PRIORITY_CODES.items()],
+        default=Value(DEFAULT_PRIORITY),
+    ))
+
+
+def decode_priorities(apps, schema_editor):
+    Task = apps.get_model('join_backend', 'Task')
+    Task.objects.using(schema_editor.connection.alias).update(priority=Case(
+        *[When(priority_code=code, then=Value(priority)) for priority, code in PRIORITY_CODES.items()],
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('join_backend', '0009_task_open_due_date_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='task',
+            name='priority_code',
+            field=join_backend.fields.EnumField(choices=PRIORITY_CHOICES, codes=PRIORITY_CODES, null=True),
+        ),
+        migrations.RunPython(encode_priorities, decode_priorities),
+        migrations.RemoveField(model_name='task', name='priority'),
+        migrations.RenameField(model_name='task', old_name='priority_code', new_name='priority'),
+        migrations.AlterField(
+            model_name='task',
+            name='priority',
+            field=join_backend.fields.EnumField(choices=PRIORITY_CHOICES, codes=PRIORITY_CODES),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('archived', False)), fields=['creator', '-priority', 'id'], name='task_priority_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('archived', False)), fields=['creator', 'category'], name='task_category_idx'),
+        ),
+    ]
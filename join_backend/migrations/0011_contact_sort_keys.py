@@ -0,0 +1,48 @@
+# Generated by Django 5.1.2 on 2026-10-19 02:45
+
+from django.db import migrations, models
+
+from join_backend.sortkeys import name_group, name_sort_key
+
+
+def index_existing_contacts(apps, schema_editor):
+    Contact = apps.get_model('join_backend', 'Contact')
+    contacts = Contact.objects.using(schema_editor.connection.alias)
+    batch = []
+    for contact in contacts.only('id', 'name').iterator(chunk_size=1000):
+        contact.sort_key = name_sort_key(contact.name)
+        contact.group = name_group(contact.sort_key)
+        batch.append(contact)
+        if len(batch) == 1000:
+            contacts.bulk_update(batch, ['sort_key', 'group'])
+            batch = []
+    contacts.bulk_update(batch, ['sort_key', 'group'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('join_backend', '0010_task_priority_codes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='group',
+            field=models.CharField(default='#', editable=False, max_length=1),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='sort_key',
+            field=models.CharField(default='', editable=False, max_length=255),
+        ),
+        migrations.RunPython(index_existing_contacts, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['user', 'sort_key', 'id'], name='contact_sort_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['user', 'group', 'sort_key'], name='contact_group_idx'),
+        ),
+    ]
@@ -0,0 +1,118 @@
+# Status and colors move from strings to integer columns. AlterField would copy the strings as-is,
+# so each value is written to a new column, converted, and the new column renamed over the old one.
+
+from django.db import migrations, models
+from django.db.models import Case, Value, When
+
+import join_backend.fields
+
+STATUS_CHOICES = [('todo', 'To Do'), ('inProgress', 'In Progress'), ('awaitFeedback', 'Await Feedback'), ('done', 'Done')]
+STATUS_CODES = {'todo': 1, 'inProgress': 2, 'awaitFeedback': 3, 'done': 4}
+# Values outside the choices cannot be stored as codes: unknown statuses become todo,
+# shorthand #RGB colors are expanded to #RRGGBB, and malformed colors become the default contact color.
+DEFAULT_STATUS = 1
+DEFAULT_COLOR = 0xFF7A00
+
+
+def parse_color(value):
+    value = (value or '').strip()
+    if len(value) == 4 and value.startswith('#'):
+        value = '#' + ''.join(digit * 2 for digit in value[1:])
+    if len(value) == 7 and value.startswith('#'):
+        try:
+            return int(value[1:], 16)
+        except ValueError:
+            pass
+    return DEFAULT_COLOR
+
+
+def encode_values(apps, schema_editor):
+    db_alias = schema_editor.connection.alias
+    Task = apps.get_model('join_backend', 'Task')
+    Task.objects.using(db_alias).update(status_code=Case(
+        *[When(status=status, then=Value(code)) for status, code in STATUS_CODES.items()],
+        default=Value(DEFAULT_STATUS),
+    ))
+    for model_name in ('Contact', 'Category'):
+        Model = apps.get_model('join_backend', model_name)
+        objects = Model.objects.using(db_alias)
+        for color in objects.values_list('color', flat=True).distinct():
+            objects.filter(color=color).update(color_code=parse_color(color))
+
+
+def decode_values(apps, schema_editor):
+    db_alias = schema_editor.connection.alias
+    Task = apps.get_model('join_backend', 'Task')
+    Task.objects.using(db_alias).update(
+        status=Case(*[When(status_code=code, then=Value(status)) for status, code in STATUS_CODES.items()]),
+    )
+    for model_name in ('Contact', 'Category'):
+        Model = apps.get_model('join_backend', model_name)
+        objects = Model.objects.using(db_alias)
+        for color in objects.values_list('color_code', flat=True).distinct():
+            objects.filter(color_code=color).update(color=color)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('join_backend', '0011_contact_sort_keys'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(model_name='task', name='task_column_position_idx'),
+        migrations.RemoveIndex(model_name='task', name='task_archivable_idx'),
+        migrations.RemoveIndex(model_name='task', name='task_open_due_date_idx'),
+
+        migrations.AddField(
+            model_name='task',
+            name='status_code',
+            field=join_backend.fields.EnumField(choices=STATUS_CHOICES, codes=STATUS_CODES, null=True),
+        ),
+        migrations.AddField(
+            model_name='contact',
+            name='color_code',
+            field=join_backend.fields.ColorField(null=True),
+        ),
+        migrations.AddField(
+            model_name='category',
+            name='color_code',
+            field=join_backend.fields.ColorField(null=True),
+        ),
+        migrations.RunPython(encode_values, decode_values),
+
+        migrations.RemoveField(model_name='task', name='status'),
+        migrations.RemoveField(model_name='contact', name='color'),
+        migrations.RemoveField(model_name='category', name='color'),
+        migrations.RenameField(model_name='task', old_name='status_code', new_name='status'),
+        migrations.RenameField(model_name='contact', old_name='color_code', new_name='color'),
+        migrations.RenameField(model_name='category', old_name='color_code', new_name='color'),
+        migrations.AlterField(
+            model_name='task',
+            name='status',
+            field=join_backend.fields.EnumField(choices=STATUS_CHOICES, codes=STATUS_CODES, default='todo'),
+        ),
+        migrations.AlterField(
+            model_name='contact',
+            name='color',
+            field=join_backend.fields.ColorField(default='#FF7A00'),
+        ),
+        migrations.AlterField(
+            model_name='category',
+            name='color',
+            field=join_backend.fields.ColorField(),
+        ),
+
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('archived', False)), fields=['creator', 'status', 'position'], name='task_column_position_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('archived', False), ('status', 'done')), fields=['completed_at'], name='task_archivable_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='task',
+            index=models.Index(condition=models.Q(('archived', False), models.Q(('status', 'done'), _negated=True)), fields=['due_date'], name='task_open_due_date_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.2 on 2026-10-19 02:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('join_backend', '0012_compact_enum_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contact',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='task',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
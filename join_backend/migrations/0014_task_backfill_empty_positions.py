@@ -0,0 +1,33 @@
+# Tasks created outside the API (admin, shell, fixtures) could be saved with an empty position, which sorts as the start
+# of the column and is treated as "no neighbour" by moves. They are appended to the end of their column instead.
+
+from django.db import migrations
+
+from join_backend.ordering import keys_between
+
+
+def append_empty_positions(apps, schema_editor):
+    Task = apps.get_model('join_backend', 'Task')
+    tasks = Task.objects.using(schema_editor.connection.alias)
+    columns = {}
+    for task in tasks.filter(position='').order_by('id').only('id', 'creator_id', 'status'):
+        columns.setdefault((task.creator_id, task.status), []).append(task)
+    for (creator_id, status), column in columns.items():
+        last = (
+            tasks.filter(creator_id=creator_id, status=status).exclude(position='')
+            .order_by('-position').values_list('position', flat=True).first()
+        )
+        for task, key in zip(column, keys_between(last, None, len(column))):
+            task.position = key
+        tasks.bulk_update(column, ['position'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('join_backend', '0013_task_contact_version'),
+    ]
+
+    operations = [
+        migrations.RunPython(append_empty_positions, migrations.RunPython.noop),
+    ]
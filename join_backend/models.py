@@ -1,6 +1,12 @@
 from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models.functions import Coalesce, Now
+from django.utils import timezone
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
+from .fields import ColorField, EnumField
+from .ordering import append_position
+from .sortkeys import OTHER_GROUP, name_group, name_sort_key
 
 
 
@@ -66,21 +72,69 @@ It includes fields for name, email, and user status, with CustomUserManager hand
 
 
 
+class ContactQuerySet(models.QuerySet):
+    """
+ContactQuerySet:
+
+Adds `with_workload()`, which annotates each contact with counts of its assigned tasks (open, urgent and per status)
+through the `tasks` reverse relation, computed in the same query with conditional COUNT aggregates.
+"""
+    def with_workload(self):
+        open_tasks = ~models.Q(tasks__status='done')
+        annotations = {
+            'workload_open': models.Count('tasks', filter=open_tasks),
+            'workload_urgent': models.Count('tasks', filter=open_tasks & models.Q(tasks__priority='Urgent')),
+        }
+        for status, _ in Task.STATUS_CHOICES:
+            annotations[f'workload_{status}'] = models.Count('tasks', filter=models.Q(tasks__status=status))
+        return self.annotate(**annotations)
+
+
+
+
 class Contact(models.Model):
     """
 Contact:
 
-A model representing a contact, linked to a user, with fields for name, email, phone, and a color attribute (stored as a hex code). 
+A model representing a contact, linked to a user, with fields for name, email, phone, and a color attribute (a hex code stored as an integer). 
 Each contact is associated with a specific user and can be used for tasks.
+The normalized `sort_key` and the `group` letter are derived from the name on save (see `join_backend.sortkeys`)
+and indexed per user, so the contacts page can load its alphabetical list one letter at a time.
 """
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, null=True)
     name = models.CharField(max_length=255, null=False, blank=False)
     email = models.EmailField(null=False, blank=False)
     phone = models.CharField(max_length=20, null=False, blank=False)
-    color = models.CharField(max_length=7, null=False, blank=False, default='#FF7A00')
+    color = ColorField(default='#FF7A00')  # Stored as an integer, read as #RRGGBB
+    sort_key = models.CharField(max_length=255, default='', editable=False)
+    group = models.CharField(max_length=1, default=OTHER_GROUP, editable=False)
+    version = models.PositiveIntegerField(default=1, editable=False)  # See join_backend.versioning
+
+    WORKLOAD_KEYS = ('open', 'urgent', 'todo', 'inProgress', 'awaitFeedback', 'done')
+
+    objects = ContactQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'sort_key', 'id'], name='contact_sort_idx'),
+            models.Index(fields=['user', 'group', 'sort_key'], name='contact_group_idx'),
+        ]
 
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        self.derive_sort_keys()
+        if not self._state.adding:
+            self.version += 1
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'version', *(('sort_key', 'group') if 'name' in update_fields else ())}
+        super().save(*args, **kwargs)
+
+    def derive_sort_keys(self):
+        self.sort_key = name_sort_key(self.name)
+        self.group = name_group(self.sort_key)
     
 
 
@@ -93,7 +147,7 @@ A model for categorizing tasks, with unique name and color fields, where the col
 Categories help organize tasks into distinct groups.
 """
     name = models.CharField(max_length=255, unique=True)
-    color = models.CharField(max_length=7)  # Hex color codes
+    color = ColorField()  # Hex color code, stored as an integer
 
     def __str__(self):
         return self.name
@@ -101,12 +155,41 @@ Categories help organize tasks into distinct groups.
 
 
 
+class TaskQuerySet(models.QuerySet):
+    """
+TaskQuerySet:
+
+Separates the board's working set (`active()`) from archived done tasks (`archived()`), and provides `update_status()`,
+which changes the status of many tasks in one UPDATE while keeping `completed_at` and `archived` consistent with it.
+Like every change to a task, it increments the task's `version`.
+"""
+    def active(self):
+        return self.filter(archived=False)
+
+    def archived(self):
+        return self.filter(archived=True)
+
+    def update_status(self, status, **fields):
+        if status == 'done':
+            # Tasks that already were done keep their completion time.
+            return self.update(
+                status=status, completed_at=Coalesce('completed_at', Now()), version=models.F('version') + 1, **fields
+            )
+        return self.update(status=status, completed_at=None, archived=False, version=models.F('version') + 1, **fields)
+
+
+
+
 class Task(models.Model):
     """
 Task:
 
 A model for tasks, including fields for title, description, priority, due date, and status. 
-Tasks are linked to categories and contacts (assignees) and can have multiple subtasks. The status field tracks the task's progress.
+Tasks are linked to categories and contacts (assignees) and can have multiple subtasks. The status field tracks the task's progress,
+and the position field orders tasks within their status column (see `join_backend.ordering`).
+Status and priority are stored as small-integer codes but read and written as their string values.
+Done tasks record when they were completed and are moved off the board into the archive once they are old enough
+(see `join_backend.archive`).
 """
     STATUS_CHOICES = [
         ('todo', 'To Do'),
@@ -114,20 +197,63 @@ Tasks are linked to categories and contacts (assignees) and can have multiple su
         ('awaitFeedback', 'Await Feedback'),
         ('done', 'Done')
     ]
+    PRIORITY_CHOICES = [
+        ('Low', 'Low'),
+        ('Medium', 'Medium'),
+        ('Urgent', 'Urgent')
+    ]
+    # Stored small-integer codes (see `join_backend.fields.EnumField`); priority codes rise with urgency.
+    STATUS_CODES = {'todo': 1, 'inProgress': 2, 'awaitFeedback': 3, 'done': 4}
+    PRIORITY_CODES = {'Low': 1, 'Medium': 2, 'Urgent': 3}
 
     title = models.CharField(max_length=255)
     description = models.TextField(blank=True, null=True)
-    priority = models.CharField(max_length=50, choices=[('Low', 'Low'), ('Medium', 'Medium'), ('Urgent', 'Urgent')])
+    priority = EnumField(choices=PRIORITY_CHOICES, codes=PRIORITY_CODES)
     due_date = models.DateField(null=True, blank=True)
     category = models.ForeignKey('Category', on_delete=models.SET_NULL, null=True)
     assigned_to = models.ManyToManyField('Contact', related_name='tasks')
     creator = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='created_tasks', null=True)
-    subtasks = models.ManyToManyField('Subtask', related_name='tasks', blank=True)
-    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='todo')  # Add status field
+    status = EnumField(choices=STATUS_CHOICES, codes=STATUS_CODES, default='todo')  # Add status field
+    position = models.CharField(max_length=64, default='', blank=True)  # Fractional index within the status column
+    subtasks_total = models.PositiveIntegerField(default=0, editable=False)  # Maintained by join_backend.counters
+    subtasks_done = models.PositiveIntegerField(default=0, editable=False)
+    completed_at = models.DateTimeField(null=True, blank=True, editable=False)  # Set while status is 'done'
+    archived = models.BooleanField(default=False, editable=False)
+    version = models.PositiveIntegerField(default=1, editable=False)  # See join_backend.versioning
+
+    objects = TaskQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Partial indexes keep the board's index limited to the active working set.
+            models.Index(fields=['creator', 'status', 'position'], name='task_column_position_idx',
+                         condition=models.Q(archived=False)),
+            models.Index(fields=['creator', '-completed_at'], name='task_archive_idx',
+                         condition=models.Q(archived=True)),
+            models.Index(fields=['completed_at'], name='task_archivable_idx',
+                         condition=models.Q(status='done', archived=False)),
+            models.Index(fields=['creator', 'due_date'], name='task_due_date_idx', condition=models.Q(archived=False)),
+            models.Index(fields=['due_date'], name='task_open_due_date_idx',
+                         condition=models.Q(archived=False) & ~models.Q(status='done')),
+            models.Index(fields=['creator', '-priority', 'id'], name='task_priority_idx',
+                         condition=models.Q(archived=False)),
+            models.Index(fields=['creator', 'category'], name='task_category_idx', condition=models.Q(archived=False)),
+        ]
 
     def __str__(self):
         return self.title
 
+    def save(self, *args, **kwargs):
+        if self._state.adding and not self.position:
+            # An empty key would sort as the column's start; tasks created without one go to the end.
+            self.position = append_position(self.creator_id, self.status)
+        if not self._state.adding:
+            self.version += 1
+            update_fields = kwargs.get('update_fields')
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'version'}
+        super().save(*args, **kwargs)
+
 
 
 
@@ -136,10 +262,19 @@ class Subtask(models.Model):
 Subtask:
 
 A model representing a subtask, with a text description and a completed status. 
-Subtasks are associated with tasks and help break down larger tasks into smaller, manageable components.
+Subtasks belong to a task through a foreign key (`task.subtasks`) and are deleted together with it,
+helping break down larger tasks into smaller, manageable components.
+Subtasks without a task are removed by the sweep_orphaned_subtasks command (see `join_backend.orphans`).
 """
+    task = models.ForeignKey(Task, on_delete=models.CASCADE, related_name='subtasks', null=True, blank=True)
     text = models.CharField(max_length=255)
     completed = models.BooleanField(default=False)
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at'], name='subtask_orphan_idx', condition=models.Q(task__isnull=True)),
+        ]
 
     def __str__(self):
         return self.text
@@ -149,4 +284,43 @@ class LoginHistory(models.Model):
     user = models.ForeignKey(CustomUser, on_delete=models.CASCADE)
     token = models.CharField(max_length=255)
     user_agent = models.TextField()
-    login_time = models.DateTimeField(auto_now_add=True)
\ No newline at end of file
+    login_time = models.DateTimeField(auto_now_add=True)
+
+
+
+
+class ReplicationHeartbeat(models.Model):
+    """
+ReplicationHeartbeat:
+
+A single-row table holding the time of the primary database's most recent write request.
+Comparing it with the copy on a read replica tells how far that replica lags behind (see `join_backend.routers`).
+"""
+    beat = models.DateTimeField()
+
+
+
+
+class IdempotencyKey(models.Model):
+    """
+IdempotencyKey:
+
+The stored outcome of a request sent with an `Idempotency-Key` header (see `join_backend.idempotency`).
+`key` is a hash of the request method, path and header value, unique per user. A row without a `status` marks a request
+still in flight; once it finishes, its status and response body are kept so retries can be answered with them.
+Keys older than `IDEMPOTENCY_KEY_TTL` are removed by the purge_idempotency_keys command.
+"""
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='+')
+    key = models.CharField(max_length=64)
+    fingerprint = models.CharField(max_length=64)
+    status = models.PositiveSmallIntegerField(null=True)
+    data = models.JSONField(null=True, encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'key'], name='idempotency_key_unique'),
+        ]
+        indexes = [
+            models.Index(fields=['created_at'], name='idempotency_key_created_idx'),
+        ]
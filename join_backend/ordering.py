@@ -0,0 +1,154 @@
+"""
+ordering:
+
+Fractional indexing for the order of tasks within a kanban column.
+
+Every task carries a `position` string. Columns are sorted by it, and a new key can always be generated between
+two neighbouring keys, so moving a card only rewrites the moved card instead of renumbering the column.
+Keys only use `0-9a-z` and never end in `0`, so they sort the same under byte-wise and locale collations.
+Repeated inserts at the same spot make keys longer; `rebalance_column` rewrites a column with short, evenly spaced keys.
+"""
+from django.db import transaction
+from django.db.models import Max
+from django.db.models.functions import Length
+
+DIGITS = '0123456789abcdefghijklmnopqrstuvwxyz'
+BASE = len(DIGITS)
+
+# Columns whose longest key exceeds this are picked up by the rebalance_positions command.
+REBALANCE_KEY_LENGTH = 24
+MAX_KEY_LENGTH = 64
+
+
+def key_between(a, b):
+    """
+    Returns a key that sorts strictly between `a` and `b`.
+    Either side may be empty/None, meaning the start or the end of the column.
+    """
+    a = a or ''
+    if b and a >= b:
+        raise ValueError(f'{a!r} must sort before {b!r}')
+    if a.endswith('0') or (b and b.endswith('0')):
+        raise ValueError('Position keys must not end in 0')
+    return _midpoint(a, b or None)
+
+
+def _midpoint(a, b):
+    if b is not None:
+        # Keep the common prefix and recurse on the remainder.
+        n = 0
+        while n < len(b) and (a[n] if n < len(a) else '0') == b[n]:
+            n += 1
+        if n > 0:
+            return b[:n] + _midpoint(a[n:], b[n:])
+
+    digit_a = DIGITS.index(a[0]) if a else 0
+    digit_b = DIGITS.index(b[0]) if b else BASE
+    if digit_b - digit_a > 1:
+        return DIGITS[(digit_a + digit_b + 1) // 2]
+    # The first digits are consecutive.
+    if b and len(b) > 1:
+        return b[0]
+    return DIGITS[digit_a] + _midpoint(a[1:], None)
+
+
+def evenly_spaced_keys(count):
+    """
+    Returns `count` ascending keys of minimal equal width, spread evenly over the key space.
+    """
+    width = 1
+    while BASE ** width <= count:
+        width += 1
+    step = BASE ** width / (count + 1)
+    keys = []
+    for i in range(1, count + 1):
+        value = int(i * step)
+        digits = []
+        for _ in range(width):
+            value, digit = divmod(value, BASE)
+            digits.append(DIGITS[digit])
+        keys.append(''.join(reversed(digits)).rstrip('0'))
+    return keys
+
+
+def keys_between(a, b, count):
+    """
+    Returns `count` ascending keys between `a` and `b`.
+    The keys are generated by bisection, so their length only grows with the logarithm of `count`.
+    """
+    if count <= 0:
+        return []
+    middle = key_between(a, b)
+    before = (count - 1) // 2
+    return keys_between(a, middle, before) + [middle] + keys_between(middle, b, count - 1 - before)
+
+
+def append_positions(creator_id, status, count):
+    """
+    Returns `count` ascending keys placing tasks at the end of their column, in one query.
+    """
+    from .models import Task
+
+    column = Task.objects.active().filter(creator_id=creator_id, status=status)
+    last = column.order_by('-position').values_list('position', flat=True).first()
+    keys = keys_between(last, None, count)
+    if any(len(key) > MAX_KEY_LENGTH for key in keys):
+        # Only reached when the scheduled rebalance has not kept up with this column.
+        rebalance_column(creator_id, status)
+        keys = keys_between(column.order_by('-position').values_list('position', flat=True).first(), None, count)
+    return keys
+
+
+def append_position(creator_id, status):
+    """
+    Returns a key placing a new task at the end of its column.
+    """
+    return append_positions(creator_id, status, 1)[0]
+
+
+def neighbour_keys(column, after, before):
+    """
+    Completes the keys of the cards a task is dropped between, given the other tasks of the target `column`.
+    With only `after` the task goes directly below it and with only `before` directly above it;
+    with neither it goes to the bottom of the column. Returns the `(after, before)` keys to generate a key between.
+    """
+    keys = column.values_list('position', flat=True)
+    if after is not None and before is None:
+        before = keys.filter(position__gt=after).order_by('position').first()
+    elif after is None and before is not None:
+        after = keys.filter(position__lt=before).order_by('-position').first()
+    elif after is None:
+        after = keys.order_by('-position').first()
+    return after, before
+
+
+def rebalance_column(creator_id, status):
+    """
+    Rewrites the positions of one column with evenly spaced keys, preserving the current order.
+    Returns the number of tasks rewritten.
+    """
+    from .models import Task
+
+    with transaction.atomic():
+        tasks = list(
+            Task.objects.active().filter(creator_id=creator_id, status=status)
+            .order_by('position', 'id').only('id', 'position')
+        )
+        for task, key in zip(tasks, evenly_spaced_keys(len(tasks))):
+            task.position = key
+        Task.objects.bulk_update(tasks, ['position'], batch_size=500)
+    return len(tasks)
+
+
+def columns_to_rebalance(max_key_length=REBALANCE_KEY_LENGTH):
+    """
+    Returns `(creator_id, status)` pairs of columns whose longest position key exceeds `max_key_length`.
+    """
+    from .models import Task
+
+    return list(
+        Task.objects.active().values('creator_id', 'status')
+        .annotate(longest=Max(Length('position')))
+        .filter(longest__gt=max_key_length)
+        .values_list('creator_id', 'status')
+    )
@@ -0,0 +1,50 @@
+"""
+orphans:
+
+Garbage collection of orphaned subtasks. Subtasks of a task are deleted with it through the `Subtask.task` cascade,
+but subtasks created on their own through `subtasks/` (or detached in the admin) have no task and are never shown
+on the board. They are removed once they are older than a grace period, in small primary-key batches so the sweep
+never holds long locks or fills the transaction log.
+"""
+import time
+from datetime import timedelta
+
+from django.utils import timezone
+
+ORPHAN_GRACE = timedelta(hours=24)
+
+
+def orphaned_subtasks(grace=ORPHAN_GRACE):
+    """
+    Returns the subtasks without a task that were created more than `grace` ago.
+    """
+    from .models import Subtask
+
+    return Subtask.objects.filter(task__isnull=True, created_at__lt=timezone.now() - grace)
+
+
+def sweep_orphaned_subtasks(grace=ORPHAN_GRACE, batch_size=500, pause=0, max_batches=None, dry_run=False):
+    """
+    Deletes orphaned subtasks in batches of `batch_size`, sleeping `pause` seconds between batches
+    and stopping after `max_batches` batches if given. Returns the number of subtasks deleted (or found, for a dry run).
+    """
+    from .models import Subtask
+
+    orphans = orphaned_subtasks(grace)
+    if dry_run:
+        return orphans.count()
+
+    deleted = 0
+    batches = 0
+    last_id = 0
+    while max_batches is None or batches < max_batches:
+        ids = list(orphans.filter(pk__gt=last_id).order_by('pk').values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            break
+        # Re-check the task in the DELETE itself in case a row was attached since it was selected.
+        deleted += Subtask.objects.filter(pk__in=ids, task__isnull=True).delete()[0]
+        last_id = ids[-1]
+        batches += 1
+        if pause and len(ids) == batch_size:
+            time.sleep(pause)
+    return deleted
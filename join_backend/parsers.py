@@ -0,0 +1,41 @@
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from .renderers import MessagePackRenderer, ORJSONRenderer, msgpack
+
+
+
+
+class ORJSONParser(JSONParser):
+    """
+ORJSONParser:
+
+Parses JSON request bodies with orjson. Like DRF's JSONParser it rejects `NaN`/`Infinity` and reports malformed
+input as a ParseError, so views see the same data and errors as before.
+"""
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError('JSON parse error - %s' % str(exc))
+
+
+
+
+class MessagePackParser(BaseParser):
+    """
+MessagePackParser:
+
+Parses `application/msgpack` request bodies. Requires the optional `msgpack` package.
+"""
+    media_type = 'application/msgpack'
+    renderer_class = MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False, strict_map_key=False)
+        except (ValueError, msgpack.ExtraData, msgpack.FormatError, msgpack.StackError) as exc:
+            raise ParseError('MessagePack parse error - %s' % str(exc))
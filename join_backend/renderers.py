@@ -0,0 +1,80 @@
+import decimal
+
+import orjson
+from django.utils.encoding import force_str
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional, see MessagePackRenderer
+    msgpack = None
+
+
+
+
+_fallback_encoder = JSONEncoder()
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def encode_default(obj):
+    """
+    encode_default:
+
+    Fallback hook for types the fast encoders don't handle natively. Lazy translation strings and decimals
+    are converted inline; everything else goes through DRF's JSONEncoder so the output stays identical to it.
+    """
+    if isinstance(obj, Promise):
+        return force_str(obj)
+    if isinstance(obj, decimal.Decimal):
+        return float(obj)
+    return _fallback_encoder.default(obj)
+
+
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+ORJSONRenderer:
+
+A drop-in replacement for DRF's JSONRenderer backed by orjson. Dates, datetimes, times and UUIDs are encoded natively,
+decimals and lazy strings through `encode_default`, so the output matches the stock renderer byte for byte.
+"""
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        options = ORJSON_OPTIONS
+        if self.get_indent(accepted_media_type, renderer_context):
+            # orjson only supports two-space indentation, which is good enough for the browsable API.
+            options |= orjson.OPT_INDENT_2
+
+        ret = orjson.dumps(data, default=encode_default, option=options)
+
+        # Keep the output a strict javascript subset, like DRF's JSONRenderer does.
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
+
+
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+MessagePackRenderer:
+
+Renders responses as MessagePack for clients that send `Accept: application/msgpack`.
+Requires the optional `msgpack` package; settings only enable it when the package is installed.
+"""
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=encode_default, datetime=False, use_bin_type=True)
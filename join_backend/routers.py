@@ -0,0 +1,126 @@
+"""
+routers:
+
+Read-replica routing. `ReplicaRoutingMiddleware` picks a replica alias for safe-method requests and stores it in a
+context variable; `PrimaryReplicaRouter` sends reads to that alias and everything else to the primary (`default`).
+
+Replicas are skipped while they lag behind the primary by more than `REPLICA_MAX_LAG_SECONDS`, measured by comparing
+the `ReplicationHeartbeat` row on the primary with the one on the replica. The primary's heartbeat is refreshed after
+write requests, so an idle primary and an in-sync replica never look lagged.
+"""
+import random
+import time
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils import timezone
+
+PRIMARY = 'default'
+
+# Auth and session lookups always go to the primary, so a token or session created a moment ago is never missing.
+PRIMARY_ONLY_MODELS = {'authtoken.token', 'authtoken.tokenproxy', 'sessions.session', 'join_backend.replicationheartbeat'}
+
+_read_alias = ContextVar('read_alias', default=None)
+_replica_state = {}
+_last_heartbeat = 0.0
+
+
+def get_replicas():
+    return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+
+def replica_is_fresh(alias):
+    """
+    Returns whether `alias` lags the primary by at most `REPLICA_MAX_LAG_SECONDS`.
+    The result is cached per process for `REPLICA_LAG_CHECK_INTERVAL` seconds; unreachable replicas count as stale.
+    """
+    from .models import ReplicationHeartbeat
+
+    now = time.monotonic()
+    checked_at, fresh = _replica_state.get(alias, (None, False))
+    if checked_at is not None and now - checked_at < settings.REPLICA_LAG_CHECK_INTERVAL:
+        return fresh
+
+    try:
+        primary_beat = ReplicationHeartbeat.objects.using(PRIMARY).values_list('beat', flat=True).first()
+        replica_beat = ReplicationHeartbeat.objects.using(alias).values_list('beat', flat=True).first()
+    except DatabaseError:
+        fresh = False
+    else:
+        if primary_beat is None:
+            fresh = True
+        elif replica_beat is None:
+            fresh = False
+        else:
+            fresh = (primary_beat - replica_beat).total_seconds() <= settings.REPLICA_MAX_LAG_SECONDS
+    _replica_state[alias] = (now, fresh)
+    return fresh
+
+
+def choose_replica():
+    """
+    Returns a random fresh replica alias, or None (the primary) when no replica is configured or fresh.
+    """
+    replicas = [alias for alias in get_replicas() if replica_is_fresh(alias)]
+    return random.choice(replicas) if replicas else None
+
+
+def touch_heartbeat():
+    """
+    Records the current time on the primary, at most once per `REPLICA_HEARTBEAT_INTERVAL` seconds per process.
+    """
+    from .models import ReplicationHeartbeat
+
+    global _last_heartbeat
+    now = time.monotonic()
+    if now - _last_heartbeat < settings.REPLICA_HEARTBEAT_INTERVAL:
+        return
+    _last_heartbeat = now
+    ReplicationHeartbeat.objects.using(PRIMARY).update_or_create(pk=1, defaults={'beat': timezone.now()})
+
+
+def reset_replica_state():
+    global _last_heartbeat
+    _replica_state.clear()
+    _last_heartbeat = 0.0
+
+
+
+
+class use_read_alias:
+    """
+use_read_alias:
+
+Context manager routing reads inside the block to `alias` (None means the primary).
+"""
+    def __init__(self, alias):
+        self.alias = alias
+
+    def __enter__(self):
+        self.token = _read_alias.set(self.alias)
+        return self.alias
+
+    def __exit__(self, *exc_info):
+        _read_alias.reset(self.token)
+
+
+
+
+class PrimaryReplicaRouter:
+    """
+PrimaryReplicaRouter:
+
+Routes reads to the replica chosen for the current request and all writes to the primary.
+All aliases hold the same data, so relations between objects loaded from different aliases are allowed.
+"""
+    def db_for_read(self, model, **hints):
+        if model._meta.label_lower in PRIMARY_ONLY_MODELS:
+            return PRIMARY
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
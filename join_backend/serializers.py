@@ -1,9 +1,17 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+
 from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
 from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.utils import timezone
 from .models import Contact
 from .models import Category
 from .models import Subtask
 from .models import Task
+from .ordering import append_position
+from .fields import HEX_COLOR_RE
+from .versioning import save_versioned
 
 
 
@@ -66,18 +74,128 @@ class UserDetailsSerializer(serializers.ModelSerializer):
 
 
 
+class HexColorField(serializers.RegexField):
+    """
+    **HexColorField**
+
+    A `#RRGGBB` color, normalized to upper case. Colors are stored as integers (`join_backend.fields.ColorField`),
+    so only this format can be accepted.
+    """
+    def __init__(self, **kwargs):
+        super().__init__(HEX_COLOR_RE, **kwargs)
+
+    def to_internal_value(self, data):
+        return super().to_internal_value(data).upper()
+
+
+
+class BatchedManyRelatedField(serializers.ManyRelatedField):
+    """
+    **BatchedManyRelatedField**
+
+    A `ManyRelatedField` that resolves all submitted primary keys with one `id__in` query instead of one query per key.
+    Ids that do not exist in the child's queryset are reported together in one error, and duplicates are dropped.
+    """
+    default_error_messages = {
+        'does_not_exist': 'Invalid pk(s) {pk_values} - object(s) do not exist.',
+    }
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+
+        pks = []
+        for item in data:
+            if isinstance(item, bool):
+                self.child_relation.fail('incorrect_type', data_type=type(item).__name__)
+            try:
+                pk = int(item)
+            except (TypeError, ValueError):
+                self.child_relation.fail('incorrect_type', data_type=type(item).__name__)
+            if pk not in pks:
+                pks.append(pk)
+
+        found = self.child_relation.get_queryset().in_bulk(pks)
+        missing = [pk for pk in pks if pk not in found]
+        if missing:
+            self.fail('does_not_exist', pk_values=', '.join(f'"{pk}"' for pk in missing))
+        return [found[pk] for pk in pks]
+
+
+
+
+class UserContactsField(serializers.PrimaryKeyRelatedField):
+    """
+    **UserContactsField**
+
+    A primary-key field accepting only contacts of the requesting user.
+    With `many=True` it is wrapped in a `BatchedManyRelatedField`, so validating any number of ids costs one query.
+    """
+    def __init__(self, **kwargs):
+        kwargs.setdefault('queryset', Contact.objects.all())
+        super().__init__(**kwargs)
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return BatchedManyRelatedField(**list_kwargs)
+
+    def get_queryset(self):
+        request = self.context.get('request')
+        return super().get_queryset().filter(user=request.user)
+
+
+
+
 class ContactSerializer(serializers.ModelSerializer):
     """
     **ContactSerializer**
 
     A serializer for managing `Contact` objects, including fields like `id`, `user`, `name`, `email`, `phone`, and `color`.
     It embeds user details using the `UserDetailsSerializer` and treats the `user` field as read-only.
+    The read-only `group` is the letter the contact is listed under, derived from its name.
+    Updates write only the changed fields and are guarded by the read-only `version` (see `join_backend.versioning`).
     """
     user = UserDetailsSerializer(read_only=True)
+    color = HexColorField(required=False)
 
     class Meta:
         model = Contact
-        fields = ('id', 'user', 'name', 'email', 'phone', 'color')
+        fields = ('id', 'user', 'name', 'email', 'phone', 'color', 'group', 'version')
+
+    def update(self, instance, validated_data):
+        changes = {attr: value for attr, value in validated_data.items() if getattr(instance, attr) != value}
+        for attr, value in changes.items():
+            setattr(instance, attr, value)
+        if 'name' in changes:
+            instance.derive_sort_keys()
+            changes.update(sort_key=instance.sort_key, group=instance.group)
+        if changes:
+            save_versioned(instance, **changes)
+        return instance
+
+
+
+class ContactWorkloadSerializer(ContactSerializer):
+    """
+    **ContactWorkloadSerializer**
+
+    Extends `ContactSerializer` with a read-only `workload` object counting the contact's open and urgent tasks
+    and its tasks per status. It expects the queryset to be annotated by `Contact.objects.with_workload()`,
+    so the counts come from the list query itself instead of the client scanning all tasks.
+    """
+    workload = serializers.SerializerMethodField()
+
+    class Meta(ContactSerializer.Meta):
+        fields = ContactSerializer.Meta.fields + ('workload',)
+
+    def get_workload(self, contact):
+        return {key: getattr(contact, f'workload_{key}') for key in Contact.WORKLOAD_KEYS}
 
 
 
@@ -88,6 +206,8 @@ class CategorySerializer(serializers.ModelSerializer):
     A serializer for handling `Category` objects, including the `id`, `name`, and `color` fields,
     facilitating the categorization of tasks.
     """
+    color = HexColorField()
+
     class Meta:
         model = Category
         fields = ['id', 'name', 'color']
@@ -131,20 +251,23 @@ class TaskSerializer(serializers.ModelSerializer):
     - `creator`
     - `subtasks`
     - `status`
+    - `position` (read-only, changed through the move endpoint)
+    - `subtasks_total` and `subtasks_done` (read-only counters kept in sync with the subtasks)
+    - `completed_at` and `archived` (read-only, maintained from the status and by the archive_tasks command)
+    - `version` (read-only, incremented by every change; see `join_backend.versioning`)
 
     It handles nested serialization for `subtasks` and relationships with `contacts` and `categories`.
-    The `create` and `update` methods are customized to manage related data, such as `subtasks` and assigned contacts.
+    `assigned_to` only accepts the requesting user's contacts and resolves them with a single query (`UserContactsField`);
+    the fetched contacts are reused when the links are written.
+    The `create` and `update` methods are customized to manage related data, such as `subtasks` and assigned contacts;
+    on update, subtasks are reconciled by `TaskDetailAPIView`.
     """
     category = serializers.PrimaryKeyRelatedField(
         queryset=Category.objects.all(),
         allow_null=True,
         required=False
     )
-    assigned_to = serializers.PrimaryKeyRelatedField(
-        many=True,
-        queryset=Contact.objects.all(),
-        required=False
-    )
+    assigned_to = UserContactsField(many=True, required=False)
     subtasks = SubtaskSerializer(many=True, required=False)
     creator = UserDetailsSerializer(read_only=True)
 
@@ -153,60 +276,349 @@ class TaskSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Task
-        fields = ['id', 'title', 'description', 'priority', 'due_date', 'category', 'assigned_to', 'creator', 'subtasks', 'status']
+        fields = ['id', 'title', 'description', 'priority', 'due_date', 'category', 'assigned_to', 'creator', 'subtasks', 'status', 'position',
+                  'subtasks_total', 'subtasks_done', 'completed_at', 'archived', 'version']
+        read_only_fields = ['position']
 
     def create(self, validated_data):
         request = self.context.get('request')
         validated_data['creator'] = request.user
+        validated_data['position'] = append_position(request.user.id, validated_data.get('status', 'todo'))
+        if validated_data.get('status') == 'done':
+            validated_data['completed_at'] = timezone.now()
 
         subtasks_data = validated_data.pop('subtasks', [])
         assigned_to_data = validated_data.pop('assigned_to', [])
+        validated_data['subtasks_total'] = len(subtasks_data)
+        validated_data['subtasks_done'] = sum(1 for subtask_data in subtasks_data if subtask_data.get('completed'))
         task = Task.objects.create(**validated_data)
         task.assigned_to.set(assigned_to_data)
 
-        for subtask_data in subtasks_data:
-            subtask = Subtask.objects.create(**subtask_data)
-            task.subtasks.add(subtask)
+        Subtask.objects.bulk_create([Subtask(task=task, **subtask_data) for subtask_data in subtasks_data])
 
         return task
 
     def update(self, instance, validated_data):
-        subtasks_data = validated_data.pop('subtasks', [])
-        assigned_to_data = validated_data.pop('assigned_to', [])
+        # Subtasks are reconciled by TaskDetailAPIView, which needs the submitted ids the nested serializer drops.
+        validated_data.pop('subtasks', None)
+        assigned_to_data = validated_data.pop('assigned_to', None)
+
+        # Only fields whose value differs are written, and a request without changes writes nothing.
+        changed_fields = [attr for attr, value in validated_data.items() if self.field_changed(instance, attr, value)]
+        if 'status' in changed_fields:
+            # A task entering another column is appended to its end; its old key belongs to the old column.
+            instance.position = append_position(instance.creator_id, validated_data['status'])
+            instance.completed_at = timezone.now() if validated_data['status'] == 'done' else None
+            instance.archived = False
+            changed_fields += ['position', 'completed_at', 'archived']
+        for attr in changed_fields:
+            if attr in validated_data:
+                setattr(instance, attr, validated_data[attr])
+
+        # Assignees are only touched when sent, and then only the added and removed links are written.
+        assignee_ids = None if assigned_to_data is None else {contact.pk for contact in assigned_to_data}
+        assignees_changed = assignee_ids is not None and assignee_ids != {contact.pk for contact in instance.assigned_to.all()}
+
+        # The changed columns and the version bump go out in one UPDATE conditional on the version that was read,
+        # before anything else is written, so a concurrent change raises VersionConflict instead of being overwritten.
+        self.version_saved = bool(changed_fields or assignees_changed)
+        if self.version_saved:
+            save_versioned(instance, **{attr: getattr(instance, attr) for attr in changed_fields})
+        if assignees_changed:
+            self.update_assignees(instance, assignee_ids)
+
+        return instance
+
+    @staticmethod
+    def field_changed(instance, attr, value):
+        field = instance._meta.get_field(attr)
+        if field.many_to_one:
+            # Compare ids so that the current related object is not loaded.
+            return getattr(instance, field.attname) != (value.pk if value is not None else None)
+        return getattr(instance, attr) != value
+
+    @staticmethod
+    def update_assignees(instance, contact_ids):
+        """
+        Sets the task's assignees to `contact_ids` by inserting and deleting only the links that differ.
+        """
+        Assignment = Task.assigned_to.through
+        current_ids = {contact.pk for contact in instance.assigned_to.all()}
+        added, removed = contact_ids - current_ids, current_ids - contact_ids
+        if removed:
+            Assignment.objects.filter(task=instance, contact_id__in=removed).delete()
+        if added:
+            Assignment.objects.bulk_create([Assignment(task=instance, contact_id=contact_id) for contact_id in sorted(added)])
+        if added or removed:
+            getattr(instance, '_prefetched_objects_cache', {}).pop('assigned_to', None)
+
+
+
+class TaskBulkSerializer(serializers.Serializer):
+    """
+    **TaskBulkSerializer**
+
+    Validates a bulk task mutation of the form `{ids, op, value}`, where `op` is one of `OPERATIONS`.
+    The `value` is validated against the field matching the operation: a status or priority choice,
+    a category id (or null), or one of the requesting user's contacts. `delete` takes no value.
+    """
+    OPERATIONS = ['set_status', 'set_priority', 'set_category', 'add_assignee', 'remove_assignee', 'delete']
+
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=1000)
+    op = serializers.ChoiceField(choices=OPERATIONS)
+    value = serializers.JSONField(required=False, allow_null=True)
+
+    def get_value_field(self, op):
+        request = self.context.get('request')
+        if op == 'set_status':
+            return serializers.ChoiceField(choices=Task.STATUS_CHOICES)
+        if op == 'set_priority':
+            return serializers.ChoiceField(choices=Task.PRIORITY_CHOICES)
+        if op == 'set_category':
+            return serializers.PrimaryKeyRelatedField(queryset=Category.objects.all(), allow_null=True)
+        if op in ('add_assignee', 'remove_assignee'):
+            return serializers.PrimaryKeyRelatedField(queryset=Contact.objects.filter(user=request.user))
+        return None
+
+    def validate(self, data):
+        field = self.get_value_field(data['op'])
+        if field is None:
+            data.pop('value', None)
+            return data
+        try:
+            data['value'] = field.run_validation(data.get('value', serializers.empty))
+        except serializers.ValidationError as exc:
+            raise serializers.ValidationError({'value': exc.detail})
+        return data
 
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        instance.save()
 
-        instance.assigned_to.set(assigned_to_data)
-
-        current_subtasks = {subtask.id: subtask for subtask in instance.subtasks.all()}
-        print(f"Existing subtask IDs: {current_subtasks.keys()}")
-        updated_subtasks = []
-        incoming_subtask_ids = set()
-
-        for subtask_data in subtasks_data:
-            subtask_id = subtask_data.get('id')
-            if subtask_id:
-                incoming_subtask_ids.add(subtask_id)
-                print(f"Processing subtask ID: {subtask_id}")
-            if subtask_id and subtask_id in current_subtasks:
-                subtask = current_subtasks[subtask_id]
-                for key, value in subtask_data.items():
-                    setattr(subtask, key, value)
-                subtask.save()
-                updated_subtasks.append(subtask)
-                print(f"Updated subtask: {subtask_id}")
-            elif subtask_id:
-                print(f"Subtask ID {subtask_id} not found in existing subtasks: {current_subtasks.keys()}")
-                raise serializers.ValidationError(f"Subtask ID {subtask_id} not found in current subtasks")
-            else:
-                # Skip creating new subtask
-                continue
-
-        print(f"Received subtasks data: {subtasks_data}")
-        print(f"Incoming subtask IDs: {incoming_subtask_ids}")
-
-        instance.subtasks.add(*updated_subtasks)
-
-        return instance
\ No newline at end of file
+
+
+class TaskListQuerySerializer(serializers.Serializer):
+    """
+    **TaskListQuerySerializer**
+
+    Validates the filters and the sort order of the task list:
+    - `status`, `priority`, `category` and `assigned_to` (repeat a parameter to match any of several values)
+    - `due_after` (inclusive) and `due_before` (exclusive), so `?due_before=<today>` lists overdue tasks
+    - `sort`, one of `SORTS`; `priority` sorts Low to Urgent by the stored priority code, `-priority` the other way
+
+    Every filter and sort leads with a column of one of the task indexes, so the list is read as an index range.
+    """
+    SORTS = {
+        'position': ['status', 'position', 'id'],
+        'priority': ['priority', 'id'],
+        '-priority': ['-priority', 'id'],
+        'due_date': [F('due_date').asc(nulls_last=True), 'id'],
+        '-due_date': [F('due_date').desc(nulls_last=True), 'id'],
+    }
+
+    status = serializers.ListField(child=serializers.ChoiceField(choices=Task.STATUS_CHOICES), required=False)
+    priority = serializers.ListField(child=serializers.ChoiceField(choices=Task.PRIORITY_CHOICES), required=False)
+    category = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+    assigned_to = serializers.ListField(child=serializers.IntegerField(min_value=1), required=False)
+    due_after = serializers.DateField(required=False)
+    due_before = serializers.DateField(required=False)
+    sort = serializers.ChoiceField(choices=list(SORTS), default='position')
+
+    def validate(self, data):
+        if 'due_after' in data and 'due_before' in data and data['due_after'] >= data['due_before']:
+            raise serializers.ValidationError('due_after must be before due_before.')
+        return data
+
+    def filter(self, queryset):
+        data = self.validated_data
+        if data.get('status'):
+            queryset = queryset.filter(status__in=data['status'])
+        if data.get('priority'):
+            queryset = queryset.filter(priority__in=data['priority'])
+        if data.get('category'):
+            queryset = queryset.filter(category_id__in=data['category'])
+        if data.get('assigned_to'):
+            # A subquery on the assignment table instead of a join, so tasks with several matching assignees appear once.
+            queryset = queryset.filter(id__in=Task.assigned_to.through.objects.filter(
+                contact_id__in=data['assigned_to']
+            ).values('task_id'))
+        if 'due_after' in data:
+            queryset = queryset.filter(due_date__gte=data['due_after'])
+        if 'due_before' in data:
+            queryset = queryset.filter(due_date__lt=data['due_before'])
+        return queryset.order_by(*self.SORTS[data['sort']])
+
+
+
+
+class TaskCalendarQuerySerializer(serializers.Serializer):
+    """
+    **TaskCalendarQuerySerializer**
+
+    Validates the `month` of the calendar endpoint (`YYYY-MM`, defaults to the current month)
+    and provides the half-open date range `[start, end)` it covers.
+    """
+    month = serializers.DateField(input_formats=['%Y-%m'], format='%Y-%m', required=False)
+
+    def validate_month(self, value):
+        return value.replace(day=1)
+
+    def get_range(self):
+        start = self.validated_data.get('month') or timezone.localdate().replace(day=1)
+        end = start.replace(year=start.year + 1, month=1) if start.month == 12 else start.replace(month=start.month + 1)
+        return start, end
+
+
+
+
+class TaskBoardQuerySerializer(serializers.Serializer):
+    """
+    **TaskBoardQuerySerializer**
+
+    Validates the board window: `per_column` cards per status column, optionally for a single `status`
+    continued after the opaque `cursor` returned with the previous window of that column.
+    """
+    per_column = serializers.IntegerField(min_value=1, max_value=200, default=20)
+    status = serializers.ChoiceField(choices=Task.STATUS_CHOICES, required=False)
+    cursor = serializers.CharField(required=False)
+
+    @staticmethod
+    def encode_cursor(position, task_id):
+        return urlsafe_b64encode(f'{position}:{task_id}'.encode()).decode().rstrip('=')
+
+    def validate_cursor(self, value):
+        try:
+            position, task_id = urlsafe_b64decode(value + '=' * (-len(value) % 4)).decode().rsplit(':', 1)
+            return position, int(task_id)
+        except ValueError:
+            raise serializers.ValidationError('Invalid cursor.')
+
+    def validate(self, data):
+        if 'cursor' in data and 'status' not in data:
+            raise serializers.ValidationError({'status': ['A cursor continues one column and needs its status.']})
+        return data
+
+
+
+
+class TaskMoveSerializer(serializers.Serializer):
+    """
+    **TaskMoveSerializer**
+
+    Validates a kanban move: the target `status` column (defaults to the task's current one) and the ids of the
+    neighbouring cards the task is dropped between. `after` is the card above, `before` the card below;
+    with only one of them the task is placed directly next to it, and with neither at the bottom of the column.
+    """
+    status = serializers.ChoiceField(choices=Task.STATUS_CHOICES, required=False)
+    after = serializers.IntegerField(required=False, allow_null=True)
+    before = serializers.IntegerField(required=False, allow_null=True)
+
+    def validate(self, data):
+        if data.get('after') is not None and data.get('after') == data.get('before'):
+            raise serializers.ValidationError('after and before must be different tasks.')
+        return data
+
+
+
+
+class BatchSubRequestSerializer(serializers.Serializer):
+    """
+    **BatchSubRequestSerializer**
+
+    Validates one sub-request of a batch: the HTTP `method`, the API `path` (with an optional query string),
+    an optional JSON `body` and `headers`, and an optional `id` under which later sub-requests can reference its response.
+    """
+    METHODS = ['GET', 'POST', 'PUT', 'PATCH', 'DELETE']
+
+    id = serializers.RegexField(r'^[\w-]+$', max_length=50, required=False)
+    method = serializers.ChoiceField(choices=METHODS)
+    path = serializers.RegexField(r'^/', max_length=500)
+    body = serializers.JSONField(required=False, allow_null=True)
+    headers = serializers.DictField(child=serializers.CharField(), required=False)
+
+
+
+
+class BatchSerializer(serializers.Serializer):
+    """
+    **BatchSerializer**
+
+    Validates a batch of up to `MAX_REQUESTS` sub-requests with unique ids, and whether they run in one transaction (`atomic`).
+    """
+    MAX_REQUESTS = 20
+
+    requests = serializers.ListField(child=BatchSubRequestSerializer(), allow_empty=False, max_length=MAX_REQUESTS)
+    atomic = serializers.BooleanField(default=False)
+
+    def validate_requests(self, value):
+        ids = [sub_request['id'] for sub_request in value if 'id' in sub_request]
+        if len(ids) != len(set(ids)):
+            raise serializers.ValidationError('Sub-request ids must be unique.')
+        return value
+
+
+
+
+TASK_LIST_FIELDS = (
+    'id', 'title', 'description', 'priority', 'due_date', 'category_id', 'creator_id', 'status', 'position',
+    'subtasks_total', 'subtasks_done', 'completed_at', 'archived', 'version',
+)
+
+
+def serialize_task_list(queryset, include_subtasks=True):
+    """
+    **serialize_task_list**
+
+    A read-only fast path producing the same output as `TaskSerializer(queryset, many=True).data`.
+    Task cards are built straight from `.values()` rows, the creator is joined into the same query,
+    and `assigned_to`/`subtasks` come from one grouped query each, so a list costs three queries
+    and no per-task serializer instantiation.
+    With `include_subtasks=False` the `subtasks` list is left out (cards only need the counters), saving the third query.
+    """
+    rows = list(queryset.values(*TASK_LIST_FIELDS, 'creator__name', 'creator__email'))
+    if not rows:
+        return []
+    datetime_field = serializers.DateTimeField()
+    task_ids = queryset.values('id')
+
+    assigned_to = {}
+    for task_id, contact_id in (
+        Task.assigned_to.through.objects.filter(task_id__in=task_ids)
+        .order_by('pk').values_list('task_id', 'contact_id')
+    ):
+        assigned_to.setdefault(task_id, []).append(contact_id)
+
+    subtasks = {}
+    if include_subtasks:
+        for task_id, subtask_id, text, completed in (
+            Subtask.objects.filter(task_id__in=task_ids)
+            .order_by('pk').values_list('task_id', 'id', 'text', 'completed')
+        ):
+            subtasks.setdefault(task_id, []).append({'id': subtask_id, 'text': text, 'completed': completed})
+
+    tasks = []
+    for row in rows:
+        task_id = row['id']
+        creator_id = row['creator_id']
+        due_date = row['due_date']
+        task = {
+            'id': task_id,
+            'title': row['title'],
+            'description': row['description'],
+            'priority': row['priority'],
+            'due_date': due_date.isoformat() if due_date is not None else None,
+            'category': row['category_id'],
+            'assigned_to': assigned_to.get(task_id, []),
+            'creator': None if creator_id is None else {
+                'id': creator_id, 'name': row['creator__name'], 'email': row['creator__email'],
+            },
+            'subtasks': subtasks.get(task_id, []),
+            'status': row['status'],
+            'position': row['position'],
+            'subtasks_total': row['subtasks_total'],
+            'subtasks_done': row['subtasks_done'],
+            'completed_at': datetime_field.to_representation(row['completed_at']) if row['completed_at'] else None,
+            'archived': row['archived'],
+            'version': row['version'],
+        }
+        if not include_subtasks:
+            del task['subtasks']
+        tasks.append(task)
+    return tasks
@@ -0,0 +1,20 @@
+"""
+sortkeys:
+
+Normalized keys for the alphabetical contact index. Names are compared by `name_sort_key`, which strips accents and
+case-folds, so "émile", "Emile" and "EMILE" sort together under any database collation; `name_group` is the letter
+the contacts page files a name under, with everything that does not start with a letter collected under `#`.
+"""
+import unicodedata
+
+OTHER_GROUP = '#'
+
+
+def name_sort_key(name):
+    decomposed = unicodedata.normalize('NFKD', name.strip())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def name_group(sort_key):
+    first = sort_key[:1].upper()
+    return first if 'A' <= first <= 'Z' else OTHER_GROUP
@@ -0,0 +1,59 @@
+"""
+versioning:
+
+Optimistic concurrency for tasks and contacts. Both carry a `version` that every change increments, and every API
+update is written with one conditional `UPDATE ... SET version = version + 1 WHERE id = ? AND version = ?`.
+If another request changed the row since it was read, the UPDATE matches no row and the update is rejected,
+so conflicting edits are detected without holding any lock between reading and writing.
+
+Clients state the version they edited either as `If-Match: "<version>"` (answered with 412 Precondition Failed)
+or as `version` in the request body (answered with 409 Conflict); both responses carry the current state.
+"""
+from django.db.models import F
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status
+
+
+class VersionConflict(Exception):
+    """
+    Raised when a row was changed by someone else between reading and writing it.
+    """
+
+
+def version_etag(instance):
+    return quote_etag(str(instance.version))
+
+
+def save_versioned(instance, **changes):
+    """
+    Writes `changes` and increments the version of `instance` in a single UPDATE conditional on the version it was read with.
+    Raises VersionConflict when the row has been changed since.
+    """
+    updated = type(instance)._base_manager.filter(pk=instance.pk, version=instance.version).update(
+        version=F('version') + 1, **changes
+    )
+    if not updated:
+        raise VersionConflict
+    instance.version += 1
+
+
+def failed_precondition(request, instance):
+    """
+    Returns the status code to reject an update of `instance` with when the client edited an older version
+    (412 for a non-matching `If-Match`, 409 for a stale body `version`), or None when the update may proceed.
+    A body `version` that is not an integer counts as stale.
+    """
+    if_match = request.headers.get('If-Match')
+    if if_match is not None:
+        etags = [etag.removeprefix('W/') for etag in parse_etags(if_match)]
+        if '*' not in etags and version_etag(instance) not in etags:
+            return status.HTTP_412_PRECONDITION_FAILED
+
+    version = request.data.get('version') if hasattr(request.data, 'get') else None
+    if version is not None:
+        try:
+            if int(version) != instance.version:
+                return status.HTTP_409_CONFLICT
+        except (TypeError, ValueError):
+            return status.HTTP_409_CONFLICT
+    return None
@@ -1,11 +1,10 @@
-import json, logging
-from django.shortcuts import get_object_or_404, render
+import logging
+from django.shortcuts import get_object_or_404
 from rest_framework import status
-from rest_framework.authtoken.views import ObtainAuthToken
 from rest_framework.authtoken.models import Token
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from .models import CustomUser, LoginHistory
+from .models import LoginHistory
 from .serializers import UserRegistrationSerializer, UserDetailsSerializer
 from django.contrib.auth import authenticate
 from django.contrib.auth import get_user_model
@@ -16,25 +15,34 @@ from django.views.generic.edit import CreateView
 from .forms import ContactForm
 from django.http import JsonResponse
 from django.views.decorators.http import require_safe
-from rest_framework.decorators import api_view
 from .models import Contact
-from .serializers import ContactSerializer
+from .serializers import ContactSerializer, ContactWorkloadSerializer
 from rest_framework import generics
+from rest_framework.pagination import PageNumberPagination
 from .models import Category
 from .serializers import CategorySerializer
 from .models import Subtask
 from .serializers import SubtaskSerializer
 from .models import Task
-from .serializers import TaskSerializer
+from .serializers import TaskSerializer, TaskBulkSerializer, TaskMoveSerializer, serialize_task_list
+from .serializers import TaskListQuerySerializer, TaskCalendarQuerySerializer, TaskBoardQuerySerializer, BatchSerializer
+from .ordering import MAX_KEY_LENGTH, append_positions, key_between, neighbour_keys, rebalance_column
+from .counters import adjust_subtask_counters
+from .includes import compound_contact_list, compound_task_list, parse_include
+from .sortkeys import OTHER_GROUP
+from .versioning import VersionConflict, failed_precondition, save_versioned, version_etag
+from .idempotency import idempotent
+from .batch import execute_batch
+from rest_framework.exceptions import ValidationError
+from .renderers import ORJSONRenderer
+from django.utils.http import parse_etags, quote_etag
+import hashlib
+from django.db import router, transaction
+from django.db.models import Case, Count, F, Q, Value, When, Window
+from django.db.models.functions import RowNumber
 from rest_framework.permissions import AllowAny
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
-from rest_framework.views import APIView
-from rest_framework.response import Response
-from rest_framework import status
-from rest_framework.permissions import AllowAny
-from rest_framework.authtoken.models import Token
-from django.contrib.auth import authenticate
 
 
 
@@ -149,6 +157,10 @@ ContactListCreateView:
 
 Handles the retrieval and creation of Contact objects for the currently authenticated user. 
 Filters the contacts based on the user and ensures that new contacts are associated with the user making the request.
+The list includes each contact's task workload, loaded together with the owner in a single annotated query.
+Contacts are listed alphabetically by their normalized name; `?group=<letter>` (or `?group=%23` for names not starting
+with a letter) returns a single letter group from the per-user group index.
+Creation honours an `Idempotency-Key` header, so retried POSTs replay the first response (see `join_backend.idempotency`).
 """
     queryset = Contact.objects.all()
     serializer_class = ContactSerializer
@@ -156,7 +168,30 @@ Filters the contacts based on the user and ensures that new contacts are associa
 
     def get_queryset(self):
         user = self.request.user
-        return Contact.objects.filter(user=user)
+        contacts = Contact.objects.filter(user=user)
+        group = self.request.query_params.get('group')
+        if group is not None and self.request.method == 'GET':
+            group = group.upper()
+            if group != OTHER_GROUP and not (len(group) == 1 and 'A' <= group <= 'Z'):
+                raise ValidationError({'group': ['Expected a single letter or #.']})
+            contacts = contacts.filter(group=group)
+        return contacts.select_related('user').with_workload().order_by('sort_key', 'id')
+
+    def get_serializer_class(self):
+        if self.request.method == 'GET':
+            return ContactWorkloadSerializer
+        return ContactSerializer
+
+    def list(self, request, *args, **kwargs):
+        include = parse_include(request, ['users'])
+        response = super().list(request, *args, **kwargs)
+        if include is not None:
+            response.data = compound_contact_list(response.data, include)
+        return response
+
+    @idempotent
+    def post(self, request, *args, **kwargs):
+        return super().post(request, *args, **kwargs)
 
     def perform_create(self, serializer):
         print("Authorization Header:", self.request.headers.get('Authorization'))
@@ -166,12 +201,31 @@ Filters the contacts based on the user and ensures that new contacts are associa
 
 
 
+class ContactGroupsAPIView(APIView):
+    """
+ContactGroupsAPIView:
+
+Returns the letter groups of the current user's contacts with the number of contacts in each, in alphabetical order,
+counted with one grouped query on the per-user group index. The contacts page renders its letter index from it
+and loads the contacts of a letter with `addcontact/?group=<letter>`.
+"""
+    def get(self, request):
+        groups = (
+            Contact.objects.filter(user=request.user).order_by('group').values('group').annotate(count=Count('id'))
+        )
+        return Response(list(groups), status=status.HTTP_200_OK)
+
+
+
+
 class ContactDetailView(APIView):
     """
 ContactDetailView:
 
 Provides detailed view, update, and deletion capabilities for individual contacts based on their ID. 
 Handles errors such as when a contact is not found, ensuring appropriate responses are returned.
+Responses carry the contact's version as ETag; updates of an older version (`If-Match` or `version`) are rejected
+with 412/409 and the current contact (see `join_backend.versioning`).
 """
     """
     Retrieve a contact by id.
@@ -180,7 +234,7 @@ Handles errors such as when a contact is not found, ensuring appropriate respons
         try:
             contact = Contact.objects.get(pk=id)
             serializer = ContactSerializer(contact)
-            return Response(serializer.data)
+            return Response(serializer.data, headers={'ETag': version_etag(contact)})
         except Contact.DoesNotExist:
             return Response({'error': 'Contact not found'}, status=status.HTTP_404_NOT_FOUND)
         
@@ -195,11 +249,23 @@ Handles errors such as when a contact is not found, ensuring appropriate respons
         
     def put(self, request, id):
         contact = get_object_or_404(Contact, pk=id)
+        conflict = failed_precondition(request, contact)
+        if conflict:
+            return self.conflict_response(contact, conflict)
         serializer = ContactSerializer(contact, data=request.data)
         if serializer.is_valid():
-            serializer.save()
-            return Response(serializer.data)
+            try:
+                serializer.save()
+            except VersionConflict:
+                return self.conflict_response(get_object_or_404(Contact, pk=id), status.HTTP_409_CONFLICT)
+            return Response(serializer.data, headers={'ETag': version_etag(contact)})
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    def conflict_response(self, contact, status_code):
+        return Response(
+            {'message': 'The contact was changed by someone else', 'current': ContactSerializer(contact).data},
+            status=status_code, headers={'ETag': version_etag(contact)},
+        )
     
 
 
@@ -310,9 +376,12 @@ Ensures correct handling of requests, including returning errors if the subtask
     def put(self, request, pk):
         subtask = self.get_object(pk)
         if not isinstance(subtask, Response):
+            was_completed = subtask.completed
             serializer = SubtaskSerializer(subtask, data=request.data)
             if serializer.is_valid():
-                serializer.save()
+                with transaction.atomic():
+                    subtask = serializer.save()
+                    adjust_subtask_counters(subtask.task_id, done=int(subtask.completed) - int(was_completed))
                 return Response(serializer.data)
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         return subtask
@@ -320,7 +389,10 @@ Ensures correct handling of requests, including returning errors if the subtask
     def delete(self, request, pk):
         subtask = self.get_object(pk)
         if not isinstance(subtask, Response):
-            subtask.delete()
+            with transaction.atomic():
+                task_id, completed = subtask.task_id, subtask.completed
+                subtask.delete()
+                adjust_subtask_counters(task_id, total=-1, done=-int(completed))
             return Response(status=status.HTTP_204_NO_CONTENT)
         return subtask
     
@@ -334,12 +406,26 @@ TaskListCreateAPIView:
 
 Manages the listing and creation of tasks associated with the currently authenticated user. 
 Handles task creation with nested subtasks and relationships to contacts and categories.
+The list accepts `?include=users,contacts,categories` to side-load related objects once in a top-level `included` map.
+Archived tasks are left out; they are listed by TaskArchiveAPIView.
+The list can be filtered by status, priority, category, assignee and due-date range and sorted by position, priority or due date
+(see TaskListQuerySerializer), so clients only fetch the slice they render.
+Creation honours an `Idempotency-Key` header, so retried POSTs replay the first response (see `join_backend.idempotency`).
 """
     def get(self, request):
-        tasks = Task.objects.filter(creator=request.user)
-        serializer = TaskSerializer(tasks, many=True)
-        return Response(serializer.data)
-
+        query = TaskListQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        tasks = query.filter(Task.objects.active().filter(creator=request.user))
+        # Cards only need the subtask counters; `?subtasks=false` skips loading the subtasks themselves.
+        include_subtasks = request.query_params.get('subtasks', 'true').lower() not in ('false', '0')
+        include = parse_include(request, ['users', 'contacts', 'categories'])
+        data = serialize_task_list(tasks, include_subtasks=include_subtasks)
+        if include is not None:
+            data = compound_task_list(data, include, request.user)
+        return Response(data)
+
+    @idempotent
     def post(self, request):
         # Log the incoming data
         print("Received data:", request.data)  # Log the raw data
@@ -363,10 +449,15 @@ TaskDetailAPIView:
 
 Provides detailed view, update, and deletion capabilities for individual tasks based on their ID. 
 Handles complex updates, including managing subtasks and ensuring data integrity during task modifications.
+Updates are diff-based: only changed columns, assignee links and subtasks are written, fields left out of a request
+are left alone, and the task with its creator, assignees and subtasks is read once up front.
+Responses carry the task's version as ETag. An update of an older version (`If-Match` or `version`), or one that loses
+a race against a concurrent update, is rolled back and answered with 412/409 and the current task
+(see `join_backend.versioning`).
 """
     def get_object(self, pk):
         try:
-            return Task.objects.get(pk=pk)
+            return Task.objects.select_related('creator').prefetch_related('assigned_to', 'subtasks').get(pk=pk)
         except Task.DoesNotExist:
             return Response({'message': 'The task does not exist'}, status=status.HTTP_404_NOT_FOUND)
 
@@ -375,49 +466,97 @@ Handles complex updates, including managing subtasks and ensuring data integrity
         if isinstance(task, Response):
             return task
         serializer = TaskSerializer(task)
-        return Response(serializer.data)
+        return Response(serializer.data, headers={'ETag': version_etag(task)})
 
     def put(self, request, pk):
         task = self.get_object(pk)
         if isinstance(task, Response):
             return task
+        conflict = failed_precondition(request, task)
+        if conflict:
+            return self.conflict_response(task, conflict)
 
+        try:
+            with transaction.atomic():
+                return self.update(request, task)
+        except VersionConflict:
+            return self.conflict_response(self.get_object(pk), status.HTTP_409_CONFLICT)
+
+    def conflict_response(self, task, status_code):
+        return Response(
+            {'message': 'The task was changed by someone else', 'current': TaskSerializer(task).data},
+            status=status_code, headers={'ETag': version_etag(task)},
+        )
+
+    def update(self, request, task):
         serializer = TaskSerializer(task, data=request.data, partial=True, context={'request': request})
         if serializer.is_valid():
+            # Subtasks are validated before anything is written: ids must belong to the task's subtasks,
+            # and only the validated `text` and `completed` of new and changed subtasks are used.
+            subtasks_data = request.data.get('subtasks') or []
+            existing = {subtask.id: subtask for subtask in task.subtasks.all()}
+            for subtask_data in subtasks_data:
+                subtask_id = subtask_data.get('id')
+                if subtask_id is not None and subtask_id not in existing:
+                    return Response({'message': f'Subtask ID {subtask_id} not found'}, status=status.HTTP_400_BAD_REQUEST)
+            updates = [subtask_data for subtask_data in subtasks_data if subtask_data.get('id') is not None]
+            new_subtasks = SubtaskSerializer(
+                data=[subtask_data for subtask_data in subtasks_data if subtask_data.get('id') is None], many=True
+            )
+            changed_subtasks = SubtaskSerializer(data=updates, many=True, partial=True)
+            for subtasks in (new_subtasks, changed_subtasks):
+                if not subtasks.is_valid():
+                    return Response({'subtasks': subtasks.errors}, status=status.HTTP_400_BAD_REQUEST)
             updated_task = serializer.save()
 
-            # Handle subtasks
-            subtasks_data = request.data.get('subtasks', [])
-            existing_subtask_ids = set(task.subtasks.values_list('id', flat=True))
-
-            print(f"Existing subtask IDs: {existing_subtask_ids}")
-            print(f"Received subtasks data: {subtasks_data}")
+            # Handle subtasks; a request without a subtasks list leaves them unchanged.
+            if 'subtasks' not in request.data:
+                return Response(serializer.data, headers={'ETag': version_etag(updated_task)})
+            existing_subtask_ids = set(existing)
+            total_delta = done_delta = 0
+            subtasks_changed = False
 
             incoming_subtask_ids = {subtask_data.get('id') for subtask_data in subtasks_data if subtask_data.get('id')}
-            print(f"Incoming subtask IDs: {incoming_subtask_ids}")
 
-            # Update existing subtasks
-            for subtask_data in subtasks_data:
-                subtask_id = subtask_data.get('id')
-                if subtask_id in existing_subtask_ids:
-                    # Update existing subtask
-                    Subtask.objects.filter(id=subtask_id).update(**subtask_data)
-                    print(f"Updated subtask ID: {subtask_id}")
-                elif subtask_id is None:
-                    # Create new subtask and associate with the task
-                    new_subtask = Subtask.objects.create(**subtask_data)
-                    updated_task.subtasks.add(new_subtask)
-                    print(f"Created new subtask with ID: {new_subtask.id}")
-                else:
-                    print(f"Subtask ID {subtask_id} not found in existing subtasks")
-                    return Response({'message': f'Subtask ID {subtask_id} not found'}, status=status.HTTP_400_BAD_REQUEST)
+            # Update existing subtasks, writing only the values that differ
+            for subtask_data, values in zip(updates, changed_subtasks.validated_data):
+                subtask = existing[subtask_data['id']]
+                changes = {key: value for key, value in values.items() if getattr(subtask, key) != value}
+                if changes:
+                    Subtask.objects.filter(id=subtask.id, task=updated_task).update(**changes)
+                    subtasks_changed = True
+                    if 'completed' in changes:
+                        done_delta += int(changes['completed']) - int(subtask.completed)
+                    # Kept in step with the row, so a subtask listed twice is not counted twice.
+                    for key, value in changes.items():
+                        setattr(subtask, key, value)
+
+            # Create the new subtasks and associate them with the task
+            if new_subtasks.validated_data:
+                Subtask.objects.bulk_create(
+                    [Subtask(task=updated_task, **subtask_data) for subtask_data in new_subtasks.validated_data]
+                )
+                subtasks_changed = True
+                total_delta += len(new_subtasks.validated_data)
+                done_delta += sum(1 for subtask_data in new_subtasks.validated_data if subtask_data.get('completed'))
 
             # Remove subtasks that are not in the request data
-            for subtask_id in existing_subtask_ids - incoming_subtask_ids:
-                Subtask.objects.filter(id=subtask_id).delete()
-                print(f"Removed subtask ID: {subtask_id}")
-
-            return Response(serializer.data)
+            removed_subtask_ids = existing_subtask_ids - incoming_subtask_ids
+            if removed_subtask_ids:
+                Subtask.objects.filter(id__in=removed_subtask_ids, task=updated_task).delete()
+                subtasks_changed = True
+                total_delta -= len(removed_subtask_ids)
+                done_delta -= sum(existing[subtask_id].completed for subtask_id in removed_subtask_ids)
+
+            if total_delta or done_delta:
+                adjust_subtask_counters(updated_task.pk, total=total_delta, done=done_delta)
+                updated_task.refresh_from_db(fields=['subtasks_total', 'subtasks_done'])
+            if subtasks_changed:
+                if not serializer.version_saved:
+                    save_versioned(updated_task)
+                updated_task._prefetched_objects_cache.pop('subtasks', None)
+
+            return Response(serializer.data, headers={'ETag': version_etag(updated_task)})
 
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
@@ -426,4 +565,276 @@ Handles complex updates, including managing subtasks and ensuring data integrity
         if isinstance(task, Response):
             return task
         task.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
\ No newline at end of file
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+
+
+class TaskBoardAPIView(APIView):
+    """
+TaskBoardAPIView:
+
+Returns the first `per_column` cards of every status column with the column's total and a cursor for the next cards,
+so the initial board costs a few rows per column however many tasks are done.
+The cards are picked with `ROW_NUMBER() OVER (PARTITION BY status ORDER BY position, id)` in one query that also counts
+each column; `?status=<column>&cursor=<cursor>` continues a single column with a keyset range on its position index.
+"""
+    def get(self, request):
+        query = TaskBoardQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        per_column = query.validated_data['per_column']
+        tasks = Task.objects.active().filter(creator=request.user)
+        statuses = [choice for choice, _ in Task.STATUS_CHOICES]
+        if 'status' in query.validated_data:
+            statuses = [query.validated_data['status']]
+            tasks = tasks.filter(status__in=statuses)
+        totals = dict.fromkeys(statuses, 0)
+
+        cursor = query.validated_data.get('cursor')
+        if cursor is not None:
+            totals[statuses[0]] = tasks.count()
+            position, task_id = cursor
+            tasks = tasks.filter(Q(position__gt=position) | Q(position=position, id__gt=task_id))
+
+        window = {'partition_by': [F('status')]}
+        rows = list(
+            tasks.annotate(
+                row=Window(RowNumber(), order_by=[F('position').asc(), F('id').asc()], **window),
+                column_total=Window(Count('id'), **window),
+            )
+            .filter(row__lte=per_column)
+            .order_by('status', 'row')
+            .values_list('id', 'status', 'position', 'row', 'column_total')
+        )
+
+        remaining = dict.fromkeys(statuses, 0)
+        for _, task_status, _, _, column_total in rows:
+            remaining[task_status] = column_total
+            if cursor is None:
+                totals[task_status] = column_total
+
+        cards = {task['id']: task for task in serialize_task_list(Task.objects.filter(id__in=[row[0] for row in rows]))}
+        columns = {
+            task_status: {'total': totals[task_status], 'tasks': [], 'cursor': None} for task_status in statuses
+        }
+        for task_id, task_status, position, row, _ in rows:
+            column = columns[task_status]
+            column['tasks'].append(cards[task_id])
+            if row == per_column and remaining[task_status] > per_column:
+                column['cursor'] = TaskBoardQuerySerializer.encode_cursor(position, task_id)
+
+        return Response({'per_column': per_column, 'columns': columns}, status=status.HTTP_200_OK)
+
+
+
+
+class TaskCalendarAPIView(APIView):
+    """
+TaskCalendarAPIView:
+
+Returns the current user's active tasks due in one month (`?month=YYYY-MM`), bucketed per day with their count and ids.
+The buckets are built from a single `(due_date, id)` query that is a range scan on the (creator, due_date) index,
+so the calendar never loads whole tasks; the frontend fetches the ones it shows by id.
+"""
+    def get(self, request):
+        query = TaskCalendarQuerySerializer(data=request.query_params)
+        if not query.is_valid():
+            return Response(query.errors, status=status.HTTP_400_BAD_REQUEST)
+        start, end = query.get_range()
+
+        days = {}
+        for due_date, task_id in (
+            Task.objects.active().filter(creator=request.user, due_date__gte=start, due_date__lt=end)
+            .order_by('due_date', 'id').values_list('due_date', 'id')
+        ):
+            days.setdefault(due_date, []).append(task_id)
+
+        return Response({
+            'month': start.strftime('%Y-%m'),
+            'days': [
+                {'date': due_date.isoformat(), 'count': len(ids), 'ids': ids} for due_date, ids in days.items()
+            ],
+        }, status=status.HTTP_200_OK)
+
+
+
+
+class TaskArchivePagination(PageNumberPagination):
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+
+
+
+class TaskArchiveAPIView(APIView):
+    """
+TaskArchiveAPIView:
+
+Lists the current user's archived tasks, most recently completed first, one page at a time (`?page=`, `?page_size=`).
+Only the ids of the requested page are read from the archive index; the page itself is built with the task list fast path.
+"""
+    pagination_class = TaskArchivePagination
+
+    def get(self, request):
+        paginator = self.pagination_class()
+        archived = Task.objects.archived().filter(creator=request.user).order_by('-completed_at', '-id')
+        ids = paginator.paginate_queryset(archived.values_list('id', flat=True), request, view=self)
+        page = {task['id']: task for task in serialize_task_list(Task.objects.filter(id__in=ids))}
+        return paginator.get_paginated_response([page[task_id] for task_id in ids])
+
+
+
+
+class TaskBulkAPIView(APIView):
+    """
+TaskBulkAPIView:
+
+Applies one operation to many of the current user's tasks in a single request, e.g. moving several cards or clearing a column.
+Each operation runs as one ownership-scoped UPDATE or DELETE (plus bulk M2M inserts/deletes for assignees) inside one transaction,
+so the number of queries does not depend on how many tasks are selected. Ids that do not belong to the user are ignored.
+"""
+    FIELD_OPERATIONS = {
+        'set_priority': 'priority',
+        'set_category': 'category',
+    }
+
+    def post(self, request):
+        serializer = TaskBulkSerializer(data=request.data, context={'request': request})
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        op = serializer.validated_data['op']
+        value = serializer.validated_data.get('value')
+        tasks = Task.objects.filter(creator=request.user, id__in=serializer.validated_data['ids'])
+        Assignment = Task.assigned_to.through
+
+        with transaction.atomic():
+            if op == 'set_status':
+                # Tasks entering the column are appended to its end in their board order; tasks already in it stay put.
+                moving = list(tasks.exclude(status=value).order_by('status', 'position', 'id').values_list('id', flat=True))
+                positions = append_positions(request.user.id, value, len(moving))
+                count = tasks.update_status(value, position=Case(
+                    *[When(id=task_id, then=Value(position)) for task_id, position in zip(moving, positions)],
+                    default=F('position'),
+                ))
+            elif op in self.FIELD_OPERATIONS:
+                count = tasks.update(**{self.FIELD_OPERATIONS[op]: value}, version=F('version') + 1)
+            elif op == 'add_assignee':
+                task_ids = list(tasks.values_list('id', flat=True))
+                Assignment.objects.bulk_create(
+                    [Assignment(task_id=task_id, contact_id=value.id) for task_id in task_ids],
+                    ignore_conflicts=True
+                )
+                tasks.update(version=F('version') + 1)
+                count = len(task_ids)
+            elif op == 'remove_assignee':
+                count, _ = Assignment.objects.filter(task__in=tasks, contact_id=value.id).delete()
+                tasks.update(version=F('version') + 1)
+            else:
+                count = tasks.delete()[1].get(Task._meta.label, 0)
+
+        return Response({'op': op, 'count': count}, status=status.HTTP_200_OK)
+
+
+
+
+class TaskMoveAPIView(APIView):
+    """
+TaskMoveAPIView:
+
+Moves a task to a new place on the board, optionally into another status column, between the neighbouring cards `after` and `before`.
+An omitted neighbour is looked up in the column (see `join_backend.ordering.neighbour_keys`); with neither the task goes to the bottom.
+A fractional position key is generated between the neighbours' keys, so a move writes exactly one row however long the column is.
+Only if the neighbours' keys leave no room (or grew too long) is the column rebalanced first.
+"""
+    def post(self, request, pk):
+        serializer = TaskMoveSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        task = Task.objects.filter(pk=pk, creator=request.user).only('id', 'status').first()
+        if task is None:
+            return Response({'message': 'The task does not exist'}, status=status.HTTP_404_NOT_FOUND)
+
+        target_status = serializer.validated_data.get('status', task.status)
+        after_id = serializer.validated_data.get('after')
+        before_id = serializer.validated_data.get('before')
+        neighbour_ids = [neighbour_id for neighbour_id in (after_id, before_id) if neighbour_id is not None]
+        column = Task.objects.active().filter(creator=request.user, status=target_status).exclude(pk=task.pk)
+
+        with transaction.atomic():
+            neighbours = dict(column.filter(id__in=neighbour_ids).values_list('id', 'position'))
+            missing = [neighbour_id for neighbour_id in neighbour_ids if neighbour_id not in neighbours]
+            if missing:
+                return Response(
+                    {'message': f'Tasks {missing} are not in the {target_status} column'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+            try:
+                position = key_between(*neighbour_keys(column, neighbours.get(after_id), neighbours.get(before_id)))
+            except ValueError:
+                position = None
+            if position is None or len(position) > MAX_KEY_LENGTH:
+                rebalance_column(request.user.id, target_status)
+                neighbours = dict(column.filter(id__in=neighbour_ids).values_list('id', 'position'))
+                position = key_between(*neighbour_keys(column, neighbours.get(after_id), neighbours.get(before_id)))
+
+            Task.objects.filter(pk=task.pk).update_status(target_status, position=position)
+
+        return Response({'id': task.pk, 'status': target_status, 'position': position}, status=status.HTTP_200_OK)
+
+
+
+
+class BootstrapAPIView(APIView):
+    """
+BootstrapAPIView:
+
+Returns everything the board needs on startup (the user, their tasks, contacts and the categories) in one response,
+replacing four sequential requests. All lists are read inside one transaction on the database the reads are routed to
+(a replica, see `join_backend.routers`) and use the same queries as their list endpoints.
+The response carries an ETag over its content, and a matching `If-None-Match` is answered with `304 Not Modified`.
+"""
+    def get(self, request):
+        with transaction.atomic(using=router.db_for_read(Task)):
+            data = {
+                'user': UserDetailsSerializer(request.user).data,
+                'tasks': serialize_task_list(
+                    Task.objects.active().filter(creator=request.user).order_by('status', 'position', 'id')
+                ),
+                'contacts': ContactWorkloadSerializer(
+                    Contact.objects.filter(user=request.user).select_related('user').with_workload().order_by('sort_key', 'id'),
+                    many=True
+                ).data,
+                'categories': CategorySerializer(Category.objects.order_by('id'), many=True).data,
+            }
+
+        etag = quote_etag(hashlib.md5(ORJSONRenderer().render(data), usedforsecurity=False).hexdigest())
+        headers = {'ETag': etag, 'Cache-Control': 'private, no-cache'}
+        if etag in parse_etags(request.headers.get('If-None-Match', '')):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(data, status=status.HTTP_200_OK, headers=headers)
+
+
+
+
+class BatchAPIView(APIView):
+    """
+BatchAPIView:
+
+Executes an ordered list of API calls in one round trip, e.g. creating a contact, a category and a task that uses both.
+The sub-requests are dispatched through the regular views with the batch request's authentication, can reference
+earlier responses as `{{<id>.<field>}}`, and with `atomic: true` run in one transaction that is rolled back at the first
+failing sub-request (see `join_backend.batch`). The response lists the status and body of every executed sub-request.
+"""
+    def post(self, request):
+        serializer = BatchSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        responses, committed = execute_batch(
+            request, serializer.validated_data['requests'], atomic=serializer.validated_data['atomic']
+        )
+        return Response({'committed': committed, 'responses': responses}, status=status.HTTP_200_OK)
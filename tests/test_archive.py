@@ -0,0 +1,99 @@
+import io
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from join_backend.archive import archive_done_tasks
+from join_backend.models import Task
+
+User = get_user_model()
+
+
+
+
+class TaskArchiveTest(TestCase):
+    """
+TaskArchiveTest:
+
+Tests the archive tier for done tasks, ensuring that completion times follow status changes, that only tasks done
+for longer than the archive age are archived, that archived tasks leave the board and are listed page by page
+under tasks/archive/, and that reopening an archived task brings it back.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+        old = timezone.now() - timedelta(days=60)
+        self.open_task = Task.objects.create(title='Open', priority='Low', creator=self.user, position='i')
+        self.recent = Task.objects.create(
+            title='Recent', priority='Low', creator=self.user, status='done', position='i', completed_at=timezone.now()
+        )
+        self.old_tasks = [
+            Task.objects.create(
+                title=f'Old {i}', priority='Low', creator=self.user, status='done', position=str(i + 1),
+                completed_at=old + timedelta(days=i)
+            )
+            for i in range(3)
+        ]
+
+    def board_titles(self):
+        response = self.client.get(reverse('task-list'))
+        return [task['title'] for task in response.data]
+
+    def test_status_changes_track_completion(self):
+        response = self.client.post(reverse('task-list'), {'title': 'Done', 'priority': 'Low', 'status': 'done'}, format='json')
+        self.assertIsNotNone(response.data['completed_at'])
+
+        self.client.put(reverse('task-detail', kwargs={'pk': self.open_task.pk}), {'status': 'done'}, format='json')
+        self.open_task.refresh_from_db()
+        self.assertIsNotNone(self.open_task.completed_at)
+
+        self.client.post(reverse('task-move', kwargs={'pk': self.open_task.pk}), {'status': 'todo'}, format='json')
+        self.open_task.refresh_from_db()
+        self.assertIsNone(self.open_task.completed_at)
+
+    def test_bulk_status_keeps_existing_completion_time(self):
+        completed_at = self.old_tasks[0].completed_at
+        self.client.post(reverse('task-bulk'), {
+            'ids': [self.old_tasks[0].pk, self.open_task.pk], 'op': 'set_status', 'value': 'done',
+        }, format='json')
+        self.old_tasks[0].refresh_from_db()
+        self.open_task.refresh_from_db()
+        self.assertEqual(self.old_tasks[0].completed_at, completed_at)
+        self.assertIsNotNone(self.open_task.completed_at)
+
+    def test_archive_removes_old_done_tasks_from_board(self):
+        self.assertEqual(archive_done_tasks(days=30, batch_size=2), 3)
+        self.assertEqual(self.board_titles(), ['Open', 'Recent'])
+        self.assertEqual(Task.objects.archived().count(), 3)
+
+    def test_archive_list_is_paginated(self):
+        archive_done_tasks(days=30)
+        response = self.client.get(reverse('task-archive'), {'page_size': 2})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual([task['title'] for task in response.data['results']], ['Old 2', 'Old 1'])
+        self.assertTrue(all(task['archived'] for task in response.data['results']))
+
+        response = self.client.get(reverse('task-archive'), {'page_size': 2, 'page': 2})
+        self.assertEqual([task['title'] for task in response.data['results']], ['Old 0'])
+
+    def test_reopening_restores_task(self):
+        archive_done_tasks(days=30)
+        task = self.old_tasks[0]
+        self.client.post(reverse('task-move', kwargs={'pk': task.pk}), {'status': 'todo'}, format='json')
+        self.assertEqual(self.board_titles(), ['Open', 'Old 0', 'Recent'])
+
+    def test_command(self):
+        out = io.StringIO()
+        call_command('archive_tasks', '--days', '30', '--dry-run', stdout=out)
+        self.assertIn('Found 3 tasks to archive.', out.getvalue())
+        self.assertFalse(Task.objects.archived().exists())
+
+        call_command('archive_tasks', '--days', '30', stdout=out)
+        self.assertIn('Archived 3 tasks.', out.getvalue())
+        self.assertEqual(Task.objects.archived().count(), 3)
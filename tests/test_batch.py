@@ -0,0 +1,132 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from join_backend.models import Category, Contact, Task
+
+User = get_user_model()
+
+
+
+
+class BatchAPIViewTest(TestCase):
+    """
+BatchAPIViewTest:
+
+Tests the batch endpoint, verifying that sub-requests are dispatched in order through the regular views with the
+batch request's user, that later sub-requests can reference earlier responses, that atomic batches are rolled back
+at the first failure without storing idempotent responses, that an idempotent create is not repeated within a batch,
+that unexpected errors are reported per sub-request, and that invalid batches and non-API paths are rejected.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.token = Token.objects.create(user=self.user)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        self.url = reverse('batch')
+
+    def batch(self, requests, **data):
+        return self.client.post(self.url, {'requests': requests, **data}, format='json')
+
+    def save_task_flow(self):
+        return [
+            {'id': 'contact', 'method': 'POST', 'path': '/addcontact/',
+             'body': {'name': 'Anna', 'email': 'anna@example.com', 'phone': '1'}},
+            {'id': 'category', 'method': 'POST', 'path': '/categories/', 'body': {'name': 'Work', 'color': '#FF0000'}},
+            {'id': 'task', 'method': 'POST', 'path': '/tasks/', 'body': {
+                'title': 'Task', 'priority': 'Low', 'category': '{{category.id}}', 'assigned_to': ['{{contact.id}}'],
+            }},
+            {'method': 'POST', 'path': '/tasks/{{task.id}}/move/', 'body': {'status': 'done'}},
+        ]
+
+    def test_references_to_earlier_responses(self):
+        response = self.batch(self.save_task_flow())
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data['committed'])
+        self.assertEqual([result['status'] for result in response.data['responses']], [201, 201, 201, 200])
+        self.assertEqual([result['id'] for result in response.data['responses']], ['contact', 'category', 'task', '3'])
+        task = Task.objects.get()
+        self.assertEqual((task.creator, task.status), (self.user, 'done'))
+        self.assertEqual(task.category, Category.objects.get())
+        self.assertEqual(list(task.assigned_to.all()), [Contact.objects.get(user=self.user)])
+
+    def test_authenticates_once(self):
+        # The only query is the token lookup of the batch request itself.
+        with self.assertNumQueries(1):
+            response = self.batch([{'method': 'GET', 'path': '/user/details/'}] * 3)
+        self.assertEqual([result['body']['email'] for result in response.data['responses']], [self.user.email] * 3)
+
+    def test_failed_dependency(self):
+        flow = self.save_task_flow()
+        flow[1]['body'] = {'name': 'Work', 'color': 'red'}
+        response = self.batch(flow)
+        self.assertEqual([result['status'] for result in response.data['responses']], [201, 400, 424, 424])
+        self.assertEqual(Contact.objects.count(), 1)
+        self.assertFalse(Task.objects.exists())
+
+    def test_atomic_batch_rolls_back_at_first_failure(self):
+        flow = self.save_task_flow()
+        flow[2]['body']['priority'] = 'Unknown'
+        response = self.batch(flow, atomic=True)
+        self.assertFalse(response.data['committed'])
+        self.assertEqual([result['status'] for result in response.data['responses']], [201, 201, 400])
+        self.assertFalse(Contact.objects.exists())
+        self.assertFalse(Category.objects.exists())
+
+    def test_rolled_back_batch_does_not_store_idempotent_responses(self):
+        create = {'method': 'POST', 'path': '/tasks/', 'body': {'title': 'Task', 'priority': 'Low'},
+                  'headers': {'Idempotency-Key': 'k1'}}
+        response = self.batch([create, {'method': 'GET', 'path': '/missing/'}], atomic=True)
+        self.assertFalse(response.data['committed'])
+        retry = self.client.post(reverse('task-list'), create['body'], format='json', HTTP_IDEMPOTENCY_KEY='k1')
+        self.assertEqual(retry.status_code, 201)
+        self.assertNotIn('Idempotent-Replayed', retry)
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_duplicate_in_uncommitted_batch_is_replayed(self):
+        create = {'method': 'POST', 'path': '/tasks/', 'body': {'title': 'Task', 'priority': 'Low'},
+                  'headers': {'Idempotency-Key': 'k1'}}
+        response = self.batch([create, create], atomic=True)
+        self.assertTrue(response.data['committed'])
+        first, duplicate = response.data['responses']
+        self.assertEqual(duplicate['status'], 201)
+        self.assertEqual(duplicate['body'], first['body'])
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_unexpected_error_in_sub_request(self):
+        requests = [
+            {'method': 'POST', 'path': '/addcontact/', 'body': {'name': 'Anna', 'email': 'anna@example.com', 'phone': '1'}},
+            {'method': 'GET', 'path': '/tasks/'},
+            {'method': 'GET', 'path': '/user/details/'},
+        ]
+        with mock.patch('join_backend.views.serialize_task_list', side_effect=RuntimeError), \
+                self.assertLogs('join_backend.batch', 'ERROR'):
+            response = self.batch(requests)
+            self.assertEqual([result['status'] for result in response.data['responses']], [201, 500, 200])
+            self.assertEqual(Contact.objects.count(), 1)
+
+            response = self.batch(requests, atomic=True)
+            self.assertFalse(response.data['committed'])
+            self.assertEqual([result['status'] for result in response.data['responses']], [201, 500])
+            self.assertEqual(Contact.objects.count(), 1)
+
+    def test_rejects_non_api_paths(self):
+        response = self.batch([
+            {'method': 'GET', 'path': '/batch/'},
+            {'method': 'GET', 'path': '/set-csrf/'},
+            {'method': 'GET', 'path': '/missing/'},
+        ])
+        self.assertEqual([result['status'] for result in response.data['responses']], [400, 400, 404])
+
+    def test_invalid_batch(self):
+        self.assertEqual(self.batch([]).status_code, 400)
+        duplicate = {'id': 'a', 'method': 'GET', 'path': '/tasks/'}
+        self.assertEqual(self.batch([duplicate, duplicate]).status_code, 400)
+        self.assertEqual(self.batch([{'method': 'TRACE', 'path': '/tasks/'}]).status_code, 400)
+
+    def test_requires_authentication(self):
+        self.client.credentials()
+        self.assertEqual(self.batch([{'method': 'GET', 'path': '/tasks/'}]).status_code, 401)
@@ -0,0 +1,82 @@
+import io
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from join_backend.models import Subtask, Task
+
+User = get_user_model()
+
+
+
+
+class SubtaskCountersTest(TestCase):
+    """
+SubtaskCountersTest:
+
+Tests the denormalized subtask counters on Task, ensuring they follow subtask creation, toggling and deletion
+through the task and subtask endpoints, and that the repair_subtask_counters command rebuilds drifted values.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+
+    def create_task(self):
+        response = self.client.post(reverse('task-list'), {
+            'title': 'Task',
+            'priority': 'Low',
+            'subtasks': [{'text': 'One', 'completed': True}, {'text': 'Two', 'completed': False}],
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data['subtasks_total'], response.data['subtasks_done']), (2, 1))
+        return Task.objects.get(pk=response.data['id'])
+
+    def assert_counters(self, task, total, done):
+        task.refresh_from_db()
+        self.assertEqual((task.subtasks_total, task.subtasks_done), (total, done))
+
+    def test_subtask_toggle_and_delete(self):
+        task = self.create_task()
+        two = task.subtasks.get(text='Two')
+        url = reverse('subtask-detail', kwargs={'pk': two.pk})
+        self.client.put(url, {'text': 'Two', 'completed': True}, format='json')
+        self.assert_counters(task, 2, 2)
+        self.client.put(url, {'text': 'Two renamed', 'completed': True}, format='json')
+        self.assert_counters(task, 2, 2)
+        self.client.delete(url)
+        self.assert_counters(task, 1, 1)
+
+    def test_task_update(self):
+        task = self.create_task()
+        one = task.subtasks.get(text='One')
+        response = self.client.put(reverse('task-detail', kwargs={'pk': task.pk}), {
+            'subtasks': [
+                {'id': one.id, 'text': 'One', 'completed': False},
+                {'text': 'Three', 'completed': True},
+                {'text': 'Four', 'completed': False},
+            ],
+        }, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['subtasks_total'], response.data['subtasks_done']), (3, 1))
+        self.assert_counters(task, 3, 1)
+
+    def test_card_list_without_subtasks(self):
+        self.create_task()
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('task-list'), {'subtasks': 'false'})
+        self.assertNotIn('subtasks', response.data[0])
+        self.assertEqual(response.data[0]['subtasks_done'], 1)
+
+    def test_repair_command(self):
+        task = self.create_task()
+        empty = Task.objects.create(title='Empty', priority='Low', creator=self.user)
+        Task.objects.update(subtasks_total=9, subtasks_done=9)
+        Subtask.objects.create(task=task, text='Added behind our back', completed=True)
+        out = io.StringIO()
+        call_command('repair_subtask_counters', batch_size=1, stdout=out)
+        self.assertIn('for 2 tasks', out.getvalue())
+        self.assert_counters(task, 3, 2)
+        self.assert_counters(empty, 0, 0)
@@ -0,0 +1,84 @@
+import io
+from datetime import date
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from join_backend.digests import build_digests, send_digests
+from join_backend.models import Contact, CustomUser, Task
+
+
+
+
+class RecordingDigestBackend:
+    batches = []
+
+    def send(self, digests):
+        self.batches.append([digest['contact']['email'] for digest in digests])
+        return len(digests)
+
+
+
+
+class DeadlineDigestTest(TestCase):
+    """
+DeadlineDigestTest:
+
+Tests the deadline digests, ensuring that open tasks are grouped per assigned contact into overdue, due-today and
+due-tomorrow buckets with one query, that done, archived and far-off tasks are left out, and that digests are
+delivered in batches through the configured backend and as emails by the send_deadline_digests command.
+"""
+    today = date(2024, 5, 10)
+
+    def setUp(self):
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.anna = Contact.objects.create(name='Anna', email='anna@example.com', phone='1', user=self.user)
+        self.ben = Contact.objects.create(name='Ben', email='ben@example.com', phone='2', user=self.user)
+        self.idle = Contact.objects.create(name='Idle', email='idle@example.com', phone='3', user=self.user)
+        self.create_task('Late', '2024-05-08', self.anna, self.ben)
+        self.create_task('Today', '2024-05-10', self.anna)
+        self.create_task('Tomorrow', '2024-05-11', self.ben)
+        self.create_task('Next week', '2024-05-17', self.anna, self.idle)
+        self.create_task('Finished', '2024-05-09', self.idle, status='done')
+        self.create_task('Archived', '2024-05-09', self.idle, archived=True)
+
+    def create_task(self, title, due_date, *contacts, **fields):
+        task = Task.objects.create(title=title, priority='Low', creator=self.user, due_date=due_date, **fields)
+        task.assigned_to.set(contacts)
+        return task
+
+    def test_build_digests(self):
+        with self.assertNumQueries(1):
+            digests = list(build_digests(self.today))
+        self.assertEqual([digest['contact']['name'] for digest in digests], ['Anna', 'Ben'])
+        anna, ben = digests
+        self.assertEqual([task['title'] for task in anna['overdue']], ['Late'])
+        self.assertEqual([task['title'] for task in anna['due_today']], ['Today'])
+        self.assertEqual(anna['due_tomorrow'], [])
+        self.assertEqual([task['title'] for task in ben['overdue']], ['Late'])
+        self.assertEqual([task['title'] for task in ben['due_tomorrow']], ['Tomorrow'])
+
+    def test_overdue_window(self):
+        digests = list(build_digests(self.today, overdue_days=1))
+        self.assertEqual([digest['contact']['name'] for digest in digests], ['Anna', 'Ben'])
+        self.assertEqual(digests[0]['overdue'], [])
+
+    def test_send_digests_in_batches(self):
+        RecordingDigestBackend.batches = []
+        self.assertEqual(send_digests(self.today, backend=RecordingDigestBackend(), batch_size=1), 2)
+        self.assertEqual(RecordingDigestBackend.batches, [['anna@example.com'], ['ben@example.com']])
+
+    @override_settings(DIGEST_BACKEND='join_backend.digests.EmailDigestBackend')
+    def test_command_sends_emails(self):
+        out = io.StringIO()
+        call_command('send_deadline_digests', '--date', '2024-05-10', stdout=out)
+        self.assertIn('Sent 2 digests for 2024-05-10.', out.getvalue())
+        self.assertEqual([message.to for message in mail.outbox], [['anna@example.com'], ['ben@example.com']])
+        self.assertEqual(mail.outbox[0].subject, 'Join deadlines: 1 overdue, 1 due today')
+        self.assertIn('- Late (Low, due 2024-05-08)', mail.outbox[0].body)
+
+    def test_command_dry_run(self):
+        out = io.StringIO()
+        call_command('send_deadline_digests', '--date', '2024-05-10', '--dry-run', stdout=out)
+        self.assertIn('Found 2 digests for 2024-05-10.', out.getvalue())
+        self.assertEqual(mail.outbox, [])
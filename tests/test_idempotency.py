@@ -0,0 +1,155 @@
+import datetime
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db.models.signals import post_save
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from join_backend.idempotency import key_digest
+from join_backend.models import Contact, IdempotencyKey, Task
+
+User = get_user_model()
+
+
+
+
+class IdempotencyKeyTest(TestCase):
+    """
+IdempotencyKeyTest:
+
+Tests Idempotency-Key handling of the task and contact create endpoints, verifying that a retry replays the first
+response without writing, that keys are scoped per user and cannot be reused for a different request,
+that a duplicate arriving while the first request is in flight waits for its response,
+that stale claims are taken over, that a request only releases its own claim, and that expired keys are purged.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse('task-list')
+        self.data = {'title': 'Task', 'priority': 'Low', 'subtasks': [{'text': 'Step', 'completed': False}]}
+
+    def post(self, data, key='retry-1', client=None):
+        return (client or self.client).post(self.url, data, format='json', HTTP_IDEMPOTENCY_KEY=key)
+
+    def digest(self, key='retry-1'):
+        return key_digest(SimpleNamespace(method='POST', path=self.url), key)
+
+    def claim(self, key='retry-1', **fields):
+        # Stands in for a request with this key that is still in flight.
+        return IdempotencyKey.objects.create(user=self.user, key=self.digest(key), **fields)
+
+    def test_retry_replays_the_first_response(self):
+        first = self.post(self.data)
+        self.assertEqual(first.status_code, 201)
+        with self.assertNumQueries(1):
+            retry = self.post(self.data)
+        self.assertEqual(retry.status_code, 201)
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_requests_without_key_are_not_deduplicated(self):
+        self.client.post(self.url, self.data, format='json')
+        self.client.post(self.url, self.data, format='json')
+        self.assertEqual(Task.objects.count(), 2)
+
+    def test_key_reused_for_a_different_request(self):
+        self.post(self.data)
+        response = self.post({**self.data, 'title': 'Other'})
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(Task.objects.count(), 1)
+
+    def test_keys_are_scoped_per_user(self):
+        other = APIClient()
+        other.force_authenticate(user=User.objects.create_user(email='other@example.com', name='Other', password='x'))
+        self.post(self.data)
+        response = self.post(self.data, client=other)
+        self.assertNotIn('Idempotent-Replayed', response)
+        self.assertEqual(Task.objects.count(), 2)
+
+    def test_contact_creation(self):
+        data = {'name': 'Anna', 'email': 'anna@example.com', 'phone': '1'}
+        for _ in range(3):
+            response = self.client.post(reverse('add_contact'), data, format='json', HTTP_IDEMPOTENCY_KEY='contact-1')
+            self.assertEqual(response.status_code, 201)
+        self.assertEqual(Contact.objects.count(), 1)
+
+    def test_invalid_key(self):
+        response = self.post(self.data, key='x' * 256)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(Task.objects.count(), 0)
+
+    @override_settings(IDEMPOTENCY_WAIT_SECONDS=5)
+    def test_duplicate_waits_for_in_flight_request(self):
+        first = self.post(self.data, key='first')
+        stored = IdempotencyKey.objects.get(key=self.digest('first'))
+        in_flight = self.claim(fingerprint=stored.fingerprint)
+
+        # The in-flight request finishes while the duplicate waits.
+        def finish(seconds):
+            IdempotencyKey.objects.filter(pk=in_flight.pk).update(status=stored.status, data=stored.data)
+
+        with mock.patch('join_backend.idempotency.time.sleep', side_effect=finish):
+            response = self.post(self.data)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data, first.data)
+        self.assertEqual(Task.objects.count(), 1)
+
+    @override_settings(IDEMPOTENCY_WAIT_SECONDS=0.1)
+    def test_duplicate_gives_up_waiting(self):
+        self.claim()
+        response = self.post(self.data)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(Task.objects.count(), 0)
+
+    @override_settings(IDEMPOTENCY_LOCK_TIMEOUT=30)
+    def test_stale_claim_is_taken_over(self):
+        self.claim(created_at=timezone.now() - datetime.timedelta(seconds=31))
+        response = self.post(self.data)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(Task.objects.count(), 1)
+        self.assertEqual(IdempotencyKey.objects.get().status, 201)
+
+    def test_claim_taken_over_after_expiry_is_kept(self):
+        # Stands in for the claim going stale mid-request and a duplicate taking it over.
+        def take_over_claim(**kwargs):
+            IdempotencyKey.objects.filter(key=self.digest()).delete()
+            self.claim(fingerprint='duplicate')
+
+        post_save.connect(take_over_claim, sender=Task)
+        try:
+            self.assertEqual(self.post(self.data).status_code, 201)
+        finally:
+            post_save.disconnect(take_over_claim, sender=Task)
+        record = IdempotencyKey.objects.get()
+        self.assertEqual(record.fingerprint, 'duplicate')
+        self.assertIsNone(record.status)
+
+    def test_server_errors_are_not_stored(self):
+        with mock.patch('join_backend.views.TaskSerializer.save', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.post(self.data)
+        self.assertFalse(IdempotencyKey.objects.exists())
+        self.assertEqual(self.post(self.data).status_code, 201)
+
+    @override_settings(IDEMPOTENCY_KEY_TTL=60)
+    def test_expired_keys(self):
+        self.post(self.data)
+        IdempotencyKey.objects.update(created_at=timezone.now() - datetime.timedelta(seconds=61))
+        self.assertNotIn('Idempotent-Replayed', self.post(self.data))
+        self.assertEqual(Task.objects.count(), 2)
+
+        self.post(self.data, key='other')
+        IdempotencyKey.objects.filter(key=self.digest('other')).update(
+            created_at=timezone.now() - datetime.timedelta(seconds=61)
+        )
+        out = StringIO()
+        call_command('purge_idempotency_keys', stdout=out)
+        self.assertIn('Deleted 1 expired idempotency keys.', out.getvalue())
+        self.assertEqual(list(IdempotencyKey.objects.values_list('key', flat=True)), [self.digest()])
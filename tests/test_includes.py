@@ -0,0 +1,68 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+from join_backend.models import Category, Contact, Task
+
+User = get_user_model()
+
+
+
+
+class IncludeTest(TestCase):
+    """
+IncludeTest:
+
+Tests compound-document side-loading on the task and contact lists, ensuring related users, contacts and categories
+appear once in the top-level included map and are referenced by id, that the query count stays constant,
+that other users' contacts are not included, and that unknown include types are rejected.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+        self.category = Category.objects.create(name='Work', color='#FF0000')
+        self.contacts = [
+            Contact.objects.create(user=self.user, name=f'Contact {i}', email=f'c{i}@example.com', phone='1') for i in range(2)
+        ]
+        for i in range(5):
+            task = Task.objects.create(title=f'Task {i}', priority='Low', creator=self.user, category=self.category if i % 2 else None)
+            task.assigned_to.add(self.contacts[i % 2])
+
+    def test_task_list_include_all(self):
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse('task-list'), {'include': 'users,contacts,categories'})
+        self.assertEqual(response.status_code, 200)
+        included = response.data['included']
+        self.assertEqual(included['users'], {self.user.id: {'id': self.user.id, 'name': 'Test User', 'email': 'testuser@example.com'}})
+        self.assertEqual(set(included['contacts']), {contact.id for contact in self.contacts})
+        self.assertEqual(included['contacts'][self.contacts[0].id]['user'], self.user.id)
+        self.assertEqual(included['categories'], {self.category.id: {'id': self.category.id, 'name': 'Work', 'color': '#FF0000'}})
+        self.assertTrue(all(task['creator'] == self.user.id for task in response.data['data']))
+        self.assertEqual(len(response.data['data']), 5)
+
+    def test_task_list_include_only_categories(self):
+        response = self.client.get(reverse('task-list'), {'include': 'categories'})
+        self.assertEqual(set(response.data['included']), {'categories'})
+        self.assertEqual(response.data['data'][0]['creator']['email'], 'testuser@example.com')
+
+    def test_task_list_includes_only_own_contacts(self):
+        other = User.objects.create_user(email='other@example.com', name='Other', password='testpassword')
+        foreign = Contact.objects.create(user=other, name='Foreign', email='foreign@example.com', phone='1')
+        Task.objects.filter(creator=self.user).first().assigned_to.add(foreign)
+        response = self.client.get(reverse('task-list'), {'include': 'contacts'})
+        self.assertEqual(set(response.data['included']['contacts']), {contact.id for contact in self.contacts})
+
+    def test_contact_list_include_users(self):
+        response = self.client.get(reverse('add_contact'), {'include': 'users'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(response.data['included']['users']), [self.user.id])
+        self.assertEqual([contact['user'] for contact in response.data['data']], [self.user.id, self.user.id])
+
+    def test_without_include_shape_is_unchanged(self):
+        self.assertIsInstance(self.client.get(reverse('task-list')).data, list)
+        self.assertIsInstance(self.client.get(reverse('add_contact')).data, list)
+
+    def test_unknown_include(self):
+        self.assertEqual(self.client.get(reverse('task-list'), {'include': 'subtasks'}).status_code, 400)
+        self.assertEqual(self.client.get(reverse('add_contact'), {'include': 'categories'}).status_code, 400)
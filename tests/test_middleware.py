@@ -0,0 +1,57 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.authtoken.models import Token
+from rest_framework.test import APIClient
+from join_backend.middleware import uses_session
+
+User = get_user_model()
+
+
+
+
+class LeanMiddlewareTest(TestCase):
+    """
+LeanMiddlewareTest:
+
+Tests the path-aware middleware stack, verifying that token-authenticated API requests skip session, CSRF and
+message processing, while the admin and session-authenticated requests keep the full stack including CSRF checks.
+"""
+    def setUp(self):
+        self.user = User.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.token = Token.objects.create(user=self.user)
+        self.factory = RequestFactory()
+
+    def test_uses_session(self):
+        self.assertFalse(uses_session(self.factory.get('/tasks/', HTTP_AUTHORIZATION='Token x')))
+        self.assertFalse(uses_session(self.factory.get('/tasks/')))
+        self.assertTrue(uses_session(self.factory.get('/admin/', HTTP_AUTHORIZATION='Token x')))
+        self.assertTrue(uses_session(self.factory.get('/set-csrf/')))
+        session_request = self.factory.get('/tasks/')
+        session_request.COOKIES['sessionid'] = 'abc'
+        self.assertTrue(uses_session(session_request))
+
+    def test_token_request_skips_the_session(self):
+        client = APIClient(enforce_csrf_checks=True)
+        client.login(email='testuser@example.com', password='testpassword')
+        client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+        with CaptureQueriesContext(connection) as queries:
+            response = client.post(reverse('task-list'), {'title': 'Task', 'priority': 'Low'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(any('django_session' in query['sql'] for query in queries))
+        self.assertNotIn('sessionid', response.cookies)
+
+    def test_session_request_keeps_csrf_checks(self):
+        client = APIClient(enforce_csrf_checks=True)
+        client.login(email='testuser@example.com', password='testpassword')
+        response = client.post(reverse('task-list'), {'title': 'Task', 'priority': 'Low'}, format='json')
+        self.assertEqual(response.status_code, 403)
+        self.assertEqual(client.get(reverse('user-details')).status_code, 200)
+
+    def test_admin_keeps_the_full_stack(self):
+        response = self.client.get('/admin/login/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('csrftoken', response.cookies)
+        self.assertEqual(response['X-Frame-Options'], 'DENY')
@@ -0,0 +1,146 @@
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TransactionTestCase
+
+
+
+
+class SubtaskForeignKeyMigrationTest(TransactionTestCase):
+    """
+SubtaskForeignKeyMigrationTest:
+
+Tests the migration from the Task.subtasks many-to-many relation to the Subtask.task foreign key,
+ensuring every existing link is preserved, including subtasks that were shared between several tasks.
+"""
+    migrate_from = [('join_backend', '0002_task_position')]
+    migrate_to = [('join_backend', '0003_subtask_task_foreign_key')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        self.migrate(MigrationExecutor(connection).loader.graph.leaf_nodes())
+
+    def test_links_are_preserved(self):
+        apps = self.migrate(self.migrate_from)
+        Task = apps.get_model('join_backend', 'Task')
+        Subtask = apps.get_model('join_backend', 'Subtask')
+        first = Task.objects.create(title='First', priority='Low')
+        second = Task.objects.create(title='Second', priority='Low')
+        own = Subtask.objects.create(text='Own', completed=True)
+        shared = Subtask.objects.create(text='Shared')
+        first.subtasks.add(own, shared)
+        second.subtasks.add(shared)
+
+        apps = self.migrate(self.migrate_to)
+        Subtask = apps.get_model('join_backend', 'Subtask')
+        self.assertEqual(
+            sorted(Subtask.objects.filter(task_id=first.id).values_list('text', 'completed')),
+            [('Own', True), ('Shared', False)]
+        )
+        self.assertEqual(list(Subtask.objects.filter(task_id=second.id).values_list('text', flat=True)), ['Shared'])
+
+
+
+
+class PriorityCodeMigrationTest(TransactionTestCase):
+    """
+PriorityCodeMigrationTest:
+
+Tests the migration of task priorities to an integer column, ensuring stored priorities are converted to their codes
+and read back unchanged, and that values outside the choices fall back to Medium.
+"""
+    migrate_from = [('join_backend', '0009_task_open_due_date_index')]
+    migrate_to = [('join_backend', '0010_task_priority_codes')]
+
+    migrate = SubtaskForeignKeyMigrationTest.migrate
+    tearDown = SubtaskForeignKeyMigrationTest.tearDown
+
+    def test_priorities_are_converted(self):
+        apps = self.migrate(self.migrate_from)
+        Task = apps.get_model('join_backend', 'Task')
+        Task.objects.create(title='Urgent', priority='Urgent')
+        Task.objects.create(title='Unknown', priority='High')
+
+        apps = self.migrate(self.migrate_to)
+        Task = apps.get_model('join_backend', 'Task')
+        self.assertEqual(sorted(Task.objects.values_list('title', 'priority')), [('Unknown', 'Medium'), ('Urgent', 'Urgent')])
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT priority FROM join_backend_task WHERE title = %s', ['Urgent'])
+            self.assertEqual(cursor.fetchone(), (3,))
+
+
+
+
+class CompactEnumMigrationTest(TransactionTestCase):
+    """
+CompactEnumMigrationTest:
+
+Tests the migration of task status and of contact and category colors to integer columns,
+ensuring stored values are converted to their codes and read back unchanged, and that values outside the choices
+fall back to a valid default.
+"""
+    migrate_from = [('join_backend', '0011_contact_sort_keys')]
+    migrate_to = [('join_backend', '0012_compact_enum_columns')]
+
+    migrate = SubtaskForeignKeyMigrationTest.migrate
+    tearDown = SubtaskForeignKeyMigrationTest.tearDown
+
+    def test_values_are_converted(self):
+        apps = self.migrate(self.migrate_from)
+        Task = apps.get_model('join_backend', 'Task')
+        Contact = apps.get_model('join_backend', 'Contact')
+        Category = apps.get_model('join_backend', 'Category')
+        Task.objects.create(title='Waiting', priority='Urgent', status='awaitFeedback')
+        Task.objects.create(title='Unknown', priority='Low', status='blocked')
+        Contact.objects.create(name='Anna', email='anna@example.com', phone='1', color='#12ab9f')
+        Category.objects.create(name='Broken', color='red')
+        Category.objects.create(name='Short', color='#abc')
+
+        apps = self.migrate(self.migrate_to)
+        Task = apps.get_model('join_backend', 'Task')
+        Contact = apps.get_model('join_backend', 'Contact')
+        Category = apps.get_model('join_backend', 'Category')
+        self.assertEqual(
+            sorted(Task.objects.values_list('title', 'priority', 'status')),
+            [('Unknown', 'Low', 'todo'), ('Waiting', 'Urgent', 'awaitFeedback')]
+        )
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT status FROM join_backend_task WHERE title = %s', ['Waiting'])
+            self.assertEqual(cursor.fetchone(), (3,))
+        self.assertEqual(Contact.objects.get().color, '#12AB9F')
+        self.assertEqual(
+            list(Category.objects.order_by('name').values_list('name', 'color')),
+            [('Broken', '#FF7A00'), ('Short', '#AABBCC')]
+        )
+
+
+
+
+class PositionBackfillMigrationTest(TransactionTestCase):
+    """
+PositionBackfillMigrationTest:
+
+Tests the backfill of empty task positions, ensuring unpositioned tasks are appended to the end of their column
+in creation order while positioned tasks keep their keys.
+"""
+    migrate_from = [('join_backend', '0013_task_contact_version')]
+    migrate_to = [('join_backend', '0014_task_backfill_empty_positions')]
+
+    migrate = SubtaskForeignKeyMigrationTest.migrate
+    tearDown = SubtaskForeignKeyMigrationTest.tearDown
+
+    def test_empty_positions_are_appended(self):
+        apps = self.migrate(self.migrate_from)
+        Task = apps.get_model('join_backend', 'Task')
+        Task.objects.create(title='Second', priority='Low')
+        Task.objects.create(title='First', priority='Low', position='m')
+        Task.objects.create(title='Third', priority='Low')
+
+        apps = self.migrate(self.migrate_to)
+        Task = apps.get_model('join_backend', 'Task')
+        self.assertEqual(list(Task.objects.order_by('position').values_list('title', flat=True)), ['First', 'Second', 'Third'])
+        self.assertEqual(Task.objects.get(title='First').position, 'm')
@@ -154,7 +154,7 @@ ontactModelTest:
 
 Tests the Contact model, ensuring that contacts are correctly created with the associated user, 
 and verifying their attributes such as name, email, phone, and color.
-It also checks the correct string representation of a contact.
+It also checks the correct string representation of a contact and the sort key and group letter derived from its name.
 """
     def setUp(self):
         self.user = CustomUser.objects.create_user(
@@ -177,6 +177,16 @@ It also checks the correct string representation of a contact.
         self.assertEqual(self.contact.color, "#FF7A00")
         self.assertEqual(str(self.contact), "Test Contact")
 
+    def test_contact_sort_key_and_group(self):
+        self.assertEqual((self.contact.sort_key, self.contact.group), ("test contact", "T"))
+        self.contact.name = "  Émile Zola"
+        self.contact.save(update_fields=["name"])
+        self.contact.refresh_from_db()
+        self.assertEqual((self.contact.sort_key, self.contact.group), ("emile zola", "E"))
+        self.contact.name = "42 Street"
+        self.contact.save()
+        self.assertEqual(self.contact.group, "#")
+
 
 
 
@@ -248,6 +258,13 @@ It also verifies the relationships with contacts and ensures the correct string
         self.assertIn(self.contact, self.task.assigned_to.all())
         self.assertEqual(str(self.task), "Test Task")
 
+    def test_task_delete_cascades_to_subtasks(self):
+        Subtask.objects.create(task=self.task, text="Subtask 1")
+        Subtask.objects.create(task=self.task, text="Subtask 2")
+        self.assertEqual(self.task.subtasks.count(), 2)
+        self.task.delete()
+        self.assertFalse(Subtask.objects.exists())
+
 
 
 
@@ -0,0 +1,98 @@
+import io
+import random
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from join_backend.models import Task
+from join_backend.ordering import key_between, evenly_spaced_keys, rebalance_column, append_position
+
+User = get_user_model()
+
+
+
+
+class KeyBetweenTest(TestCase):
+    """
+KeyBetweenTest:
+
+Tests the fractional indexing helpers, ensuring generated keys always sort strictly between their neighbours,
+never end in a zero, and that evenly spaced keys are ascending and short.
+"""
+    def assert_valid_key(self, key, a, b):
+        self.assertFalse(key.endswith('0'), key)
+        if a:
+            self.assertLess(a, key)
+        if b:
+            self.assertLess(key, b)
+
+    def test_boundaries(self):
+        self.assertEqual(key_between(None, None), 'i')
+        for a, b in [('', 'i'), ('i', None), ('', '1'), ('', '01'), ('i', 'j'), ('i5', 'j5'), ('zz', None), ('a', 'a1')]:
+            self.assert_valid_key(key_between(a, b), a, b)
+
+    def test_invalid_neighbours(self):
+        with self.assertRaises(ValueError):
+            key_between('b', 'a')
+        with self.assertRaises(ValueError):
+            key_between('a', 'a')
+        with self.assertRaises(ValueError):
+            key_between('a0', None)
+
+    def test_random_inserts_keep_order(self):
+        rng = random.Random(42)
+        keys = []
+        for _ in range(500):
+            index = rng.randint(0, len(keys))
+            a = keys[index - 1] if index > 0 else None
+            b = keys[index] if index < len(keys) else None
+            key = key_between(a, b)
+            self.assert_valid_key(key, a, b)
+            keys.insert(index, key)
+        self.assertEqual(keys, sorted(keys))
+
+    def test_evenly_spaced_keys(self):
+        for count in (0, 1, 35, 36, 1000):
+            keys = evenly_spaced_keys(count)
+            self.assertEqual(len(keys), count)
+            self.assertEqual(keys, sorted(set(keys)))
+            self.assertTrue(all(key and not key.endswith('0') for key in keys))
+        self.assertTrue(all(len(key) <= 2 for key in evenly_spaced_keys(1000)))
+
+
+
+
+class RebalanceTest(TestCase):
+    """
+RebalanceTest:
+
+Tests column rebalancing, both directly and through the rebalance_positions management command,
+ensuring column order is preserved while long keys are replaced with short ones.
+"""
+    def setUp(self):
+        self.user = User.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+
+    def test_append_position(self):
+        first = append_position(self.user.id, 'todo')
+        Task.objects.create(title='Task 1', priority='Low', creator=self.user, position=first)
+        self.assertLess(first, append_position(self.user.id, 'todo'))
+
+    def test_rebalance_preserves_order(self):
+        key = None
+        for i in range(40):
+            key = key_between(None, key)  # always drop at the top
+            Task.objects.create(title=f'Task {i}', priority='Low', creator=self.user, position=key)
+        before = list(Task.objects.order_by('position').values_list('id', flat=True))
+        self.assertEqual(rebalance_column(self.user.id, 'todo'), 40)
+        after = list(Task.objects.order_by('position').values_list('id', flat=True))
+        self.assertEqual(before, after)
+        self.assertTrue(all(len(position) <= 2 for position in Task.objects.values_list('position', flat=True)))
+
+    def test_rebalance_command(self):
+        Task.objects.create(title='Long', priority='Low', creator=self.user, position='z' * 30)
+        Task.objects.create(title='Short', priority='Low', creator=self.user, status='done', position='i')
+        out = io.StringIO()
+        call_command('rebalance_positions', stdout=out)
+        self.assertIn('Rebalanced 1 columns', out.getvalue())
+        self.assertEqual(Task.objects.get(title='Long').position, 'i')
+        self.assertEqual(Task.objects.get(title='Short').position, 'i')
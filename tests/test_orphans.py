@@ -0,0 +1,51 @@
+import io
+from datetime import timedelta
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from join_backend.models import Subtask, Task
+from join_backend.orphans import sweep_orphaned_subtasks
+
+
+
+
+class OrphanedSubtaskSweepTest(TestCase):
+    """
+OrphanedSubtaskSweepTest:
+
+Tests the orphaned subtask sweep, ensuring that only subtasks without a task that are older than the grace period
+are deleted, that batches and the batch limit are honoured, and that the command's dry run deletes nothing.
+"""
+    def setUp(self):
+        self.task = Task.objects.create(title='Task', priority='Low')
+        old = timezone.now() - timedelta(days=2)
+        self.kept = Subtask.objects.create(task=self.task, text='Attached', created_at=old)
+        self.recent = Subtask.objects.create(text='Recent orphan')
+        self.orphans = [Subtask.objects.create(text=f'Orphan {i}', created_at=old) for i in range(5)]
+
+    def test_sweep_deletes_old_orphans_only(self):
+        self.assertEqual(sweep_orphaned_subtasks(batch_size=2), 5)
+        self.assertEqual(
+            set(Subtask.objects.values_list('text', flat=True)), {'Attached', 'Recent orphan'}
+        )
+
+    def test_sweep_stops_after_max_batches(self):
+        self.assertEqual(sweep_orphaned_subtasks(batch_size=2, max_batches=2), 4)
+        self.assertEqual(Subtask.objects.count(), 3)
+
+    def test_task_delete_removes_subtasks(self):
+        self.task.delete()
+        self.assertFalse(Subtask.objects.filter(pk=self.kept.pk).exists())
+
+    def test_command_dry_run(self):
+        out = io.StringIO()
+        call_command('sweep_orphaned_subtasks', '--dry-run', stdout=out)
+        self.assertIn('Found 5 orphaned subtasks.', out.getvalue())
+        self.assertEqual(Subtask.objects.count(), 7)
+
+    def test_command(self):
+        out = io.StringIO()
+        call_command('sweep_orphaned_subtasks', '--batch-size', '3', stdout=out)
+        self.assertIn('Deleted 5 orphaned subtasks.', out.getvalue())
+        self.assertEqual(Subtask.objects.count(), 2)
@@ -0,0 +1,110 @@
+import datetime
+import decimal
+import io
+import unittest
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from join_backend.models import Task
+from join_backend.parsers import ORJSONParser, MessagePackParser
+from join_backend.renderers import ORJSONRenderer, MessagePackRenderer, msgpack
+
+User = get_user_model()
+
+
+
+
+class ORJSONRendererTest(TestCase):
+    """
+ORJSONRendererTest:
+
+Tests the ORJSONRenderer, ensuring its output is byte-for-byte identical to DRF's JSONRenderer
+for the value types our serializers produce, including dates, decimals, UUIDs and lazy strings.
+"""
+    def test_matches_drf_renderer(self):
+        data = {
+            'id': 1,
+            'title': 'Täsk \u2028 with separator',
+            'due_date': datetime.date(2024, 7, 31),
+            'created': datetime.datetime(2024, 7, 31, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+            'naive': datetime.datetime(2024, 7, 31, 12, 30),
+            'at': datetime.time(9, 15),
+            'amount': decimal.Decimal('1.5'),
+            'uid': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'label': gettext_lazy('Done'),
+            'assigned_to': [1, 2, 3],
+            'category': None,
+            'completed': False,
+        }
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_render_none(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
+
+    def test_indent(self):
+        rendered = ORJSONRenderer().render({'a': 1}, 'application/json; indent=4')
+        self.assertEqual(rendered, b'{\n  "a": 1\n}')
+
+
+
+
+class ORJSONParserTest(TestCase):
+    """
+ORJSONParserTest:
+
+Tests the ORJSONParser, verifying that valid JSON is parsed and that malformed or non-standard input raises a ParseError.
+"""
+    def test_parse(self):
+        data = ORJSONParser().parse(io.BytesIO(b'{"title": "Task", "assigned_to": [1, 2]}'))
+        self.assertEqual(data, {'title': 'Task', 'assigned_to': [1, 2]})
+
+    def test_parse_error(self):
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"title": '))
+        with self.assertRaises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"value": NaN}'))
+
+
+
+
+@unittest.skipIf(msgpack is None, 'msgpack is not installed')
+class MessagePackTest(TestCase):
+    """
+MessagePackTest:
+
+Tests the optional MessagePack format, covering the renderer/parser round trip
+and content negotiation on the task list endpoint.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+
+    def test_round_trip(self):
+        data = {'title': 'Task', 'due_date': datetime.date(2024, 7, 31), 'assigned_to': [1, 2]}
+        packed = MessagePackRenderer().render(data)
+        self.assertEqual(
+            MessagePackParser().parse(io.BytesIO(packed)),
+            {'title': 'Task', 'due_date': '2024-07-31', 'assigned_to': [1, 2]}
+        )
+
+    def test_task_list_negotiation(self):
+        Task.objects.create(title='Task 1', priority='Low', creator=self.user, due_date=datetime.date(2024, 7, 31))
+        response = self.client.get(reverse('task-list'), HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        tasks = msgpack.unpackb(response.content, raw=False)
+        self.assertEqual(tasks[0]['title'], 'Task 1')
+        self.assertEqual(tasks[0]['due_date'], '2024-07-31')
+
+    def test_task_create_from_msgpack(self):
+        body = msgpack.packb({'title': 'Packed Task', 'priority': 'Medium'})
+        response = self.client.post(reverse('task-list'), body, content_type='application/msgpack')
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Task.objects.filter(title='Packed Task').exists())
@@ -0,0 +1,96 @@
+import datetime
+import unittest
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.conf import settings
+from django.db import connections
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APIClient
+from join_backend.models import ReplicationHeartbeat, Task
+from join_backend.routers import reset_replica_state
+
+User = get_user_model()
+
+# The SQLite alias standing in for a read replica, declared in join_api.test_settings.
+REPLICA = 'replica_test'
+HAS_REPLICA = REPLICA in settings.DATABASES
+
+
+
+
+@unittest.skipUnless(HAS_REPLICA, 'run the tests with --settings=join_api.test_settings')
+@override_settings(DATABASE_REPLICAS=[REPLICA], REPLICA_LAG_CHECK_INTERVAL=0, REPLICA_HEARTBEAT_INTERVAL=0)
+class ReplicaRoutingTest(TestCase):
+    """
+ReplicaRoutingTest:
+
+Tests read-replica routing with two SQLite databases, verifying that safe API reads are served by the replica,
+that writes go to the primary, that a client is pinned to the primary after writing (by cookie and by Authorization header),
+that a lagging replica is skipped in favour of the primary, and that the bootstrap transaction is opened on the replica it reads.
+"""
+    databases = {'default', REPLICA} if HAS_REPLICA else {'default'}
+
+    def setUp(self):
+        reset_replica_state()
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        User.objects.using(REPLICA).create(id=self.user.id, email=self.user.email, name=self.user.name, password='x')
+        self.client.force_authenticate(user=self.user)
+        Task.objects.create(title='Primary task', priority='Low', creator=self.user)
+        Task.objects.using(REPLICA).create(title='Replica task', priority='Low', creator_id=self.user.id)
+
+    def replicate_heartbeat(self):
+        beat = ReplicationHeartbeat.objects.using('default').get(pk=1).beat
+        ReplicationHeartbeat.objects.using(REPLICA).update_or_create(pk=1, defaults={'beat': beat})
+
+    def titles(self):
+        return [task['title'] for task in self.client.get(reverse('task-list')).data]
+
+    def test_reads_use_replica_and_writes_use_primary(self):
+        self.assertEqual(self.titles(), ['Replica task'])
+        response = self.client.post(reverse('task-list'), {'title': 'New task', 'priority': 'Low'}, format='json')
+        self.assertEqual(response.status_code, 201)
+        self.assertTrue(Task.objects.using('default').filter(title='New task').exists())
+        self.assertFalse(Task.objects.using(REPLICA).filter(title='New task').exists())
+
+    def test_pinned_by_cookie_after_write(self):
+        self.client.post(reverse('task-list'), {'title': 'New task', 'priority': 'Low'}, format='json')
+        self.replicate_heartbeat()
+        self.assertEqual(self.titles(), ['Primary task', 'New task'])
+        self.client.cookies.clear()
+        self.assertEqual(self.titles(), ['Replica task'])
+
+    def test_pinned_by_authorization_after_write(self):
+        self.client.credentials(HTTP_AUTHORIZATION='Token abc')
+        self.client.post(reverse('task-list'), {'title': 'New task', 'priority': 'Low'}, format='json')
+        self.client.cookies.clear()
+        self.replicate_heartbeat()
+        self.assertEqual(self.titles(), ['Primary task', 'New task'])
+        self.client.credentials(HTTP_AUTHORIZATION='Token other')
+        self.assertEqual(self.titles(), ['Replica task'])
+
+    def test_lagging_replica_falls_back_to_primary(self):
+        now = timezone.now()
+        ReplicationHeartbeat.objects.using('default').create(pk=1, beat=now)
+        ReplicationHeartbeat.objects.using(REPLICA).create(pk=1, beat=now - datetime.timedelta(seconds=30))
+        self.assertEqual(self.titles(), ['Primary task'])
+        ReplicationHeartbeat.objects.using(REPLICA).filter(pk=1).update(beat=now)
+        self.assertEqual(self.titles(), ['Replica task'])
+
+    def test_unreplicated_write_makes_replica_stale(self):
+        self.client.post(reverse('task-list'), {'title': 'New task', 'priority': 'Low'}, format='json')
+        self.assertTrue(ReplicationHeartbeat.objects.using('default').filter(pk=1).exists())
+        self.client.cookies.clear()
+        self.assertEqual(self.titles(), ['Primary task', 'New task'])
+
+    def test_bootstrap_transaction_uses_replica(self):
+        with CaptureQueriesContext(connections[REPLICA]) as replica, CaptureQueriesContext(connections['default']) as primary:
+            response = self.client.get(reverse('bootstrap'))
+        self.assertEqual([task['title'] for task in response.data['tasks']], ['Replica task'])
+        self.assertTrue(any(query['sql'].startswith('SAVEPOINT') for query in replica))
+        self.assertFalse(any(query['sql'].startswith('SAVEPOINT') for query in primary))
@@ -3,7 +3,8 @@ from django.test import TestCase
 from rest_framework.exceptions import ValidationError
 from join_backend.models import Contact, Category, Subtask, Task
 from join_backend.serializers import UserRegistrationSerializer, UserDetailsSerializer, ContactSerializer, CategorySerializer
-from join_backend.serializers import SubtaskSerializer, TaskSerializer
+from join_backend.serializers import SubtaskSerializer, TaskSerializer, serialize_task_list
+from join_backend.renderers import ORJSONRenderer
 import datetime
 from rest_framework.test import APIRequestFactory
 
@@ -271,4 +272,102 @@ def test_task_update(self):
     updated_subtask = updated_task.subtasks.get(id=self.subtask.id)
     self.assertEqual(updated_subtask.text, 'Updated subtask')
     self.assertTrue(updated_subtask.completed)
-    self.assertEqual(updated_task.status, 'inProgress')
\ No newline at end of file
+    self.assertEqual(updated_task.status, 'inProgress')
+
+
+
+class TaskListFastPathTest(TestCase):
+    """
+TaskListFastPathTest:
+
+Tests serialize_task_list, the read-only fast path used by the task list endpoint, ensuring its rendered output is
+byte-for-byte identical to TaskSerializer for tasks with and without categories, due dates, creators, assignees and subtasks,
+and that it runs in a constant number of queries.
+"""
+    def setUp(self):
+        self.user = User.objects.create_user(name='John Doe', email='john.doe@example.com', password='password123')
+        self.category = Category.objects.create(name='Work', color='#FF0000')
+        self.contacts = [
+            Contact.objects.create(user=self.user, name=f'Contact {i}', email=f'contact{i}@example.com', phone='123', color='#FFFFFF')
+            for i in range(3)
+        ]
+
+    def create_task(self, index, **kwargs):
+        kwargs.setdefault('priority', 'Low')
+        task = Task.objects.create(title=f'Task {index}', creator=self.user, **kwargs)
+        task.assigned_to.add(*self.contacts[:index % 4])
+        for i in range(index % 3):
+            task.subtasks.add(Subtask.objects.create(text=f'Subtask {index}.{i}', completed=i % 2 == 0))
+        return task
+
+    def assert_parity(self, queryset):
+        expected = ORJSONRenderer().render(TaskSerializer(queryset, many=True).data)
+        self.assertEqual(ORJSONRenderer().render(serialize_task_list(queryset)), expected)
+
+    def test_parity(self):
+        self.create_task(0)
+        self.create_task(1, category=self.category, due_date=datetime.date(2024, 7, 31), status='done')
+        self.create_task(2, description='Ünïcode description', priority='Urgent', status='inProgress')
+        self.create_task(3, category=self.category, status='awaitFeedback')
+        Task.objects.create(title='Orphan task', priority='Medium')
+        self.assert_parity(Task.objects.order_by('id'))
+
+    def test_parity_empty(self):
+        self.assertEqual(serialize_task_list(Task.objects.all()), [])
+        self.assert_parity(Task.objects.all())
+
+    def test_constant_queries(self):
+        for i in range(10):
+            self.create_task(i, category=self.category)
+        with self.assertNumQueries(3):
+            data = serialize_task_list(Task.objects.order_by('id'))
+        self.assertEqual(len(data), 10)
+
+
+
+
+class TaskAssigneeValidationTest(TestCase):
+    """
+TaskAssigneeValidationTest:
+
+Tests the batched assigned_to validation of the TaskSerializer, ensuring that any number of assignees is resolved
+with one query, that contacts of other users and unknown ids are rejected together, and that duplicates are dropped.
+"""
+    def setUp(self):
+        self.user = User.objects.create_user(name='John Doe', email='john.doe@example.com', password='password123')
+        self.other = User.objects.create_user(name='Other User', email='other@example.com', password='password123')
+        self.contacts = [
+            Contact.objects.create(user=self.user, name=f'Contact {i}', email=f'contact{i}@example.com', phone='123')
+            for i in range(5)
+        ]
+        self.foreign = Contact.objects.create(user=self.other, name='Foreign', email='foreign@example.com', phone='123')
+        request = APIRequestFactory().post('/tasks/')
+        request.user = self.user
+        self.context = {'request': request}
+
+    def validate(self, assigned_to):
+        return TaskSerializer(data={'title': 'Task', 'priority': 'Low', 'assigned_to': assigned_to}, context=self.context)
+
+    def test_one_query_for_all_assignees(self):
+        serializer = self.validate([contact.id for contact in self.contacts])
+        with self.assertNumQueries(1):
+            self.assertTrue(serializer.is_valid(), msg=serializer.errors)
+        self.assertEqual(serializer.validated_data['assigned_to'], self.contacts)
+
+    def test_missing_and_foreign_ids_are_reported_together(self):
+        serializer = self.validate([self.contacts[0].id, self.foreign.id, 999])
+        self.assertFalse(serializer.is_valid())
+        self.assertEqual(
+            serializer.errors['assigned_to'], [f'Invalid pk(s) "{self.foreign.id}", "999" - object(s) do not exist.']
+        )
+
+    def test_duplicates_are_dropped(self):
+        serializer = self.validate([self.contacts[1].id, str(self.contacts[1].id)])
+        self.assertTrue(serializer.is_valid(), msg=serializer.errors)
+        task = serializer.save()
+        self.assertEqual(list(task.assigned_to.all()), [self.contacts[1]])
+
+    def test_invalid_type(self):
+        serializer = self.validate(['abc'])
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('assigned_to', serializer.errors)
@@ -1,6 +1,6 @@
 from django.test import TestCase
 from django.urls import reverse, resolve
-from join_backend.views import set_csrf_token, LoginView, UserRegistrationView, UserDetailsView, ContactListCreateView, ContactDetailView, CategoryListCreateAPIView, CategoryDetailAPIView, SubtaskListCreateAPIView, SubtaskDetailAPIView, TaskListCreateAPIView, TaskDetailAPIView
+from join_backend.views import set_csrf_token, LoginView, UserRegistrationView, UserDetailsView, ContactListCreateView, ContactDetailView, CategoryListCreateAPIView, CategoryDetailAPIView, SubtaskListCreateAPIView, SubtaskDetailAPIView, TaskListCreateAPIView, TaskDetailAPIView, TaskBulkAPIView, TaskMoveAPIView, TaskArchiveAPIView, TaskCalendarAPIView, TaskBoardAPIView, BootstrapAPIView, ContactGroupsAPIView, BatchAPIView
 
 
 
@@ -34,6 +34,22 @@ Verifies that the subtask-detail URL resolves to the SubtaskDetailAPIView class,
 Verifies that the task-list URL resolves to the TaskListCreateAPIView class.
 12. test_task_detail_url
 Verifies that the task-detail URL resolves to the TaskDetailAPIView class, correctly passing a task ID as an argument.
+13. test_task_bulk_url
+Verifies that the task-bulk URL resolves to the TaskBulkAPIView class.
+14. test_task_move_url
+Verifies that the task-move URL resolves to the TaskMoveAPIView class, correctly passing a task ID as an argument.
+15. test_bootstrap_url
+Verifies that the bootstrap URL resolves to the BootstrapAPIView class.
+16. test_task_archive_url
+Verifies that the task-archive URL resolves to the TaskArchiveAPIView class.
+17. test_task_calendar_url
+Verifies that the task-calendar URL resolves to the TaskCalendarAPIView class.
+18. test_task_board_url
+Verifies that the task-board URL resolves to the TaskBoardAPIView class.
+19. test_contact_groups_url
+Verifies that the contact-groups URL resolves to the ContactGroupsAPIView class.
+20. test_batch_url
+Verifies that the batch URL resolves to the BatchAPIView class.
 """
     def test_set_csrf_url(self):
         url = reverse('set-csrf')
@@ -82,3 +98,35 @@ Verifies that the task-detail URL resolves to the TaskDetailAPIView class, corre
     def test_task_detail_url(self):
         url = reverse('task-detail', args=[1])
         self.assertEqual(resolve(url).func.view_class, TaskDetailAPIView)
+
+    def test_task_bulk_url(self):
+        url = reverse('task-bulk')
+        self.assertEqual(resolve(url).func.view_class, TaskBulkAPIView)
+
+    def test_task_move_url(self):
+        url = reverse('task-move', args=[1])
+        self.assertEqual(resolve(url).func.view_class, TaskMoveAPIView)
+
+    def test_bootstrap_url(self):
+        url = reverse('bootstrap')
+        self.assertEqual(resolve(url).func.view_class, BootstrapAPIView)
+
+    def test_task_archive_url(self):
+        url = reverse('task-archive')
+        self.assertEqual(resolve(url).func.view_class, TaskArchiveAPIView)
+
+    def test_task_calendar_url(self):
+        url = reverse('task-calendar')
+        self.assertEqual(resolve(url).func.view_class, TaskCalendarAPIView)
+
+    def test_task_board_url(self):
+        url = reverse('task-board')
+        self.assertEqual(resolve(url).func.view_class, TaskBoardAPIView)
+
+    def test_contact_groups_url(self):
+        url = reverse('contact-groups')
+        self.assertEqual(resolve(url).func.view_class, ContactGroupsAPIView)
+
+    def test_batch_url(self):
+        url = reverse('batch')
+        self.assertEqual(resolve(url).func.view_class, BatchAPIView)
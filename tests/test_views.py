@@ -11,6 +11,10 @@ from django.contrib.auth import get_user_model
 from join_backend.models import Contact
 from join_backend.models import Category
 from join_backend.models import Task, Subtask, Category, Contact, CustomUser
+from django.db import connection
+from django.db.models import F
+from django.test.utils import CaptureQueriesContext
+from join_backend.versioning import VersionConflict, save_versioned
 
 User = get_user_model()
 
@@ -175,6 +179,19 @@ It ensures that only the authenticated user's contacts are returned and that new
         self.assertEqual(len(response.data), 1)
         self.assertEqual(response.data[0]['user']['email'], 'testuser@example.com')
 
+    def test_contact_list_workload(self):
+        busy = Contact.objects.create(name='Busy', email='busy@example.com', phone='1', user=self.user)
+        idle = Contact.objects.create(name='Idle', email='idle@example.com', phone='2', user=self.user)
+        for title, priority, task_status in [('A', 'Urgent', 'todo'), ('B', 'Urgent', 'done'), ('C', 'Low', 'inProgress'), ('D', 'Medium', 'todo')]:
+            Task.objects.create(title=title, priority=priority, status=task_status, creator=self.user).assigned_to.add(busy)
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('add_contact'))
+        self.assertEqual(response.status_code, 200)
+        workloads = {contact['id']: contact['workload'] for contact in response.data}
+        self.assertEqual(workloads[busy.id], {'open': 3, 'urgent': 1, 'todo': 2, 'inProgress': 1, 'awaitFeedback': 0, 'done': 1})
+        self.assertEqual(workloads[idle.id], dict.fromkeys(Contact.WORKLOAD_KEYS, 0))
+        self.assertEqual(response.data[0]['user']['email'], 'testuser@example.com')
+
     def test_contact_create(self):
         url = reverse('add_contact')
         data = {
@@ -408,7 +425,7 @@ and that tasks are correctly updated or deleted.
             title='Task 1', 
             description='Description 1', 
             creator=self.user, 
-            priority='High'
+            priority='Urgent'
         )
         self.url = reverse('task-detail', kwargs={'pk': self.task.pk})
 
@@ -428,7 +445,579 @@ and that tasks are correctly updated or deleted.
         self.task.refresh_from_db()
         self.assertEqual(self.task.title, 'Updated Task')
 
+    def test_task_update_new_subtasks(self):
+        # Keys other than text and completed are ignored, so a subtask cannot be attached to another task.
+        other = Task.objects.create(title='Other', creator=self.user, priority='Low')
+        data = {'subtasks': [{'text': 'Step', 'completed': True, 'bogus': 1, 'task': other.pk}]}
+        response = self.client.put(self.url, data, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(list(self.task.subtasks.values_list('text', 'completed')), [('Step', True)])
+        self.assertFalse(other.subtasks.exists())
+
+    def test_task_update_invalid_new_subtask(self):
+        response = self.client.put(self.url, {'title': 'Changed', 'subtasks': [{'completed': True}]}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.title, 'Task 1')
+        self.assertFalse(self.task.subtasks.exists())
+
+    def test_task_update_unknown_subtask_changes_nothing(self):
+        data = {'title': 'Changed', 'subtasks': [{'text': 'New'}, {'id': 4242}]}
+        response = self.client.put(self.url, data, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.title, self.task.subtasks_total), ('Task 1', 0))
+        self.assertFalse(self.task.subtasks.exists())
+
+    def test_task_update_existing_subtask_values_are_validated(self):
+        subtask = Subtask.objects.create(task=self.task, text='Step', completed=True)
+        Task.objects.filter(pk=self.task.pk).update(subtasks_total=1, subtasks_done=1)
+        for completed in ('False', 'false'):
+            data = {'subtasks': [{'id': subtask.id, 'text': 'Step', 'completed': completed}]}
+            self.assertEqual(self.client.put(self.url, data, format='json').status_code, 200)
+            self.task.refresh_from_db()
+            self.assertEqual((self.task.subtasks_total, self.task.subtasks_done), (1, 0))
+        self.assertFalse(Subtask.objects.get(pk=subtask.pk).completed)
+        data = {'subtasks': [{'id': subtask.id, 'completed': 'maybe'}]}
+        self.assertEqual(self.client.put(self.url, data, format='json').status_code, 400)
+
     def test_task_delete(self):
         response = self.client.delete(self.url)
         self.assertEqual(response.status_code, 204)
-        self.assertFalse(Task.objects.filter(pk=self.task.pk).exists())
\ No newline at end of file
+        self.assertFalse(Task.objects.filter(pk=self.task.pk).exists())
+
+
+
+class TaskBulkAPIViewTest(APITestCase):
+    """
+TaskBulkAPIViewTest:
+
+Tests the TaskBulkAPIView, covering status, priority and category updates, adding and removing assignees and deleting tasks.
+It verifies that only the user's own tasks are affected, that invalid operations and values are rejected,
+and that the number of queries stays the same regardless of how many tasks are selected.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.other = CustomUser.objects.create_user(email='other@example.com', name='Other User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+        self.contact = Contact.objects.create(name='Contact', email='contact@example.com', phone='123', user=self.user)
+        self.category = Category.objects.create(name='Work', color='#FF0000')
+        self.tasks = [Task.objects.create(title=f'Task {i}', priority='Low', creator=self.user) for i in range(3)]
+        self.foreign_task = Task.objects.create(title='Foreign', priority='Low', creator=self.other)
+        self.url = reverse('task-bulk')
+
+    def post(self, op, tasks, **extra):
+        data = {'ids': [task.id for task in tasks], 'op': op, **extra}
+        return self.client.post(self.url, data, format='json')
+
+    def test_set_status(self):
+        response = self.post('set_status', self.tasks + [self.foreign_task], value='done')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual(Task.objects.filter(status='done').count(), 3)
+        self.foreign_task.refresh_from_db()
+        self.assertEqual(self.foreign_task.status, 'todo')
+
+    def test_set_priority_and_category(self):
+        self.assertEqual(self.post('set_priority', self.tasks[:2], value='Urgent').status_code, 200)
+        self.assertEqual(Task.objects.filter(priority='Urgent').count(), 2)
+        self.assertEqual(self.post('set_category', self.tasks, value=self.category.id).status_code, 200)
+        self.assertEqual(Task.objects.filter(category=self.category).count(), 3)
+
+    def test_add_and_remove_assignee(self):
+        self.tasks[0].assigned_to.add(self.contact)
+        response = self.post('add_assignee', self.tasks, value=self.contact.id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.contact.tasks.count(), 3)
+        response = self.post('remove_assignee', self.tasks[:2], value=self.contact.id)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(list(self.contact.tasks.all()), [self.tasks[2]])
+
+    def test_delete(self):
+        response = self.post('delete', self.tasks[:2] + [self.foreign_task])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(list(Task.objects.filter(creator=self.user)), [self.tasks[2]])
+        self.assertTrue(Task.objects.filter(pk=self.foreign_task.pk).exists())
+
+    def test_invalid_requests(self):
+        self.assertEqual(self.post('archive', self.tasks).status_code, 400)
+        self.assertEqual(self.post('set_status', self.tasks, value='unknown').status_code, 400)
+        self.assertEqual(self.post('set_status', self.tasks).status_code, 400)
+        self.assertEqual(self.post('delete', []).status_code, 400)
+        foreign_contact = Contact.objects.create(name='Foreign', email='f@example.com', phone='1', user=self.other)
+        response = self.post('add_assignee', self.tasks, value=foreign_contact.id)
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('value', response.data)
+
+    def test_constant_queries(self):
+        more_tasks = [Task.objects.create(title=f'More {i}', priority='Low', creator=self.user) for i in range(10)]
+        for op, extra in [('set_status', {'value': 'done'}), ('add_assignee', {'value': self.contact.id}),
+                          ('remove_assignee', {'value': self.contact.id}), ('delete', {})]:
+            with CaptureQueriesContext(connection) as few:
+                self.post(op, self.tasks[:1], **extra)
+            with CaptureQueriesContext(connection) as many:
+                self.post(op, more_tasks, **extra)
+            self.assertEqual(len(few), len(many), op)
+
+
+
+
+class TaskMoveAPIViewTest(APITestCase):
+    """
+TaskMoveAPIViewTest:
+
+Tests the TaskMoveAPIView, verifying that cards can be moved within and across columns between two neighbours
+or next to a single one, that each move writes a single row, that tasks changing column by update or bulk operation
+or created without a position go to the end of their column, and that invalid neighbours or other users' tasks are rejected.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+        self.todo = [Task.objects.create(title=f'Todo {i}', priority='Low', creator=self.user, position=key)
+                     for i, key in enumerate(['a', 'b', 'c'])]
+        self.done = [Task.objects.create(title=f'Done {i}', priority='Low', creator=self.user, status='done', position=key)
+                     for i, key in enumerate(['a', 'b'])]
+
+    def move(self, task, **data):
+        return self.client.post(reverse('task-move', kwargs={'pk': task.pk}), data, format='json')
+
+    def column(self, status):
+        return list(Task.objects.filter(creator=self.user, status=status).order_by('position', 'id').values_list('title', flat=True))
+
+    def test_move_within_column(self):
+        response = self.move(self.todo[2], after=self.todo[0].id, before=self.todo[1].id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.column('todo'), ['Todo 0', 'Todo 2', 'Todo 1'])
+        self.assertEqual(self.move(self.todo[1], before=self.todo[0].id).status_code, 200)
+        self.assertEqual(self.column('todo'), ['Todo 1', 'Todo 0', 'Todo 2'])
+
+    def test_move_across_columns(self):
+        response = self.move(self.todo[0], status='done', after=self.done[1].id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['status'], 'done')
+        self.assertEqual(self.column('done'), ['Done 0', 'Done 1', 'Todo 0'])
+        self.assertEqual(self.column('todo'), ['Todo 1', 'Todo 2'])
+
+    def test_move_next_to_one_neighbour(self):
+        self.assertEqual(self.move(self.todo[2], after=self.todo[0].id).status_code, 200)
+        self.assertEqual(self.column('todo'), ['Todo 0', 'Todo 2', 'Todo 1'])
+        self.assertEqual(self.move(self.todo[0], before=self.todo[1].id).status_code, 200)
+        self.assertEqual(self.column('todo'), ['Todo 2', 'Todo 0', 'Todo 1'])
+
+    def test_move_without_neighbours_goes_to_bottom(self):
+        self.assertEqual(self.move(self.todo[0]).status_code, 200)
+        self.assertEqual(self.column('todo'), ['Todo 1', 'Todo 2', 'Todo 0'])
+        self.assertEqual(self.move(self.done[1], status='todo').status_code, 200)
+        self.assertEqual(self.column('todo'), ['Todo 1', 'Todo 2', 'Todo 0', 'Done 1'])
+
+    def test_status_change_appends_to_column_end(self):
+        response = self.client.put(reverse('task-detail', kwargs={'pk': self.done[0].pk}), {'status': 'todo'}, format='json')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.column('todo'), ['Todo 0', 'Todo 1', 'Todo 2', 'Done 0'])
+        response = self.client.post(
+            reverse('task-bulk'), {'ids': [self.done[1].id, self.todo[0].id], 'op': 'set_status', 'value': 'todo'}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.column('todo'), ['Todo 0', 'Todo 1', 'Todo 2', 'Done 0', 'Done 1'])
+        positions = Task.objects.filter(status='todo').values_list('position', flat=True)
+        self.assertEqual(len(set(positions)), 5)
+
+    def test_task_without_position_goes_to_end(self):
+        task = Task.objects.create(title='Created', priority='Low', creator=self.user)
+        self.assertGreater(task.position, 'c')
+        self.assertEqual(self.move(self.todo[0], after=task.id).status_code, 200)
+        self.assertEqual(self.column('todo'), ['Todo 1', 'Todo 2', 'Created', 'Todo 0'])
+
+    def test_move_writes_one_row(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.move(self.todo[2], after=self.todo[0].id, before=self.todo[1].id)
+        writes = [query for query in queries if query['sql'].startswith(('UPDATE', 'INSERT', 'DELETE'))]
+        self.assertEqual(len(writes), 1)
+
+    def test_move_with_tied_neighbours_rebalances(self):
+        Task.objects.filter(pk__in=[self.todo[0].pk, self.todo[1].pk]).update(position='a')
+        response = self.move(self.todo[2], after=self.todo[0].id, before=self.todo[1].id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.column('todo'), ['Todo 0', 'Todo 2', 'Todo 1'])
+
+    def test_invalid_moves(self):
+        self.assertEqual(self.move(self.todo[0], after=self.done[0].id).status_code, 400)
+        self.assertEqual(self.move(self.todo[0], status='unknown').status_code, 400)
+        other = CustomUser.objects.create_user(email='other@example.com', name='Other', password='testpassword')
+        foreign = Task.objects.create(title='Foreign', priority='Low', creator=other)
+        self.assertEqual(self.move(foreign).status_code, 404)
+
+
+
+
+class BootstrapAPIViewTest(APITestCase):
+    """
+BootstrapAPIViewTest:
+
+Tests the BootstrapAPIView, verifying that the user, tasks, contacts and categories are returned together
+in a constant number of queries, matching the individual list endpoints, and that ETag revalidation answers with 304.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+        self.contact = Contact.objects.create(name='Contact', email='contact@example.com', phone='123', user=self.user)
+        self.category = Category.objects.create(name='Work', color='#FF0000')
+        for i in range(3):
+            Task.objects.create(title=f'Task {i}', priority='Low', creator=self.user, category=self.category).assigned_to.add(self.contact)
+        self.url = reverse('bootstrap')
+
+    def test_bootstrap(self):
+        with self.assertNumQueries(7):
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['user']['email'], 'testuser@example.com')
+        self.assertEqual(response.data['tasks'], self.client.get(reverse('task-list')).data)
+        self.assertEqual(response.data['contacts'], self.client.get(reverse('add_contact')).data)
+        self.assertEqual(len(response.data['categories']), 1)
+
+    def test_etag_revalidation(self):
+        response = self.client.get(self.url)
+        etag = response['ETag']
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        Task.objects.create(title='New Task', priority='Low', creator=self.user)
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+
+
+class TaskDueDateAPIViewTest(APITestCase):
+    """
+TaskDueDateAPIViewTest:
+
+Tests the due-date range filters of the task list and the TaskCalendarAPIView, verifying that ranges are half-open,
+that invalid parameters are rejected, and that the calendar buckets a month's tasks per day in a single query.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+        self.tasks = {
+            due_date: Task.objects.create(title=due_date, priority='Low', creator=self.user, due_date=due_date, position=str(i + 1))
+            for i, due_date in enumerate(['2024-04-30', '2024-05-01', '2024-05-01', '2024-05-31', '2024-06-01'])
+        }
+        Task.objects.create(title='No due date', priority='Low', creator=self.user, position='9')
+
+    def titles(self, **params):
+        response = self.client.get(reverse('task-list'), params)
+        self.assertEqual(response.status_code, 200)
+        return sorted(task['title'] for task in response.data)
+
+    def test_due_date_filters(self):
+        self.assertEqual(self.titles(due_before='2024-05-01'), ['2024-04-30'])
+        self.assertEqual(self.titles(due_after='2024-05-31'), ['2024-05-31', '2024-06-01'])
+        self.assertEqual(
+            self.titles(due_after='2024-05-01', due_before='2024-06-01'), ['2024-05-01', '2024-05-01', '2024-05-31']
+        )
+
+    def test_invalid_due_date_filters(self):
+        response = self.client.get(reverse('task-list'), {'due_before': 'tomorrow'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('due_before', response.data)
+        response = self.client.get(reverse('task-list'), {'due_after': '2024-06-01', 'due_before': '2024-05-01'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_calendar(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('task-calendar'), {'month': '2024-05'})
+        self.assertEqual(response.status_code, 200)
+        may_first = Task.objects.filter(due_date='2024-05-01').order_by('id').values_list('id', flat=True)
+        self.assertEqual(response.data, {
+            'month': '2024-05',
+            'days': [
+                {'date': '2024-05-01', 'count': 2, 'ids': list(may_first)},
+                {'date': '2024-05-31', 'count': 1, 'ids': [self.tasks['2024-05-31'].id]},
+            ],
+        })
+
+    def test_calendar_invalid_month(self):
+        response = self.client.get(reverse('task-calendar'), {'month': '2024-13'})
+        self.assertEqual(response.status_code, 400)
+
+
+
+
+class TaskListFilterAPIViewTest(APITestCase):
+    """
+TaskListFilterAPIViewTest:
+
+Tests the filters and sort orders of the TaskListCreateAPIView, verifying that status, priority, category and assignee
+filters can be repeated and combined, that priority sorts by its meaning rather than alphabetically,
+that the priority sort follows bulk and single-task priority changes, and that invalid parameters are rejected.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+        self.work = Category.objects.create(name='Work', color='#FF0000')
+        self.anna = Contact.objects.create(name='Anna', email='anna@example.com', phone='1', user=self.user)
+        self.ben = Contact.objects.create(name='Ben', email='ben@example.com', phone='2', user=self.user)
+        self.low = Task.objects.create(title='Low', priority='Low', creator=self.user, position='1', due_date='2024-05-03')
+        self.urgent = Task.objects.create(
+            title='Urgent', priority='Urgent', creator=self.user, position='2', category=self.work, status='inProgress'
+        )
+        self.medium = Task.objects.create(
+            title='Medium', priority='Medium', creator=self.user, position='3', category=self.work, due_date='2024-05-01'
+        )
+        self.low.assigned_to.set([self.anna])
+        self.urgent.assigned_to.set([self.anna, self.ben])
+
+    def titles(self, params):
+        response = self.client.get(reverse('task-list'), params)
+        self.assertEqual(response.status_code, 200)
+        return [task['title'] for task in response.data]
+
+    def test_filters(self):
+        # Only the matched tasks are checked here; their order is covered by test_sorting.
+        self.assertCountEqual(self.titles({'status': 'todo'}), ['Low', 'Medium'])
+        self.assertCountEqual(self.titles({'status': ['todo', 'inProgress']}), ['Low', 'Medium', 'Urgent'])
+        self.assertCountEqual(self.titles({'priority': ['Urgent', 'Low']}), ['Low', 'Urgent'])
+        self.assertCountEqual(self.titles({'category': self.work.id, 'status': 'todo'}), ['Medium'])
+        self.assertCountEqual(self.titles({'assigned_to': [self.anna.id, self.ben.id]}), ['Low', 'Urgent'])
+
+    def test_sorting(self):
+        self.assertEqual(self.titles({'sort': '-priority'}), ['Urgent', 'Medium', 'Low'])
+        self.assertEqual(self.titles({'sort': 'priority'}), ['Low', 'Medium', 'Urgent'])
+        self.assertEqual(self.titles({'sort': 'due_date'}), ['Medium', 'Low', 'Urgent'])
+        self.assertEqual(self.titles({'sort': '-due_date'}), ['Low', 'Medium', 'Urgent'])
+
+    def test_priority_sort_follows_changes(self):
+        self.client.post(reverse('task-bulk'), {'ids': [self.low.id], 'op': 'set_priority', 'value': 'Urgent'}, format='json')
+        self.client.put(reverse('task-detail', kwargs={'pk': self.urgent.pk}), {'priority': 'Low'}, format='json')
+        self.assertEqual(self.titles({'sort': '-priority'}), ['Low', 'Medium', 'Urgent'])
+
+    def test_invalid_parameters(self):
+        for params in ({'status': 'archived'}, {'priority': 'High'}, {'category': 'work'}, {'sort': 'title'}):
+            response = self.client.get(reverse('task-list'), params)
+            self.assertEqual(response.status_code, 400, params)
+
+
+
+
+class TaskBoardAPIViewTest(APITestCase):
+    """
+TaskBoardAPIViewTest:
+
+Tests the TaskBoardAPIView, verifying that every column returns its first cards in position order with its total,
+that the windowed query count does not grow with the number of tasks, and that column cursors page through
+the remaining cards until the column is exhausted.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+        for i in range(5):
+            Task.objects.create(title=f'Done {i}', priority='Low', creator=self.user, status='done', position=str(5 - i))
+        Task.objects.create(title='Todo', priority='Low', creator=self.user, position='1')
+        self.url = reverse('task-board')
+
+    def test_board(self):
+        with self.assertNumQueries(4):
+            response = self.client.get(self.url, {'per_column': 2})
+        self.assertEqual(response.status_code, 200)
+        columns = response.data['columns']
+        self.assertEqual(list(columns), ['todo', 'inProgress', 'awaitFeedback', 'done'])
+        self.assertEqual(columns['todo']['total'], 1)
+        self.assertEqual([task['title'] for task in columns['todo']['tasks']], ['Todo'])
+        self.assertIsNone(columns['todo']['cursor'])
+        self.assertEqual(columns['inProgress'], {'total': 0, 'tasks': [], 'cursor': None})
+        self.assertEqual(columns['done']['total'], 5)
+        self.assertEqual([task['title'] for task in columns['done']['tasks']], ['Done 4', 'Done 3'])
+        self.assertIsNotNone(columns['done']['cursor'])
+
+    def test_cursor_pages_through_column(self):
+        cursor = self.client.get(self.url, {'per_column': 2}).data['columns']['done']['cursor']
+        titles = []
+        while cursor:
+            response = self.client.get(self.url, {'per_column': 2, 'status': 'done', 'cursor': cursor})
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(list(response.data['columns']), ['done'])
+            column = response.data['columns']['done']
+            self.assertEqual(column['total'], 5)
+            titles += [task['title'] for task in column['tasks']]
+            cursor = column['cursor']
+        self.assertEqual(titles, ['Done 2', 'Done 1', 'Done 0'])
+
+    def test_invalid_parameters(self):
+        for params in ({'per_column': 0}, {'cursor': 'abc'}, {'status': 'done', 'cursor': '!!'}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 400, params)
+
+
+
+
+class ContactIndexAPIViewTest(APITestCase):
+    """
+ContactIndexAPIViewTest:
+
+Tests the alphabetical contact index, verifying that contacts are listed case- and accent-insensitively,
+that `?group=` returns a single letter group, and that ContactGroupsAPIView counts the contacts of each letter.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+        for name in ['bob', 'Émile', 'Anna', 'eve', '3M Support']:
+            Contact.objects.create(name=name, email='contact@example.com', phone='1', user=self.user)
+        other = CustomUser.objects.create_user(email='other@example.com', name='Other', password='testpassword')
+        Contact.objects.create(name='Alice', email='alice@example.com', phone='1', user=other)
+
+    def names(self, params=None):
+        response = self.client.get(reverse('add_contact'), params or {})
+        self.assertEqual(response.status_code, 200)
+        return [contact['name'] for contact in response.data]
+
+    def test_alphabetical_list(self):
+        self.assertEqual(self.names(), ['3M Support', 'Anna', 'bob', 'Émile', 'eve'])
+
+    def test_group_filter(self):
+        self.assertEqual(self.names({'group': 'e'}), ['Émile', 'eve'])
+        self.assertEqual(self.names({'group': '#'}), ['3M Support'])
+        response = self.client.get(reverse('add_contact'), {'group': 'ab'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_group_counts(self):
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('contact-groups'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data, [
+            {'group': '#', 'count': 1}, {'group': 'A', 'count': 1}, {'group': 'B', 'count': 1}, {'group': 'E', 'count': 2},
+        ])
+
+
+
+
+class TaskDiffUpdateAPIViewTest(APITestCase):
+    """
+TaskDiffUpdateAPIViewTest:
+
+Tests the diff-based updates of the TaskDetailAPIView, verifying that a PUT without changes issues no writes,
+that partial PUTs leave omitted assignees and subtasks alone, and that only changed columns and assignee links are written.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+        self.anna = Contact.objects.create(name='Anna', email='anna@example.com', phone='1', user=self.user)
+        self.ben = Contact.objects.create(name='Ben', email='ben@example.com', phone='2', user=self.user)
+        self.task = Task.objects.create(title='Task', priority='Low', creator=self.user, subtasks_total=1)
+        self.task.assigned_to.set([self.anna])
+        self.subtask = Subtask.objects.create(task=self.task, text='Step')
+        self.url = reverse('task-detail', kwargs={'pk': self.task.pk})
+
+    def put(self, data):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(self.url, data, format='json')
+        self.assertEqual(response.status_code, 200)
+        statements = [query['sql'].split()[0] for query in queries]
+        self.reads = statements.count('SELECT')
+        writes = [statement for statement in statements if statement not in ('SELECT', 'SAVEPOINT', 'RELEASE')]
+        return response, writes
+
+    def test_noop_put_only_reads_the_task(self):
+        response, writes = self.put({'title': 'Task', 'priority': 'Low', 'subtasks': [{'id': self.subtask.id, 'text': 'Step'}]})
+        self.assertEqual(self.reads, 3)
+        self.assertEqual(writes, [])
+        self.assertEqual(response.data['assigned_to'], [self.anna.id])
+        self.assertEqual([subtask['text'] for subtask in response.data['subtasks']], ['Step'])
+
+    def test_partial_put_keeps_assignees_and_subtasks(self):
+        response, writes = self.put({'title': 'Renamed'})
+        self.assertEqual(writes, ['UPDATE'])
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.title, 'Renamed')
+        self.assertEqual(list(self.task.assigned_to.values_list('id', flat=True)), [self.anna.id])
+        self.assertEqual(list(self.task.subtasks.values_list('text', flat=True)), ['Step'])
+        self.assertEqual(response.data['assigned_to'], [self.anna.id])
+
+    def test_only_changed_columns_are_written(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.put(self.url, {'title': 'Task', 'priority': 'Urgent'}, format='json')
+        updates = [query['sql'] for query in queries if query['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"priority"', updates[0])
+        self.assertNotIn('"title"', updates[0])
+
+    def test_assignee_changes_are_set_differences(self):
+        # The UPDATE is the version bump guarding the link changes.
+        response, writes = self.put({'assigned_to': [self.anna.id, self.ben.id]})
+        self.assertEqual(writes, ['UPDATE', 'INSERT'])
+        self.assertEqual(sorted(response.data['assigned_to']), [self.anna.id, self.ben.id])
+        response, writes = self.put({'assigned_to': [self.ben.id]})
+        self.assertEqual(writes, ['UPDATE', 'DELETE'])
+        self.assertEqual(response.data['assigned_to'], [self.ben.id])
+
+
+
+
+class OptimisticConcurrencyAPIViewTest(APITestCase):
+    """
+OptimisticConcurrencyAPIViewTest:
+
+Tests the versioned updates of tasks and contacts, verifying that every change increments the version exposed as ETag,
+that updates of an older version are rejected with 412 (If-Match) or 409 (body version) and the current state,
+and that a write racing a concurrent change is detected by its conditional UPDATE.
+"""
+    def setUp(self):
+        self.client = APIClient()
+        self.user = CustomUser.objects.create_user(email='testuser@example.com', name='Test User', password='testpassword')
+        self.client.force_authenticate(user=self.user)
+        self.task = Task.objects.create(title='Task', priority='Low', creator=self.user)
+        self.contact = Contact.objects.create(name='Anna', email='anna@example.com', phone='1', user=self.user)
+        self.task_url = reverse('task-detail', kwargs={'pk': self.task.pk})
+        self.contact_url = reverse('contact_detail', kwargs={'id': self.contact.pk})
+
+    def test_changes_increment_the_version(self):
+        response = self.client.get(self.task_url)
+        self.assertEqual((response.data['version'], response['ETag']), (1, '"1"'))
+        response = self.client.put(self.task_url, {'title': 'Renamed'}, format='json', HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['version'], response['ETag']), (2, '"2"'))
+        response = self.client.put(self.task_url, {'title': 'Renamed'}, format='json', HTTP_IF_MATCH='"2"')
+        self.assertEqual(response.data['version'], 2)
+
+    def test_stale_if_match_is_rejected_with_current_task(self):
+        self.client.put(self.task_url, {'title': 'First'}, format='json', HTTP_IF_MATCH='"1"')
+        response = self.client.put(self.task_url, {'title': 'Second'}, format='json', HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(response['ETag'], '"2"')
+        self.assertEqual(response.data['current']['title'], 'First')
+        self.task.refresh_from_db()
+        self.assertEqual(self.task.title, 'First')
+
+    def test_stale_body_version_is_a_conflict(self):
+        Task.objects.filter(pk=self.task.pk).update_status('done')
+        response = self.client.put(self.task_url, {'title': 'Second', 'version': 1}, format='json')
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data['current']['status'], 'done')
+        self.assertEqual(response.data['current']['version'], 2)
+
+    def test_concurrent_change_fails_the_conditional_update(self):
+        stale = Task.objects.get(pk=self.task.pk)
+        Task.objects.filter(pk=self.task.pk).update(title='Theirs', version=F('version') + 1)
+        stale.title = 'Mine'
+        with self.assertRaises(VersionConflict):
+            save_versioned(stale, title='Mine')
+        self.task.refresh_from_db()
+        self.assertEqual((self.task.title, self.task.version), ('Theirs', 2))
+
+    def test_stale_contact_update_is_rejected(self):
+        data = {'name': 'Anna Smith', 'email': 'anna@example.com', 'phone': '1'}
+        response = self.client.put(self.contact_url, data, format='json', HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['version'], response.data['group']), (2, 'A'))
+        response = self.client.put(self.contact_url, {**data, 'name': 'Ben'}, format='json', HTTP_IF_MATCH='"1"')
+        self.assertEqual(response.status_code, status.HTTP_412_PRECONDITION_FAILED)
+        self.assertEqual(response.data['current']['name'], 'Anna Smith')